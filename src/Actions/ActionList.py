@@ -16,6 +16,7 @@ from PyQt5 import QtCore
 # Local Imports:
 from Resources.Strings import MyStrings
 from Actions.Functions import rebuildCloud
+from Discretization.DiscretizeModel import clearCurveCache, clearProbeCache
 
 def switchLeftPanels(widget, name, prettyName, parent, scroll):
     """
@@ -892,6 +893,8 @@ class closeAction(QAction):
             parent.activeCADFile = None
             parent.activeCloudFile = None
             parent.entitiesObject = []
+            clearCurveCache()
+            clearProbeCache()
             parent.pointCloudObject = None
             parent.pointAspectObject = None
             parent.entitiesList = []
@@ -899,14 +902,11 @@ class closeAction(QAction):
             parent.shapeList = []
             parent.selectedShape = None
             parent.selectedSequenceNumber = None
-            parent.faceSequenceNumbers = []
-            parent.faceNormalVectors = []
-            parent.cloudPointsList = []
+            parent.cloudPoints.clear()
             parent.shapeParameter1 = None
             parent.shapeParameter2 = None
             parent.shapeParameter3 = None
             parent.logbookList = []
-            parent.UVproperty = []
 
             # Applying an isometric visualization mode:
             parent.canvas._display.View_Iso()
@@ -1445,18 +1445,11 @@ class deletePointAction(QAction):
         # Checking the current level of the selected item and applying the delete process:
         if(self.currentLevel == 0):
             if(self.currentOuterIndex == 5):
-                parent.faceSequenceNumbers = []
-                parent.faceNormalVectors = []
-                parent.cloudPointsList = []
-                parent.UVproperty = []
+                parent.cloudPoints.clear()
             elif(self.currentOuterIndex >= 7):
-                del parent.faceSequenceNumbers[self.currentOuterIndex-7]
-                del parent.faceNormalVectors[self.currentOuterIndex-7]
-                del parent.cloudPointsList[self.currentOuterIndex-7]
-                del parent.UVproperty[self.currentOuterIndex-7]
+                parent.cloudPoints.removeFace(self.currentOuterIndex-7)
         elif(self.currentLevel == 1):
-            del parent.faceNormalVectors[self.currentOuterIndex-7][self.currentInnerIndex]
-            del parent.cloudPointsList[self.currentOuterIndex-7][self.currentInnerIndex]
+            parent.cloudPoints.removePoint(self.currentOuterIndex-7, self.currentInnerIndex)
 
         # Rebuilding the cloud and updating the Point List Side Widget:
         rebuildCloud(parent)
@@ -1518,20 +1511,20 @@ class saveProjectAction(QAction):
         data += 'activeCloudFile\n'
         data += str(parent.activeCloudFile) + '\n'
         data += 'faceSequenceNumbers\n'
-        for element in parent.faceSequenceNumbers:
+        for element in parent.cloudPoints.sequenceNumbers:
             data += str(element) + ','
         data += '\n'
         data += 'faceNormalVectors\n'
-        for element in parent.faceNormalVectors:
-            for subelement in element:
+        for i in range(len(parent.cloudPoints)):
+            for subelement in parent.cloudPoints.faceNormals(i).tolist():
                 data += str(subelement[0]) + ' '
                 data += str(subelement[1]) + ' '
                 data += str(subelement[2]) + ','
             data += ';'
         data += '\n'
         data += 'cloudPointsList\n'
-        for element in parent.cloudPointsList:
-            for subelement in element:
+        for i in range(len(parent.cloudPoints)):
+            for subelement in parent.cloudPoints.facePoints(i).tolist():
                 data += str(subelement[0]) + ' '
                 data += str(subelement[1]) + ' '
                 data += str(subelement[2]) + ','
@@ -1585,9 +1578,9 @@ class loadProjectAction(QAction):
 
         # Restoring the parameters:
         parent.activeCloudFile = ''
-        parent.faceSequenceNumbers = []
-        parent.faceNormalVectors = []
-        parent.cloudPointsList = []
+        faceSequenceNumbers = []
+        faceNormalVectors = []
+        cloudPointsList = []
 
         line = file.readline()
         while line:
@@ -1598,22 +1591,27 @@ class loadProjectAction(QAction):
                 line = file.readline()[0:-1]
                 line = line.split(',')[0:-1]
                 line = [int(element) for element in line]
-                parent.faceSequenceNumbers = line
+                faceSequenceNumbers = line
             elif line[0:17] == 'faceNormalVectors':
                 line = file.readline()[0:-1]
                 line = line.split(';')[0:-1]
                 line = [element.split(',')[0:-1] for element in line]
                 line = [[subelement.split(' ') for subelement in element] for element in line]
                 line = [[tuple([float(value) for value in subelement]) for subelement in element] for element in line]
-                parent.faceNormalVectors = line
+                faceNormalVectors = line
             elif line[0:15] == 'cloudPointsList':
                 line = file.readline()[0:-1]
                 line = line.split(';')[0:-1]
                 line = [element.split(',')[0:-1] for element in line]
                 line = [[subelement.split(' ') for subelement in element] for element in line]
                 line = [[tuple([float(value) for value in subelement]) for subelement in element] for element in line]
-                parent.cloudPointsList = line
+                cloudPointsList = line
             line = file.readline()
 
+        # Rebuilding the point cloud of each face:
+        parent.cloudPoints.clear()
+        for sequence, normals, points in zip(faceSequenceNumbers, faceNormalVectors, cloudPointsList):
+            parent.cloudPoints.addFace(sequence, points, normals)
+
         # Updating the visualization:
         rebuildCloud(parent)
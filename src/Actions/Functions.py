@@ -12,6 +12,11 @@ from OCC.AIS import AIS_PointCloud
 from OCC.Quantity import Quantity_Color, Quantity_NOC_WHITE, Quantity_NOC_BLACK
 from OCC.Aspect import Aspect_TOM_POINT
 from OCC.Prs3d import Prs3d_PointAspect
+from OCC.Bnd import Bnd_Box
+from OCC.BRepBndLib import brepbndlib_Add
+
+# Other Imports:
+from numpy import array
 
 
 def cleanCloud(parent):
@@ -35,11 +40,10 @@ def buildCloud(parent):
     """
 
     # Crates an array of points for displaying in the point Cloud:
-    numberOfPoints = sum(len(points) for points in parent.cloudPointsList)
+    numberOfPoints = parent.cloudPoints.numPoints
     pointsArray = Graphic3d_ArrayOfPoints(numberOfPoints)
-    for points in parent.cloudPointsList:
-        for point in points:
-            pointsArray.AddVertex(point[0], point[1], point[2])
+    for x, y, z in parent.cloudPoints.points.tolist():
+        pointsArray.AddVertex(x, y, z)
 
     # Adds the array of points in a new unselectable point cloud object:
     pointCloud = AIS_PointCloud()
@@ -57,12 +61,9 @@ def buildCloud(parent):
 
     # Updates the main window information about the pointsList:
     pointsList = [];
-    for i in range(len(parent.cloudPointsList)):
-        pointsList.append(('Boundary Face #' + str(parent.faceSequenceNumbers[i]//2+1) + ' Points',[]))
-        for j in range(len(parent.cloudPointsList[i])):
-            xValue = parent.cloudPointsList[i][j][0]
-            yValue = parent.cloudPointsList[i][j][1]
-            zValue = parent.cloudPointsList[i][j][2]
+    for i in range(len(parent.cloudPoints)):
+        pointsList.append(('Boundary Face #' + str(parent.cloudPoints.sequenceNumbers[i]//2+1) + ' Points',[]))
+        for j, (xValue, yValue, zValue) in enumerate(parent.cloudPoints.facePoints(i).tolist()):
             pointsList[i][1].append(('Point ' + str(j) + ' (' +
                                      str(xValue) + ' ' + str(yValue) + ' ' + str(zValue) + ')', []))
     parent.pointsList = pointsList
@@ -83,3 +84,21 @@ def rebuildCloud(parent):
 def restoreCloud(parent):
     rebuildCloud(parent)
     parent.canvas._display.Repaint()
+
+def shapesBoundingBox(parent, cloud, indexes):
+    """
+    # Function: shapesBoundingBox.
+    # Description: This function provides the OpenCASCADE bounding box of the shapes of some faces
+    of a point cloud, as used by the Defects menus. It can be given to the Pipeline module as its
+    boundingBox function.
+    # Parameters: * QMainWindow parent = A reference for the main window object.
+                  * PointCloud cloud = The point cloud.
+                  * List indexes = The indexes of the faces in the point cloud.
+    # Returns: * Array minimum = The (xMin, yMin, zMin) corner of the box.
+               * Array maximum = The (xMax, yMax, zMax) corner of the box.
+    """
+    boundaryBox = Bnd_Box()
+    for i in indexes:
+        brepbndlib_Add(parent.shapeList[cloud.sequenceNumbers[i]//2], boundaryBox)
+    xMin, yMin, zMin, xMax, yMax, zMax = boundaryBox.Get()
+    return array((xMin, yMin, zMin)), array((xMax, yMax, zMax))
@@ -0,0 +1,248 @@
+"""
+# Module: Deviations.py
+# Description: This module contains the functions that apply manufacturing deviations to
+the discretized points of a face. Each function works over a whole (N, 3) array of points
+at once and returns a new array, leaving the given points untouched. The Defects side
+widgets only collect the parameters and call these functions.
+# Author: Willian Hideak Arita da Silva.
+"""
+
+import math
+import numpy
+
+def axisIndex(axis):
+    """
+    # Function: axisIndex.
+    # Description: Converts the name of an axis to the index of its coordinate.
+    # Parameters: * String axis = The name of the axis: 'x', 'y' or 'z'.
+    # Returns: * Int = 0, 1 or 2.
+    """
+    return 'xyz'.index(axis)
+
+def offsetPoints(points, normals, offsets):
+    """
+    # Function: offsetPoints.
+    # Description: Moves each point along its normal vector by its own offset.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Array normals = A (N, 3) array of the normal vector of each point.
+                  * Array offsets = An array with the N offsets.
+    # Returns: * Array = A (N, 3) array of the moved points.
+    """
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+    normals = numpy.asarray(normals, dtype=float).reshape(-1, 3)
+    return points + normals*numpy.asarray(offsets, dtype=float)[:, None]
+
+def translatePoints(points, direction, offset):
+    """
+    # Function: translatePoints.
+    # Description: Moves all the points by the same offset along a direction.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Array direction = A (N, 3) array of directions, one for each point (e.g. the
+                  normal vectors of the face), or a single (x, y, z) direction for all of them.
+                  * Float offset = The displacement applied along the direction.
+    # Returns: * Array = A (N, 3) array of the translated points.
+    """
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+    return points + numpy.asarray(direction, dtype=float) * offset
+
+def rotatePoints(points, center, xAngle, yAngle, zAngle):
+    """
+    # Function: rotatePoints.
+    # Description: Rotates all the points around a center point. The rotation around the X
+    axis is applied first, then the rotation around Y and finally the rotation around Z.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Tuple center = The (x, y, z) center of the rotation.
+                  * Float xAngle = The rotation angle around the X axis, in degrees.
+                  * Float yAngle = The rotation angle around the Y axis, in degrees.
+                  * Float zAngle = The rotation angle around the Z axis, in degrees.
+    # Returns: * Array = A (N, 3) array of the rotated points.
+    """
+    angleX = (xAngle/180) * math.pi
+    angleY = (yAngle/180) * math.pi
+    angleZ = (zAngle/180) * math.pi
+
+    # Defining the rotation matrix along the three axis:
+    matrixX = numpy.array([[1, 0, 0],
+                           [0, math.cos(angleX), -math.sin(angleX)],
+                           [0, math.sin(angleX), math.cos(angleX)]])
+    matrixY = numpy.array([[math.cos(angleY), 0, math.sin(angleY)],
+                           [0, 1, 0],
+                           [-math.sin(angleY), 0, math.cos(angleY)]])
+    matrixZ = numpy.array([[math.cos(angleZ), -math.sin(angleZ), 0],
+                           [math.sin(angleZ), math.cos(angleZ), 0],
+                           [0, 0, 1]])
+    matrix = numpy.dot(matrixZ, numpy.dot(matrixY, matrixX))
+
+    # Rotating the points translated near to the default basis vector and translating them back:
+    center = numpy.asarray(center, dtype=float)
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+    return numpy.dot(points - center, matrix.T) + center
+
+def randomPoints(points, minOffset, maxOffset, generator=None):
+    """
+    # Function: randomPoints.
+    # Description: Moves each point in a random and not biased 3D direction. Each coordinate of
+    the displacement uses its own random offset between minOffset and maxOffset.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Float minOffset = The minimum value for the offset.
+                  * Float maxOffset = The maximum value for the offset.
+                  * Generator generator = The numpy random generator used. Defaults to a new one.
+    # Returns: * Array = A (N, 3) array of the moved points.
+    """
+    if generator is None:
+        generator = numpy.random.default_rng()
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+    directions = generator.normal(0, 1, points.shape)
+    directions /= numpy.linalg.norm(directions, axis=1)[:, None]
+    offsets = minOffset + (maxOffset-minOffset)*generator.random(points.shape)
+    return points + directions*offsets
+
+def flexionPoints(points, longAxis, perpAxis, start, length, maxDeflection):
+    """
+    # Function: flexionPoints.
+    # Description: Bends the points as a simply supported beam under a homogeneous load. The
+    deflection of each point depends on its position along the longitudinal axis and is
+    applied along the perpendicular axis.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * String longAxis = The longitudinal axis of the beam: 'x', 'y' or 'z'.
+                  * String perpAxis = The axis of the deflection: 'x', 'y' or 'z'.
+                  * Float start = The minimum coordinate of the beam along the longitudinal axis.
+                  * Float length = The length of the beam along the longitudinal axis.
+                  * Float maxDeflection = The deflection at the middle of the beam.
+    # Returns: * Array = A (N, 3) array of the bent points.
+    """
+    points = numpy.array(points, dtype=float).reshape(-1, 3)
+    position = points[:, axisIndex(longAxis)] - start
+
+    # Associating the maximum deformation to the homogeneous load applied:
+    q = -(384*maxDeflection)/(5*length**4)
+
+    # Applying the deflection formula to the points:
+    v = -(q/24)*position**4 + (q/12)*length*position**3 - 0.0417*(length**3)*q*position
+    points[:, axisIndex(perpAxis)] += v
+    return points
+
+def torsionPoints(points, center, longAxis, maxAngle, halfLength):
+    """
+    # Function: torsionPoints.
+    # Description: Twists the points around the longitudinal axis that passes through a center
+    point. The rotation angle of each point grows linearly with its distance to the center
+    along the axis.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Tuple center = The (x, y, z) center of the twisted part.
+                  * String longAxis = The longitudinal axis: 'x', 'y' or 'z'.
+                  * Float maxAngle = The rotation angle, in radians, at halfLength from the center.
+                  * Float halfLength = Half of the length of the part along the axis.
+    # Returns: * Array = A (N, 3) array of the twisted points.
+    """
+    center = numpy.asarray(center, dtype=float)
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3) - center
+    axis = axisIndex(longAxis)
+
+    # Rotating the two other coordinates of each point by its own angle:
+    a, b = (axis + 1) % 3, (axis + 2) % 3
+    angles = maxAngle*points[:, axis]/halfLength
+    cos, sin = numpy.cos(angles), numpy.sin(angles)
+    first = cos*points[:, a] - sin*points[:, b]
+    second = sin*points[:, a] + cos*points[:, b]
+    points[:, a] = first
+    points[:, b] = second
+    return points + center
+
+def periodicPoints(points, normals, amplitude, frequency, rowLength=1):
+    """
+    # Function: periodicPoints.
+    # Description: Moves the points along their normal vectors by a senoidal offset. The offset
+    changes from one row of points to the next, so the pattern follows the direction of the
+    rows of a parametric discretization when rowLength is the number of points in each row.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Array normals = A (N, 3) array of the normal vector of each point.
+                  * Float amplitude = The maximum offset.
+                  * Float frequency = The number of rows in a period of the pattern.
+                  * Int rowLength = The number of consecutive points that share the same offset.
+    # Returns: * Array = A (N, 3) array of the moved points.
+    """
+    if(frequency == 0):
+        raise ZeroDivisionError('the frequency of the pattern must not be zero')
+    rows = numpy.arange(len(points)) // rowLength
+    offsets = amplitude * numpy.sin((rows/frequency)*2*math.pi)
+    return offsetPoints(points, normals, offsets)
+
+def ovalPoints(points, normals, maxDeviation, rowLength):
+    """
+    # Function: ovalPoints.
+    # Description: Flattens a rounded face discretized over its parametric surface, moving the
+    points along their normal vectors by a sine wave with two periods around the face.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Array normals = A (N, 3) array of the normal vector of each point.
+                  * Float maxDeviation = The maximum offset.
+                  * Int rowLength = The number of points in each row along the main axis.
+    # Returns: * Array = A (N, 3) array of the moved points.
+    """
+    frequency = int((len(points)/rowLength)/2)
+    return periodicPoints(points, normals, maxDeviation, frequency, rowLength)
+
+# Ranges of the training data of the spindle defects neural network: tool condition, depth of
+# cut, feed rate, spindle speed, L/D ratio, Li/L ratio and diameter deviation (the output).
+spindleRanges = [(0.0, 1.0), (0.5, 2.0), (0.1, 0.2), (800.0, 1400.0), (2.567, 4.089), (0.07, 0.9), (-0.188, 0.065)]
+
+def intervalMapping(image, fromMin, fromMax, toMin, toMax):
+    """
+    # Function: intervalMapping.
+    # Description: Maps a number or an array of numbers from a range to another.
+    # Parameters: * Array image = The input number or array.
+                  * Float fromMin, fromMax = The limits of the range of the input.
+                  * Float toMin, toMax = The limits of the desired range.
+    # Returns: * Array = The mapped values.
+    """
+    fromRange = fromMax - fromMin
+    toRange = toMax - toMin
+    scaled = numpy.array((image - fromMin) / float(fromRange), dtype=float)
+    return toMin + (scaled * toRange)
+
+def spindlePoints(points, normals, network, toolCondition, depth, feed, spindle, diameter, length,
+                  plane, chunkSize=65536):
+    """
+    # Function: spindlePoints.
+    # Description: Applies the diameter deviations of a turning operation, predicted by a trained
+    neural network, to the points of a turned face. The network inputs of all the points are
+    built as one (N, 6) matrix, normalized with spindleRanges, and evaluated in chunks of at
+    most chunkSize rows. The rows keep the order of the points, so a recurrent network sees the
+    same sequence of inputs as when it is evaluated point by point. Each point is moved along
+    its normal vector by the predicted deviation.
+    # Parameters: * Array points = A (N, 3) array of points.
+                  * Array normals = A (N, 3) array of the normal vector of each point.
+                  * Network network = The trained network, with a sim method mapping a (n, 6)
+                  array of normalized inputs to a (n, 1) array of normalized outputs.
+                  * Int toolCondition = The index of the tool condition (0 or 1).
+                  * Float depth = The depth of cut.
+                  * Float feed = The feed rate.
+                  * Float spindle = The spindle speed.
+                  * Float diameter = The diameter of the turned face.
+                  * Float length = The length of the turned face.
+                  * Tuple plane = The (A, B, C, D) coefficients of the plane Ax+By+Cz=D of the
+                  fixture face, from which the distance Li of each point is measured.
+                  * Int chunkSize = The maximum number of points evaluated at once by the network.
+    # Returns: * Array = A (N, 3) array of the moved points.
+    """
+    points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+
+    # Calculating the distance between each point and the plane at the fixture face:
+    A, B, C, D = plane
+    distances = numpy.abs(numpy.dot(points, (A, B, C)) - D)/((A**2 + B**2 + C**2)**.5)
+
+    # Creating the normalized inputs of the network, one row for each point:
+    inputs = numpy.empty((len(points), 6))
+    inputs[:, 0] = toolCondition
+    inputs[:, 1] = intervalMapping(depth, spindleRanges[1][0], spindleRanges[1][1], 0, 1)
+    inputs[:, 2] = intervalMapping(feed, spindleRanges[2][0], spindleRanges[2][1], 0, 1)
+    inputs[:, 3] = intervalMapping(spindle, spindleRanges[3][0], spindleRanges[3][1], 0, 1)
+    inputs[:, 4] = intervalMapping(length/diameter, spindleRanges[4][0], spindleRanges[4][1], 0, 1)
+    inputs[:, 5] = intervalMapping(distances/length, spindleRanges[5][0], spindleRanges[5][1], 0, 1)
+
+    # Obtaining the normalized outputs of the network and desnormalizing them:
+    outputs = numpy.empty(len(points))
+    for start in range(0, len(points), chunkSize):
+        outputs[start:start + chunkSize] = network.sim(inputs[start:start + chunkSize])[:, 0]
+    offsets = intervalMapping(outputs, 0, 1, spindleRanges[6][0], spindleRanges[6][1])
+    return offsetPoints(points, normals, offsets)
@@ -13,6 +13,7 @@
 
 import sys
 import itertools
+import numpy
 import Discretization.Utilities as utils
 
 
@@ -40,6 +41,8 @@ class Curve(object):
 
     * :func:`.evaluate()`
     * :func:`.evaluate_rational()`
+    * :func:`.evaluate_rational_at()`
+    * :func:`.evaluate_adaptive()`
     * :func:`.derivatives()`
     * :func:`.tangent()`
 
@@ -328,7 +331,7 @@ class Curve(object):
         self._reset_curve()
 
         # Algorithm A3.1
-        for u in utils.frange(0, 1, self._mDelta):
+        for u in utils.sample_params(self._mDelta).tolist():
             span = utils.find_span(self._mDegree, tuple(self._mKnotVector), len(self._mCtrlPts), u)
             basis = utils.basis_functions(self._mDegree, tuple(self._mKnotVector), span, u)
             curvept = [0.0, 0.0, 0.0]
@@ -342,27 +345,115 @@ class Curve(object):
     def evaluate_rational(self):
         """ Evaluates the NURBS curve.
 
+        All the samples are evaluated at once, with the spans and basis functions taken from the shared
+        :py:data:`.utilities.basis_cache`.
+
         .. note:: The evaluated surface points are stored in :py:attr:`~curvepts`.
 
-        :return: None
+        :return: (x, y, z) coordinates of the curve points, one row for each sample
+        :rtype: numpy.ndarray
         """
         # Check all parameters are set before the curve evaluation
         self._check_variables()
         # Clean up the curve points, if necessary
         self._reset_curve()
+        params = utils.sample_params(self._mDelta)
+        spans, ders = utils.basis_cache.lookup(self._mDegree, tuple(self._mKnotVector), len(self._mCtrlPts), params, 0)
+        curvepts = self._evaluate_rational_basis(spans, ders[0])
+        self._mCurvePts = curvepts.tolist()
+        return curvepts
+
+    # Evaluates the NURBS curve at the given parameters
+    def evaluate_rational_at(self, params=()):
+        """ Evaluates the NURBS curve at the given parameters.
+
+        All parameters are evaluated at once using the vectorized versions of Algorithms A2.1 and A2.2.
+
+        :param params: parameters between 0 and 1
+        :type params: list, tuple or numpy.ndarray
+        :return: (x, y, z) coordinates of the curve points, one row for each parameter
+        :rtype: numpy.ndarray
+        """
+        # Check all parameters are set before the curve evaluation
+        self._check_variables()
+        params = numpy.asarray(params, dtype=float).ravel()
+        knotvector = tuple(self._mKnotVector)
+        spans = utils.find_spans(self._mDegree, knotvector, len(self._mCtrlPts), params)
+        basis = utils.basis_functions_batch(self._mDegree, knotvector, spans, params)
+        return self._evaluate_rational_basis(spans, basis)
+
+    # Computes the curve points from the spans and basis functions of the parameters (private)
+    def _evaluate_rational_basis(self, spans, basis):
+        # Weighted control points (x*w, y*w, z*w, w)
+        weights = numpy.array(self._mWeights, dtype=float)
+        ctrlptsw = numpy.empty((len(self._mCtrlPts), 4))
+        ctrlptsw[:, :3] = numpy.array(self._mCtrlPts, dtype=float) * weights[:, None]
+        ctrlptsw[:, 3] = weights
         # Algorithm A4.1
-        for u in utils.frange(0, 1, self._mDelta):
-            span = utils.find_span(self._mDegree, tuple(self._mKnotVector), len(self._mCtrlPts), u)
-            basis = utils.basis_functions(self._mDegree, tuple(self._mKnotVector), span, u)
-            curveptw = [0.0, 0.0, 0.0, 0.0]
-            for i in range(0, self._mDegree + 1):
-                curveptw[0] += (basis[i] * self._mCtrlPts[span - self._mDegree + i][0] * self._mWeights[span - self._mDegree + i])
-                curveptw[1] += (basis[i] * self._mCtrlPts[span - self._mDegree + i][1] * self._mWeights[span - self._mDegree + i])
-                curveptw[2] += (basis[i] * self._mCtrlPts[span - self._mDegree + i][2] * self._mWeights[span - self._mDegree + i])
-                curveptw[3] += (basis[i] * self._mWeights[span - self._mDegree + i])
-            # Divide by weight
-            curvept = [float(curveptw[0] / curveptw[3]), float(curveptw[1] / curveptw[3]), float(curveptw[2] / curveptw[3])]
-            self._mCurvePts.append(curvept)
+        indices = spans[:, None] - self._mDegree + numpy.arange(self._mDegree + 1)
+        curveptsw = numpy.einsum('ij,ijk->ik', basis, ctrlptsw[indices])
+        # Divide by weight
+        return curveptsw[:, :3] / curveptsw[:, 3:]
+
+    # Evaluates the NURBS curve with an adaptive parameter sampling
+    def evaluate_adaptive(self, tolerance=0.01, max_depth=12):
+        """ Evaluates the NURBS curve subdividing the parameter space until the chord height is within the tolerance.
+
+        The curve is first sampled at its knots, with each knot span split into ``degree`` intervals. Then every
+        interval whose midpoint lies farther than ``tolerance`` from the chord between its end points is split in two,
+        up to ``max_depth`` times. Flat regions keep few samples while tight bends get as many as they need.
+
+        :param tolerance: maximum chord height, in model units
+        :type tolerance: float
+        :param max_depth: maximum number of subdivisions of the initial intervals
+        :type max_depth: integer
+        :return: the sorted parameters and the (x, y, z) coordinates of the curve points, both including the end points
+        :rtype: tuple
+        """
+        # Initial intervals from the knot spans
+        knots = numpy.unique(numpy.clip(numpy.asarray(self._mKnotVector, dtype=float), 0.0, 1.0))
+        if knots[0] > 0.0:
+            knots = numpy.concatenate(([0.0], knots))
+        if knots[-1] < 1.0:
+            knots = numpy.concatenate((knots, [1.0]))
+        steps = max(self._mDegree, 1)
+        fractions = numpy.arange(steps) / float(steps)
+        params = (knots[:-1, None] + (knots[1:] - knots[:-1])[:, None] * fractions).ravel()
+        params = numpy.append(params, 1.0)
+        points = self.evaluate_rational_at(params)
+
+        # Intervals still being refined, given by their end parameters and points
+        start, end = params[:-1], params[1:]
+        start_pts, end_pts = points[:-1], points[1:]
+        new_params = [params]
+        new_points = [points]
+        for depth in range(max_depth):
+            if start.size == 0:
+                break
+            mid = (start + end) / 2.0
+            mid_pts = self.evaluate_rational_at(mid)
+            # Distance from the midpoint to the chord segment
+            chord = end_pts - start_pts
+            length2 = numpy.einsum('ij,ij->i', chord, chord)
+            offset = mid_pts - start_pts
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                t = numpy.clip(numpy.einsum('ij,ij->i', offset, chord) / length2, 0.0, 1.0)
+            t[length2 == 0.0] = 0.0
+            height = numpy.linalg.norm(offset - t[:, None] * chord, axis=1)
+            split = height > tolerance
+            # Only the midpoints of the intervals that are split become new samples
+            new_params.append(mid[split])
+            new_points.append(mid_pts[split])
+            # Both halves of each split interval are checked again
+            start = numpy.concatenate((start[split], mid[split]))
+            end = numpy.concatenate((mid[split], end[split]))
+            start_pts = numpy.concatenate((start_pts[split], mid_pts[split]))
+            end_pts = numpy.concatenate((mid_pts[split], end_pts[split]))
+
+        params = numpy.concatenate(new_params)
+        points = numpy.concatenate(new_points)
+        order = numpy.argsort(params, kind='stable')
+        return params[order], points[order]
 
     # Evaluates the curve derivative using "CurveDerivsAlg1" algorithm
     def derivatives2(self, u=-1, order=0):
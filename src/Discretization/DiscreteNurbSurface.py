@@ -13,6 +13,7 @@
 
 import sys
 import itertools
+import numpy
 import Discretization.Utilities as utils
 
 
@@ -33,6 +34,7 @@ class Surface(object):
     * ctrlpts2D
     * weights
     * surfpts
+    * grid_shape
 
     The functions :func:`.read_ctrlpts()` and :func:`.read_ctrlptsw()` provide an easy way to read control points from a text file.
     Additional details for the text format can be found in `FORMATS.md <https://github.com/orbingol/NURBS-Python/blob/master/FORMATS.md>`_ file.
@@ -43,6 +45,7 @@ class Surface(object):
 
     * :func:`.evaluate()`
     * :func:`.evaluate_rational()`
+    * :func:`.evaluate_rational_grid()`
     * :func:`.derivatives()`
     * :func:`.tangent()`
     * :func:`.normal()`
@@ -69,11 +72,31 @@ class Surface(object):
         self._mDeltaV = 0.01
         self._mSurfPts = []
         self._mNormalDirect = []
+        self._mNormalDegenerate = []
+        self._mGridShape = (0, 0)
 
     @property
     def normal_direct(self):
+        """ Unit normal vectors of the evaluated surface points
+
+        .. note:: :func:`.evaluate_rational` should be called first. Rows of degenerate points are zero vectors.
+
+        :getter: (x, y, z) components of the normal vector of each surface point
+        :type: numpy.ndarray
+        """
         return self._mNormalDirect
 
+    @property
+    def normal_degenerate(self):
+        """ Degenerate normal vectors mask
+
+        .. note:: :func:`.evaluate_rational` should be called first.
+
+        :getter: True for each surface point where the normal vector cannot be computed (e.g. poles and collapsed edges)
+        :type: numpy.ndarray
+        """
+        return self._mNormalDegenerate
+
     @property
     def degree_u(self):
         """ Surface degree for U direction
@@ -316,11 +339,27 @@ class Surface(object):
 
         .. note:: :func:`.evaluate` or :func:`.evaluate_rational` should be called first.
 
+        .. note:: :func:`.evaluate_rational` stores the points as a contiguous (N, 3) ``numpy.ndarray``.
+
         :getter: (x, y, z) coordinates of the evaluated surface points
-        :type: list
+        :type: list or numpy.ndarray
         """
         return self._mSurfPts
 
+    @property
+    def grid_shape(self):
+        """ Number of evaluated points in the U and V directions
+
+        The evaluated surface points are ordered with V as the outer and U as the inner direction, so
+        :py:attr:`~surfpts` can be reshaped to ``(grid_shape[1], grid_shape[0], 3)``.
+
+        .. note:: :func:`.evaluate` or :func:`.evaluate_rational` should be called first.
+
+        :getter: (number of U parameters, number of V parameters)
+        :type: tuple
+        """
+        return self._mGridShape
+
     # Cleans up the control points and the weights (private)
     def _reset_ctrlpts(self):
         if self._mCtrlPts:
@@ -335,9 +374,11 @@ class Surface(object):
 
     # Cleans the evaluated surface points (private)
     def _reset_surface(self):
-        if self._mSurfPts:
-            # Delete the surface points
-            del self._mSurfPts[:]
+        # Delete the surface points and the normal vectors (surface points may be stored as an array)
+        self._mSurfPts = []
+        self._mNormalDirect = []
+        self._mNormalDegenerate = []
+        self._mGridShape = (0, 0)
 
     # Checks whether the surface evaluation is possible or not (private)
     def _check_variables(self):
@@ -346,10 +387,10 @@ class Surface(object):
         if self._mDegreeU == 0 or self._mDegreeV == 0:
             works = False
 
-        if not self._mCtrlPts:
+        if len(self._mCtrlPts) == 0:
             works = False
 
-        if not self._mKnotVectorU or not self._mKnotVectorV:
+        if len(self._mKnotVectorU) == 0 or len(self._mKnotVectorV) == 0:
             works = False
 
         if not works:
@@ -443,6 +484,43 @@ class Surface(object):
             print('ERROR: Cannot open file ' + filename)
             sys.exit(1)
 
+    # Creates a surface from an IGES Rational B-Spline Surface entity
+    @classmethod
+    def from_iges_entity(cls, entity):
+        """ Creates a surface from an IGES Rational B-Spline Surface (Type 128) entity.
+
+        The degrees, knot vectors, control points and weights are copied directly from the entity
+        properties, without any intermediate text representation.
+
+        :param entity: the IGES surface entity
+        :type entity: RationalBSplineSurface
+        :return: the NURBS surface
+        :rtype: Surface
+        """
+        surface = cls()
+        surface.degree_u = int(entity.M1)
+        surface.degree_v = int(entity.M2)
+        surface.knotvector_u = entity.SList
+        surface.knotvector_v = entity.TList
+
+        # Control points and weights are stored in [u][v] format in the entity
+        ctrlpts = numpy.stack((numpy.asarray(entity.XList, dtype=float),
+                               numpy.asarray(entity.YList, dtype=float),
+                               numpy.asarray(entity.ZList, dtype=float)), axis=-1)
+        weights = numpy.asarray(entity.WList, dtype=float)
+        surface._mCtrlPts_sizeU = ctrlpts.shape[0]
+        surface._mCtrlPts_sizeV = ctrlpts.shape[1]
+        # Flat lists are ordered with V as the outer and U as the inner direction
+        surface._mCtrlPts = ctrlpts.transpose(1, 0, 2).reshape(-1, 3).tolist()
+        surface._mWeights = weights.T.ravel().tolist()
+        # Generate a 2D list of control points
+        for i in range(0, surface._mCtrlPts_sizeU):
+            ctrlpts_v = []
+            for j in range(0, surface._mCtrlPts_sizeV):
+                ctrlpts_v.append(surface._mCtrlPts[i + (j * surface._mCtrlPts_sizeU)])
+            surface._mCtrlPts2D.append(ctrlpts_v)
+        return surface
+
     # Transposes the surface by swapping U and V directions
     def transpose(self):
         """ Transposes the surface by swapping U and V directions.
@@ -498,11 +576,15 @@ class Surface(object):
         # Clean up the surface points lists, if necessary
         self._reset_surface()
 
+        params_u = utils.sample_params(self._mDeltaU)
+        params_v = utils.sample_params(self._mDeltaV)
+        self._mGridShape = (len(params_u), len(params_v))
+
         # Algorithm A3.5
-        for v in utils.frange(0, 1, self._mDeltaV):
+        for v in params_v.tolist():
             span_v = utils.find_span(self._mDegreeV, tuple(self._mKnotVectorV), self._mCtrlPts_sizeV, v)
             basis_v = utils.basis_functions(self._mDegreeV, tuple(self._mKnotVectorV), span_v, v)
-            for u in utils.frange(0, 1, self._mDeltaU):
+            for u in params_u.tolist():
                 span_u = utils.find_span(self._mDegreeU, tuple(self._mKnotVectorU), self._mCtrlPts_sizeU, u)
                 basis_u = utils.basis_functions(self._mDegreeU, tuple(self._mKnotVectorU), span_u, u)
                 idx_u = span_u - self._mDegreeU
@@ -519,63 +601,104 @@ class Surface(object):
                     surfpt[2] += (basis_v[l] * temp[2])
                 self._mSurfPts.append(surfpt)
 
+    # Generates the weighted control points array in [u][v] format (private)
+    def _ctrlptsw_array(self):
+        ctrlpts = numpy.array(self._mCtrlPts2D, dtype=float).reshape(self._mCtrlPts_sizeU, self._mCtrlPts_sizeV, 3)
+        weights = numpy.array(self._mWeights, dtype=float).reshape(self._mCtrlPts_sizeV, self._mCtrlPts_sizeU).T
+        ctrlptsw = numpy.empty((self._mCtrlPts_sizeU, self._mCtrlPts_sizeV, 4))
+        ctrlptsw[:, :, 0:3] = ctrlpts * weights[:, :, numpy.newaxis]
+        ctrlptsw[:, :, 3] = weights
+        return ctrlptsw
+
     # Evaluates the NURBS surface
     def evaluate_rational(self):
-        """ Evaluates the NURBS surface.
+        """ Evaluates the NURBS surface and its normal vectors.
 
-        .. note:: The evaluated surface points are stored in :py:attr:`~surfpts`.
+        .. note:: The evaluated surface points are stored in :py:attr:`~surfpts`, the normal vectors in
+            :py:attr:`~normal_direct`, the degenerate normals mask in :py:attr:`~normal_degenerate` and the
+            number of points in each direction in :py:attr:`~grid_shape`.
 
-        :return: None
+        :return: evaluated surface points
+        :rtype: numpy.ndarray
         """
         # Check all parameters are set before the surface evaluation
         self._check_variables()
         # Clean up the surface points lists, if necessary
         self._reset_surface()
 
-        # Prepare a 2D weighted control points array
-        ctrlptsw = []
-        c_u = 0
-        while c_u < self._mCtrlPts_sizeU:
-            ctrlptsw_v = []
-            c_v = 0
-            while c_v < self._mCtrlPts_sizeV:
-                temp = [self._mCtrlPts2D[c_u][c_v][0] * self._mWeights[c_u + (c_v * self._mCtrlPts_sizeU)],
-                        self._mCtrlPts2D[c_u][c_v][1] * self._mWeights[c_u + (c_v * self._mCtrlPts_sizeU)],
-                        self._mCtrlPts2D[c_u][c_v][2] * self._mWeights[c_u + (c_v * self._mCtrlPts_sizeU)],
-                        self._mWeights[c_u + (c_v * self._mCtrlPts_sizeU)]]
-                ctrlptsw_v.append(temp)
-                c_v += 1
-            ctrlptsw.append(ctrlptsw_v)
-            c_u += 1
-
-        # Algorithm A4.3
-        for v in utils.frange(self._mDeltaV, 1-self._mDeltaV, self._mDeltaV):
-            span_v = utils.find_span(self._mDegreeV, tuple(self._mKnotVectorV), self._mCtrlPts_sizeV, v)
-            basis_v = utils.basis_functions(self._mDegreeV, tuple(self._mKnotVectorV), span_v, v)
-            for u in utils.frange(self._mDeltaU, 1-self._mDeltaU, self._mDeltaU):
-                try:
-                    self._mNormalDirect.append(self.normal(u, v))
-                except:
-                    self._mNormalDirect.append(tuple())
-                span_u = utils.find_span(self._mDegreeU, tuple(self._mKnotVectorU), self._mCtrlPts_sizeU, u)
-                basis_u = utils.basis_functions(self._mDegreeU, tuple(self._mKnotVectorU), span_u, u)
-                idx_u = span_u - self._mDegreeU
-                surfptw = [0.0, 0.0, 0.0, 0.0]
-                for l in range(0, self._mDegreeV + 1):
-                    temp = [0.0, 0.0, 0.0, 0.0]
-                    idx_v = span_v - self._mDegreeV + l
-                    for k in range(0, self._mDegreeU + 1):
-                        temp[0] += (basis_u[k] * ctrlptsw[idx_u + k][idx_v][0])
-                        temp[1] += (basis_u[k] * ctrlptsw[idx_u + k][idx_v][1])
-                        temp[2] += (basis_u[k] * ctrlptsw[idx_u + k][idx_v][2])
-                        temp[3] += (basis_u[k] * ctrlptsw[idx_u + k][idx_v][3])
-                    surfptw[0] += (basis_v[l] * temp[0])
-                    surfptw[1] += (basis_v[l] * temp[1])
-                    surfptw[2] += (basis_v[l] * temp[2])
-                    surfptw[3] += (basis_v[l] * temp[3])
-                # Divide by weight to obtain 3D surface points
-                surfpt = (surfptw[0] / surfptw[3], surfptw[1] / surfptw[3], surfptw[2] / surfptw[3])
-                self._mSurfPts.append(surfpt)
+        # Interior parameters only; there are always round(1 / delta) - 1 of them in each direction
+        params_u = utils.sample_params(self._mDeltaU, endpoints=False)
+        params_v = utils.sample_params(self._mDeltaV, endpoints=False)
+
+        self._mSurfPts, self._mNormalDirect, self._mNormalDegenerate = \
+            self.evaluate_rational_grid(params_u, params_v, normals=True)
+        self._mGridShape = (len(params_u), len(params_v))
+        return self._mSurfPts
+
+    # Evaluates the NURBS surface on a grid of (u, v) parameters
+    def evaluate_rational_grid(self, params_u=(), params_v=(), normals=False):
+        """ Evaluates the NURBS surface on the grid formed by the input U and V parameters.
+
+        Algorithm A4.3 of The NURBS Book by Piegl & Tiller, evaluated for all the parameters at once.
+        The points are ordered with V as the outer and U as the inner direction, i.e. the point of
+        ``params_u[i]`` and ``params_v[j]`` is stored in the row ``j * len(params_u) + i``.
+
+        When ``normals`` is True, the rational first derivatives are computed from the same basis
+        function matrices (Eq. 4.20 of The NURBS Book) and the unit normal vectors are returned as well.
+        The normal vectors of degenerate points are set to zero and flagged in a boolean mask.
+
+        .. note:: This method does not modify :py:attr:`~surfpts`.
+
+        :param params_u: parameters in the U direction
+        :type params_u: list, tuple or numpy.ndarray
+        :param params_v: parameters in the V direction
+        :type params_v: list, tuple or numpy.ndarray
+        :param normals: if True, also computes the normal vectors
+        :type normals: boolean
+        :return: evaluated surface points or, if normals is True, a tuple of surface points, normal vectors and degenerate mask
+        :rtype: numpy.ndarray or tuple
+        """
+        # Check all parameters are set before the surface evaluation
+        self._check_variables()
+
+        params_u = numpy.asarray(params_u, dtype=float).ravel()
+        params_v = numpy.asarray(params_v, dtype=float).ravel()
+        order = 1 if normals else 0
+        ctrlptsw = self._ctrlptsw_array()
+
+        # Basis functions (and derivatives) matrices of both directions, shared with other surfaces
+        # having the same parametrization
+        spans_u, ders_u = utils.basis_cache.lookup(self._mDegreeU, self._mKnotVectorU, self._mCtrlPts_sizeU,
+                                                   params_u, order)
+        spans_v, ders_v = utils.basis_cache.lookup(self._mDegreeV, self._mKnotVectorV, self._mCtrlPts_sizeV,
+                                                   params_v, order)
+        idx_u = (spans_u - self._mDegreeU)[:, numpy.newaxis] + numpy.arange(self._mDegreeU + 1)
+        idx_v = (spans_v - self._mDegreeV)[:, numpy.newaxis] + numpy.arange(self._mDegreeV + 1)
+
+        # Contract the U direction first, then the V direction; skl[k][l] is the derivative of the
+        # weighted surface w.r.t. u k times and v l times
+        temp = numpy.einsum('kir,irjc->kijc', ders_u, ctrlptsw[idx_u])
+        skl = numpy.einsum('lvs,kuvsc->klvuc', ders_v, temp[:, :, idx_v])
+        skl = skl.reshape(ders_u.shape[0], ders_v.shape[0], -1, 4)
+
+        # Divide by weight to obtain 3D surface points
+        weights = skl[0][0][:, 3:4]
+        surfpts = numpy.ascontiguousarray(skl[0][0][:, 0:3] / weights)
+        if not normals:
+            return surfpts
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            # Rational first derivatives w.r.t. u and v
+            der_u = (skl[1][0][:, 0:3] - (skl[1][0][:, 3:4] * surfpts)) / weights
+            der_v = (skl[0][1][:, 0:3] - (skl[0][1][:, 3:4] * surfpts)) / weights
+            # Compute normals, flagging the points where the tangents are parallel or vanish
+            normal = numpy.cross(der_u, der_v)
+            magnitude = numpy.linalg.norm(normal, axis=1)
+            tolerance = 1e-12 * numpy.linalg.norm(der_u, axis=1) * numpy.linalg.norm(der_v, axis=1)
+            degenerate = numpy.logical_not(magnitude > tolerance)
+            normal /= magnitude[:, numpy.newaxis]
+        normal[degenerate] = 0.0
+        return surfpts, numpy.ascontiguousarray(normal), degenerate
 
     # Evaluates n-th order surface derivatives at the given (u,v) parameter
     def derivatives(self, u=-1, v=-1, order=0):
@@ -5,11 +5,13 @@ defined in an .IGES and .IGS files.
 # Author: Willian Hideak Arita da Silva
 """
 
-from Discretization.PointInPolygon import pointInPolygon
+from concurrent.futures import ProcessPoolExecutor
+from Discretization.PointCloud import PointCloud
+from Discretization.PointInPolygon import gridPointsInFace
 from Discretization.DiscreteNurbCurve import Curve
 from Discretization.DiscreteNurbSurface import Surface
-from Discretization.Utilities import knotvector_normalize
-from numpy import array, dot
+from Discretization.Utilities import knotvector_normalize, sample_params
+from numpy import arange, array, asarray, concatenate, dot, empty
 from numpy.linalg import inv
 
 def pos(i):
@@ -78,37 +80,24 @@ def minimumEdge(vertices):
     # Function: minimumEdge.
     # Description: Definition of the minimum edge. The minimum edge is a group of minimum and
     maximum coordinate of points that lies in a square region and covers a cad model face.
-    # Parameters: * List vertices = A list of vertices of a polygon.
+    # Parameters: * Array vertices = A (N, 3) array or a list of vertices of a polygon.
     # Returns: * List = A list of two vectors (tuples), each representing the minimum coordinates
                         and the maximum coordinates occupied by the vertices of the polygon.
     """
-    minX = maxX = vertices[0][0]
-    minY = maxY = vertices[0][1]
-    minZ = maxZ = vertices[0][2]
-    for point in vertices:
-        if point[0] < minX:
-            minX = point[0]
-        if point[0] > maxX:
-            maxX = point[0]
-        if point[1] < minY:
-            minY = point[1]
-        if point[1] > maxY:
-            maxY = point[1]
-        if point[2] < minZ:
-            minZ = point[2]
-        if point[2] > maxZ:
-            maxZ = point[2]
-    minValues = (minX, minY, minZ)
-    maxValues = (maxX, maxY, maxZ)
+    vertices = asarray(vertices, dtype=float)
+    minValues = tuple(vertices.min(axis=0).tolist())
+    maxValues = tuple(vertices.max(axis=0).tolist())
     return [minValues, maxValues]
 
 def changeBasis(vertices, newBaseVector):
     """
     # Function: changeBasis.
     # Description: Performs a basis change of a list of vectors given three new basis vectors.
-    # Parameters: * List vertices = A list of points (tuples) that need to change basis.
+    All the vectors are transformed at once with a single matrix product.
+    # Parameters: * Array vertices = A (N, 3) array or a list of points (tuples) that need to
+                  change basis.
                   * Tuple newBaseVector = A tuple of three linear independent vectors.
-    # Returns: * List newVertices = A list of points (tuples) after the transformation.
+    # Returns: * Array newVertices = A (N, 3) array of points after the transformation.
     """
 
     # Find the transformation matrix:
@@ -117,23 +106,19 @@ def changeBasis(vertices, newBaseVector):
                     [i[1], j[1], k[1]],
                     [i[2], j[2], k[2]]])
     matrix = inv(matrix)
-    # Apply the transformation matrix:
-    newVertices = []
-    for point in vertices:
-        x, y, z = point
-        vector = array([[x], [y], [z]])
-        vector = dot(matrix, vector)
-        newVector = (vector[0][0], vector[1][0], vector[2][0])
-        newVertices.append(newVector)
-    return newVertices
+    # Apply the transformation matrix to the row vectors:
+    vertices = asarray(vertices, dtype=float).reshape(-1, 3)
+    return dot(vertices, matrix.T)
 
 def returnBasis(points, newBaseVector):
     """
     # Function: returnBasis.
-    # Description: Returns a list of vectors to the canonical base.
-    # Parameters: * List points = A list of points (tuples) that need to return basis.
+    # Description: Returns a list of vectors to the canonical base. All the vectors are
+    transformed at once with a single matrix product.
+    # Parameters: * Array points = A (N, 3) array or a list of points (tuples) that need to
+                  return basis.
                   * Tuple newBaseVector = A tuple of three linear independent vectors.
-    # Return: * List newPoints = A list of points (tuples) after returning the basis.
+    # Return: * Array newPoints = A (N, 3) array of points after returning the basis.
     """
 
     # Find the reverse transformation matrix:
@@ -141,15 +126,9 @@ def returnBasis(points, newBaseVector):
     matrix = array([[i[0], j[0], k[0]],
                     [i[1], j[1], k[1]],
                     [i[2], j[2], k[2]]])
-    # Apply the reverse transformation matrix:
-    newPoints = []
-    for point in points:
-        x, y, z = point
-        vector = array([[x], [y], [z]])
-        vector = dot(matrix, vector)
-        newVector = (vector[0][0], vector[1][0], vector[2][0])
-        newPoints.append(newVector)
-    return newPoints
+    # Apply the reverse transformation matrix to the row vectors:
+    points = asarray(points, dtype=float).reshape(-1, 3)
+    return dot(points, matrix.T)
 
 def orthonormalizeBasis(basisVector):
     """
@@ -169,7 +148,7 @@ def orthonormalizeBasis(basisVector):
             scalarVec((1/normVec(newJ)), newJ),
             scalarVec((1/normVec(k)), k)]
 
-def discretizeModel(parent, objectList, density, precision, Uparam, Vparam, useParametric, gridDiscretization, auxiliarDiscretization):
+def discretizeModel(objectList, density, precision, Uparam, Vparam, useParametric, gridDiscretization, workers=1):
     """
     # Function: discretizeModel.
     # Description: This function receives an objectList
@@ -183,9 +162,12 @@ def discretizeModel(parent, objectList, density, precision, Uparam, Vparam, useP
                   * Int Vparam = The number of discrete intervals desired for the discretization
                   in the parametric V direction of the surface.
                   * Boolean useParametric = Determines if the parametric discretization will be used.
-    # Returns: * Tuple = A list containing the sequence numbers of the IGES file, a list containing
-               the normal vector of each point related to the suface and a list containing the
-               discretized points.
+                  * Boolean gridDiscretization = True for a N x N grid on planar faces, False for
+                  N points/mm.
+                  * Int workers = The number of processes used to discretize the faces in parallel.
+                  With 1 (default) every face is discretized in the current process.
+    # Returns: * PointCloud cloud = The discretized points and normal vectors of every face, with
+               the grid shape of the faces discretized over their parametric surface.
     """
 
     # Get a list of planar faces in the model:
@@ -200,30 +182,60 @@ def discretizeModel(parent, objectList, density, precision, Uparam, Vparam, useP
             planarFacePointers.append(int(myObject.seqNumber))
         elif(myObject != None and myObject.entityType == 510 and useParametric):
             nonPlanarFacePointers.append(int(myObject.seqNumber))
-    # Discretize each planar face:
-    faceSequenceNumbers = []
-    faceNormalVectors = []
-    cloudPointsList = []
-    for i in planarFacePointers:
-        points, normals = discretizeFace(objectList[pos(i)], objectList, density, precision, gridDiscretization)
-        faceSequenceNumbers.append(i)
-        faceNormalVectors.append(normals)
-        cloudPointsList.append(points)
-        if(not auxiliarDiscretization):
-            parent.UVproperty.append([None, None])
-            parent.normVectorsToggle.append(True)
-    # Discretize each non-planar face:
-    for i in nonPlanarFacePointers:
-        points, normals = discretizeSurface(objectList[pos(i)], objectList, Uparam, Vparam)
-        faceSequenceNumbers.append(i)
-        faceNormalVectors.append(normals)
-        cloudPointsList.append(points)
-        if(not auxiliarDiscretization):
-            parent.UVproperty.append([Uparam, Vparam])
-            parent.normVectorsToggle.append(True)
-    return faceSequenceNumbers, faceNormalVectors, cloudPointsList
-
-def discretizeFace(face, objectList, density, precision, gridDiscretization):
+
+    # Every planar face is discretized inside its loops and every non-planar face over its
+    # parametric surface:
+    tasks = [(i, True, density, precision, gridDiscretization) for i in planarFacePointers]
+    tasks += [(i, False, Uparam, Vparam, None) for i in nonPlanarFacePointers]
+    if workers is not None and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=initDiscretizationWorker,
+                                 initargs=(objectList,)) as executor:
+            results = list(executor.map(discretizeTask, tasks))
+    else:
+        results = [discretizeTask(task, objectList) for task in tasks]
+
+    # Collecting the results in the same order of the faces:
+    cloud = PointCloud()
+    for task, (points, normals, gridShape) in zip(tasks, results):
+        cloud.addFace(task[0], points, normals, gridShape)
+    return cloud
+
+# The objectList of a discretization worker process (see initDiscretizationWorker)
+workerObjectList = None
+
+def initDiscretizationWorker(objectList):
+    """
+    # Function: initDiscretizationWorker.
+    # Description: Initializer of the worker processes used by discretizeModel. Stores the
+    objectList once per process, so it isn't sent again with every face.
+    # Parameters: * List objectList = A list of Entity objects obtained with the IGESImport module.
+    """
+    global workerObjectList
+    workerObjectList = objectList
+    clearCurveCache()
+    clearProbeCache()
+
+def discretizeTask(task, objectList=None):
+    """
+    # Function: discretizeTask.
+    # Description: This function discretizes a single face as scheduled by discretizeModel.
+    # Parameters: * Tuple task = The face sequence number, a boolean that is True for planar faces
+                  and the discretization parameters (density, precision and gridDiscretization
+                  for planar faces, Uparam and Vparam for non-planar ones).
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  Defaults to the list of the worker process.
+    # Returns: * Tuple = An array of the discretized points, an array of the normal vector of each
+               point and the grid shape of the points (None for planar faces).
+    """
+    if objectList is None:
+        objectList = workerObjectList
+    sequence, planar, parameter1, parameter2, parameter3 = task
+    if(planar):
+        points, normals = discretizeFace(objectList[pos(sequence)], objectList, parameter1, parameter2, parameter3)
+        return points, normals, None
+    return discretizeSurface(objectList[pos(sequence)], objectList, parameter1, parameter2)
+
+def discretizeFace(face, objectList, density, precision, gridDiscretization, localFrame=False, adaptive=False):
     """
     # Function: discretizeFace.
     # Description: This function generates a list of cloud points based on a specific face.
@@ -234,37 +246,34 @@ def discretizeFace(face, objectList, density, precision, gridDiscretization):
                   * Float precision = The number of discrete intervals desired for discretization of
                   the loop that surrounds the surface. This is necessary for using the PointInPolygon
                   module.
-    # Returns: * List newPoints = A list of discretized vertices.
-               * List normals = A list of normal vectors of to each point related to the surface.
-    """
-
-    # List to storage all the tuples (x, y, z) due to discretization.
-    points = []
-
-    # List to storage all the normal vectors due to discretization.
-    normals = []
+                  * Boolean gridDiscretization = True for a N x N grid, False for N points/mm.
+                  * Boolean localFrame = If True, the points are returned in the orthonormal frame
+                  of the face plane (x and y lie on the plane) and are not changed back to the
+                  original basis.
+                  * Boolean adaptive = If True, the curved edges of the loops are sampled only where
+                  they bend (see discretizeLoop).
+    # Returns: * Array newPoints = A (N, 3) array of discretized vertices. With localFrame, the
+               vertices are in the frame of the face plane.
+               * Array normals = A (N, 3) array of the normal vector of each point related to the
+               surface. With localFrame, the tuple of the three basis vectors of the face plane.
+    """
+
+    # Arrays returned when the face can't be discretized:
+    points = empty((0, 3))
+    normals = empty((0, 3))
 
     # Collecting all the vertices of the planar face.
     currentLoop = objectList[pos(face.LOOPList[0])]
-    vertices = discretizeLoop(currentLoop, objectList, precision)
+    vertices = discretizeLoop(currentLoop, objectList, precision, adaptive)
 
     if (len(vertices) < 3):
         return points, normals
 
-    # Estabilishing three base vectors for the plane:
-    a, b, c = vertices[0], vertices[1], vertices[2]
-    i = subVec(a, b)
-    j = subVec(a, c)
-    k = crossProduct(i, j)
-    newBasisVector = (i, j, k)
-
-    # Checking if vector k is a zero-length vector:
-    if normVec(k) == 0:
+    # Estabilishing an orthonormal basis for the plane:
+    newBasisVector = planeBasis(vertices)
+    if newBasisVector is None:
         return points, normals
 
-    # Orthogonalizing the basis vector through the Gram-Schmidt process.
-    newBasisVector = orthonormalizeBasis(newBasisVector)
-
     # Changing the coordinates from original basis to the new one.
     newVertices = changeBasis(vertices, newBasisVector)
 
@@ -277,57 +286,68 @@ def discretizeFace(face, objectList, density, precision, gridDiscretization):
         spacingX = (maxEdges[0]-minEdges[0])/density
         spacingY = (maxEdges[1]-minEdges[1])/density
 
-        # Creating additional points due to discretization:
-        for i in range(1, int(density)):
-            for j in range(1, int(density)):
-                newX = minEdges[0] + i*spacingX
-                newY = minEdges[1] + j*spacingY
-                newPoint = (newX, newY, zCoord)
-                points.append(newPoint)
+        # Coordinates of the grid columns and rows:
+        xValues = minEdges[0] + arange(1, int(density))*spacingX
+        yValues = minEdges[1] + arange(1, int(density))*spacingY
     else:
         # Discretizing the model with the N points/mm parameter:
         numSpacesX = (maxEdges[0]-minEdges[0])*density
         numSpacesY = (maxEdges[1]-minEdges[1])*density
 
-        # Creating additional points due to discretization:
-        for i in range(1, int(numSpacesX)+1):
-            for j in range(1, int(numSpacesY)+1):
-                newX = minEdges[0] + i*(1/density)
-                newY = minEdges[1] + j*(1/density)
-                newPoint = (newX, newY, zCoord)
-                points.append(newPoint)
-
-    # Verifying if the new points lies inside the original boundary:
-    auxList = []
-    for point in points:
-        if(pointInPolygon(point[0], point[1], newVertices)):
-            auxList.append(point)
-    points = auxList
-
-    # Verifying if the new points has some inner loops to consider;
+        # Coordinates of the grid columns and rows:
+        xValues = minEdges[0] + arange(1, int(numSpacesX)+1)*(1/density)
+        yValues = minEdges[1] + arange(1, int(numSpacesY)+1)*(1/density)
+
+    # Converting the 3D vertices of the inner loops to 2D:
+    innerVertices = []
     for i in range(1, len(face.LOOPList)):
         currentLoop = objectList[pos(face.LOOPList[i])]
-        vertices = discretizeLoop(currentLoop, objectList, precision)
-
-        # Converting the 3D vertices to 2D:
-        newVertices = changeBasis(vertices, newBasisVector)
-
-        auxList = []
-        auxList = []
-        for point in points:
-            if(not pointInPolygon(point[0], point[1], newVertices)):
-                auxList.append(point)
-        points = auxList
+        vertices = discretizeLoop(currentLoop, objectList, precision, adaptive)
+        innerVertices.append(changeBasis(vertices, newBasisVector))
+
+    # Creating only the grid points that lie inside the original boundary and outside the
+    # inner loops, filling the face row by row:
+    columns, rows = gridPointsInFace(xValues, yValues, newVertices, innerVertices)
+    points = empty((len(columns), 3))
+    points[:, 0] = xValues[columns]
+    points[:, 1] = yValues[rows]
+    points[:, 2] = zCoord
+    if(localFrame):
+        return points, tuple(newBasisVector)
 
     # Changing the new points to the original basis:
     newPoints = returnBasis(points, newBasisVector)
 
     # Creating a vector of normal vectors:
-    for i in range(len(newPoints)):
-        normals.append(newBasisVector[2])
+    normals = empty((len(newPoints), 3))
+    normals[:] = newBasisVector[2]
     return newPoints, normals
 
-def discretizeLoop(currentLoop, objectList, precision):
+def planeBasis(vertices):
+    """
+    # Function: planeBasis.
+    # Description: This function estabilishes an orthonormal basis for the plane of a face from
+    the first three vertices of its boundary. The first two vectors lie on the plane and the
+    third one is normal to it.
+    # Parameters: * List vertices = A list of the vertices (tuples) of the face boundary.
+    # Returns: * List newBasisVector = The three basis vectors, or None if the first three
+               vertices don't define a plane.
+    """
+
+    # Estabilishing three base vectors for the plane:
+    a, b, c = vertices[0], vertices[1], vertices[2]
+    i = subVec(a, b)
+    j = subVec(a, c)
+    k = crossProduct(i, j)
+
+    # Checking if vector k is a zero-length vector:
+    if normVec(k) == 0:
+        return None
+
+    # Orthogonalizing the basis vector through the Gram-Schmidt process.
+    return orthonormalizeBasis((i, j, k))
+
+def discretizeLoop(currentLoop, objectList, precision, adaptive=False, tolerance=1e-6):
     """
     # Function: discretizeLoop.
     # Description: This function generates a list of points that lies in a specific loop using
@@ -335,6 +355,14 @@ def discretizeLoop(currentLoop, objectList, precision):
     # Parameters: * Entity currentLoop = The Python object representing the loop for discretization.
                   * List objectList = A list of Entity objects obtained with the IGESImport module.
                   * Float precision = The number of discrete intervals desired for discretization.
+                  * Boolean adaptive = If True, each curved edge is sampled only where it bends, with
+                  a chord height tolerance of diagonal/precision^2, the diagonal being the one of the
+                  control points bounding box. This is tighter than the error of the fixed sampling
+                  while using fewer points, but it changes the boundary polygon, and so the points
+                  of the faces. If False (default), every edge is sampled with a fixed step of
+                  1/precision.
+                  * Float tolerance = The maximum distance, in each coordinate, between two edge
+                  end points that are joined when the edges are chained into a polygon.
     # Returns: * List vertices = A list of discretized vertices.
     """
 
@@ -359,19 +387,10 @@ def discretizeLoop(currentLoop, objectList, precision):
         unsortedVertices[i].append(vertex)
 
         # Getting the intermediate vertices in case of non-straight edges:
-        spaceCurve = int(objectList[pos(currentEdge)].CURVList[currentEdgeIndex-1])
-        spaceCurve = objectList[pos(spaceCurve)]
+        spaceCurveSequence = int(objectList[pos(currentEdge)].CURVList[currentEdgeIndex-1])
+        spaceCurve = objectList[pos(spaceCurveSequence)]
         if(int(spaceCurve.K) != 1):
-            newCurve = Curve()
-            newCurve.delta = (1/precision)
-            newCurve.degree = int(spaceCurve.M)
-            newCurve.knotvector = list(spaceCurve.TList)
-            newCurve.ctrlpts = [[spaceCurve.XList[i], spaceCurve.YList[i], spaceCurve.ZList[i]] \
-                                for i in range(len(spaceCurve.WList))]
-            newCurve.weights = list(spaceCurve.WList)
-            newCurve.evaluate_rational()
-            for j in range(1, len(newCurve.curvepts)-1):
-                unsortedVertices[i].append(newCurve.curvepts[j])
+            unsortedVertices[i] += discretizeCurve(spaceCurve, spaceCurveSequence, precision, adaptive)
 
         # Getting the End Vertex tuple
         x = objectList[pos(endVertex)].XList[endVertexIndex-1]
@@ -381,21 +400,222 @@ def discretizeLoop(currentLoop, objectList, precision):
         unsortedVertices[i].append(vertex)
 
     # Sorting the vertices according to the formed polygon:
-    vertices = []
-    vertices += unsortedVertices[0]
-    unsortedVertices = unsortedVertices[1:]
-    for i in range(len(unsortedVertices)):
-        for j in range(len(unsortedVertices)):
-            if(unsortedVertices[j][0] == vertices[-1]):
-                del unsortedVertices[j][0]
-                vertices += unsortedVertices[j]
-                del unsortedVertices[j]
-                break
-            elif(unsortedVertices[j][len(unsortedVertices[j])-1] == vertices[-1]):
-                del unsortedVertices[j][len(unsortedVertices[j])-1]
-                vertices += list(reversed(unsortedVertices[j]))
-                del unsortedVertices[j]
-                break
+    return chainEdges(unsortedVertices, tolerance)
+
+# The discretized edge curves, see discretizeCurve and clearCurveCache
+curveCache = {}
+
+def clearCurveCache():
+    """
+    # Function: clearCurveCache.
+    # Description: Removes all the edge curves stored by discretizeCurve. It must be called when
+    a model is loaded or closed.
+    """
+    curveCache.clear()
+
+def discretizeCurve(spaceCurve, sequence, precision, adaptive=False):
+    """
+    # Function: discretizeCurve.
+    # Description: This function generates the intermediate points of an edge curve using the
+    NURBS parametric discretization provided by the DiscreteNurbCurve module. The result is kept
+    in a cache by curve sequence number and precision, so an edge shared by neighbouring faces or
+    discretized again by an auxiliary pass is only evaluated once.
+    # Parameters: * Entity spaceCurve = The Python object representing the Rational B-Spline Curve.
+                  * Int sequence = The sequence number of the curve entity.
+                  * Float precision = The number of discrete intervals desired for discretization.
+                  * Boolean adaptive = If True, the curve is sampled only where it bends (see
+                  discretizeLoop). If False (default), it is sampled with a fixed step of 1/precision.
+    # Returns: * Tuple points = A tuple of the discretized points (tuples), excluding the ones at
+               the curve end points.
+    """
+
+    # The curve object is stored too, so a curve of another model is never taken from the cache:
+    key = (sequence, precision, adaptive)
+    cached = curveCache.get(key)
+    if(cached is not None and cached[0] is spaceCurve):
+        return cached[1]
+
+    newCurve = Curve()
+    newCurve.delta = (1/precision)
+    newCurve.degree = int(spaceCurve.M)
+    newCurve.knotvector = list(spaceCurve.TList)
+    newCurve.ctrlpts = [[spaceCurve.XList[i], spaceCurve.YList[i], spaceCurve.ZList[i]] \
+                        for i in range(len(spaceCurve.WList))]
+    newCurve.weights = list(spaceCurve.WList)
+    if(adaptive):
+        ctrlpts = array(newCurve.ctrlpts)
+        diagonal = normVec(ctrlpts.max(axis=0) - ctrlpts.min(axis=0))
+        params, curvePoints = newCurve.evaluate_adaptive(diagonal/precision**2)
+    else:
+        curvePoints = newCurve.evaluate_rational()
+    points = tuple(tuple(point) for point in curvePoints[1:-1].tolist())
+    curveCache[key] = (spaceCurve, points)
+    return points
+
+# The geometry probes of faces, see surfaceDimensions, facePlane and clearProbeCache
+probeCache = {}
+
+def clearProbeCache():
+    """
+    # Function: clearProbeCache.
+    # Description: Removes all the geometry probes stored by surfaceDimensions and facePlane. It
+    must be called when a model is loaded or closed.
+    """
+    probeCache.clear()
+
+def surfaceDimensions(face, sequence, objectList, Uparam=160, Vparam=120):
+    """
+    # Function: surfaceDimensions.
+    # Description: This function estimates the diameter and the length of a turned face from
+    three points of its surface. The points are the ones a discretizeSurface call with the same
+    Uparam and Vparam would give at the grid indexes (0, 0), (0, nv/2) and (nu-2, 0), but only
+    these three points are evaluated. The result is kept in a cache by face sequence number.
+    # Parameters: * Entity face = The Python object representing the face that contains the surface.
+                  * Int sequence = The sequence number of the face entity.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  * Int Uparam = The number of intervals of the probe grid in the U direction.
+                  * Int Vparam = The number of intervals of the probe grid in the V direction.
+    # Returns: * Tuple = The diameter (distance between the points half a turn apart in the V
+               direction) and the length (distance between the points along the U direction).
+    """
+
+    # The face object is stored too, so a face of another model is never taken from the cache:
+    key = ('dimensions', sequence, Uparam, Vparam)
+    cached = probeCache.get(key)
+    if(cached is not None and cached[0] is face):
+        return cached[1]
+
+    newSurface = Surface.from_iges_entity(objectList[pos(face.SURF)])
+    paramsU = sample_params(1/Uparam, endpoints=False)
+    paramsV = sample_params(1/Vparam, endpoints=False)
+    points = newSurface.evaluate_rational_grid(paramsU[[0, len(paramsU)-2]], paramsV[[0, len(paramsV)//2]])
+    diameter = normVec(points[2] - points[0])
+    length = normVec(points[1] - points[0])
+    probeCache[key] = (face, (diameter, length))
+    return diameter, length
+
+def facePlane(face, sequence, objectList):
+    """
+    # Function: facePlane.
+    # Description: This function finds the equation Ax+By+Cz=D of the plane of a planar face
+    from its surface, with (A, B, C) being the unit normal vector of the surface at its center.
+    Only this point of the surface is evaluated. The result is kept in a cache by face sequence
+    number.
+    # Parameters: * Entity face = The Python object representing the planar face.
+                  * Int sequence = The sequence number of the face entity.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+    # Returns: * Tuple = The (A, B, C, D) coefficients of the plane.
+    """
+
+    # The face object is stored too, so a face of another model is never taken from the cache:
+    key = ('plane', sequence)
+    cached = probeCache.get(key)
+    if(cached is not None and cached[0] is face):
+        return cached[1]
+
+    newSurface = Surface.from_iges_entity(objectList[pos(face.SURF)])
+    points, normals, degenerate = newSurface.evaluate_rational_grid([0.5], [0.5], normals=True)
+    if(degenerate[0]):
+        raise ValueError('the surface of the face does not define a plane')
+    A, B, C = normals[0].tolist()
+    plane = (A, B, C, dotProduct((A, B, C), points[0].tolist()))
+    probeCache[key] = (face, plane)
+    return plane
+
+def faceBoundingBox(face, sequence, objectList, precision=100, Uparam=100, Vparam=100):
+    """
+    # Function: faceBoundingBox.
+    # Description: This function finds the bounding box of a face from its geometry, without
+    OpenCASCADE. The box of a planar face is the one of the vertices of its outer boundary, which
+    is the OpenCASCADE box when the edges are straight. The curved edges are sampled finely, so
+    their box is close to the OpenCASCADE one. The box of a non-planar face also takes the points
+    of a Uparam x Vparam grid over its surface, including the surface edges. The result is kept
+    in a cache by face sequence number.
+    # Parameters: * Entity face = The Python object representing the face.
+                  * Int sequence = The sequence number of the face entity.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  * Float precision = The number of discrete intervals used for the discretization
+                  of the loop that surrounds the face.
+                  * Int Uparam = The number of intervals of the surface grid in the U direction.
+                  * Int Vparam = The number of intervals of the surface grid in the V direction.
+    # Returns: * Tuple = The (xMin, yMin, zMin) and (xMax, yMax, zMax) corners of the box, as arrays.
+    """
+
+    # The face object is stored too, so a face of another model is never taken from the cache:
+    key = ('box', sequence, precision, Uparam, Vparam)
+    cached = probeCache.get(key)
+    if(cached is not None and cached[0] is face):
+        return cached[1]
+
+    points = array(discretizeLoop(objectList[pos(face.LOOPList[0])], objectList, precision), dtype=float).reshape(-1, 3)
+    surface = objectList[pos(face.SURF)]
+    if(not (surface.K1 == 1 and surface.K2 == 1 and surface.M1 == 1 and surface.M2 == 1)):
+        newSurface = Surface.from_iges_entity(surface)
+        surfacePoints = newSurface.evaluate_rational_grid(sample_params(1/Uparam), sample_params(1/Vparam))
+        points = concatenate([points, asarray(surfacePoints, dtype=float).reshape(-1, 3)])
+    if(not len(points)):
+        raise ValueError('the face has no boundary')
+    box = (points.min(axis=0), points.max(axis=0))
+    probeCache[key] = (face, box)
+    return box
+
+def chainEdges(edges, tolerance=1e-6):
+    """
+    # Function: chainEdges.
+    # Description: This function joins a list of discretized edges into a single polygon. Starting
+    with the first edge, it repeatedly appends the edge that has an end point matching the last
+    vertex of the polygon, reversing the edge when needed. The end points are indexed in a
+    dictionary by their coordinates rounded to the tolerance, so each edge is found in constant
+    time. When more than one edge matches, the first one in the list is used.
+    # Parameters: * List edges = A list of edges, each edge being a list of vertices (tuples).
+                  * Float tolerance = The maximum distance, in each coordinate, between two end
+                  points that are considered the same vertex. Use 0 for an exact comparison.
+    # Returns: * List vertices = A list of the polygon vertices.
+    """
+
+    if(not edges):
+        return []
+
+    # Rounding the coordinates of a vertex to the tolerance grid:
+    def quantize(vertex):
+        if(tolerance > 0):
+            return tuple(int(round(coord/tolerance)) for coord in vertex)
+        return tuple(vertex)
+
+    # Matching vertices may be rounded to neighbouring cells of the grid:
+    if(tolerance > 0):
+        offsets = [(a, b, c) for a in (-1, 0, 1) for b in (-1, 0, 1) for c in (-1, 0, 1)]
+    else:
+        offsets = [(0, 0, 0)]
+
+    # Indexing the end points of each edge. The start point is 0 and the end point is 1:
+    endPoints = {}
+    for i in range(1, len(edges)):
+        for end, vertex in ((0, edges[i][0]), (1, edges[i][-1])):
+            endPoints.setdefault(quantize(vertex), []).append((i, end, vertex))
+
+    used = [False]*len(edges)
+    used[0] = True
+    vertices = list(edges[0])
+    for n in range(len(edges)-1):
+        last = vertices[-1]
+        key = quantize(last)
+        match = None
+        for offset in offsets:
+            cell = tuple(k + o for k, o in zip(key, offset)) if tolerance > 0 else key
+            for i, end, vertex in endPoints.get(cell, ()):
+                if(used[i] or (match is not None and (i, end) >= match)):
+                    continue
+                if(all(abs(u - v) <= tolerance for u, v in zip(vertex, last))):
+                    match = (i, end)
+        if(match is None):
+            break
+        i, end = match
+        used[i] = True
+        if(end == 0):
+            vertices += edges[i][1:]
+        else:
+            vertices += list(reversed(edges[i][:-1]))
     return vertices
 
 def discretizeSurface(face, objectList, Uparam, Vparam):
@@ -409,48 +629,30 @@ def discretizeSurface(face, objectList, Uparam, Vparam):
                   in the parametric U direction of the surface.
                   * Int Vparam = The number of discrete intervals desired for the discretization
                   in the parametric V direction of the surface.
-    # Returns: * Tuple = A list containing the points and a list containig the normal vector of
-               each point related to the surface.
+    # Returns: * Tuple = A (N, 3) array of the points, a (N, 3) array of the normal vector of
+               each point related to the surface and the grid shape (nu, nv). There are always
+               nu = Uparam-1 by nv = Vparam-1 points, ordered with V as the outer direction, i.e.
+               the point (i, j) of the grid is at the index j*nu + i. Points where the normal
+               vector is degenerate (e.g. the apex of a cone) have a (0.0, 0.0, 0.0) normal vector.
     """
-    currentSurface = objectList[pos(face.SURF)]
-    newSurface = Surface()
+    newSurface = Surface.from_iges_entity(objectList[pos(face.SURF)])
     newSurface.delta_u = 1/Uparam
     newSurface.delta_v = 1/Vparam
-    newSurface.degree_u = int(currentSurface.M1)
-    newSurface.degree_v = int(currentSurface.M2)
-    newSurface.knotvector_u = list(currentSurface.SList)
-    newSurface.knotvector_v = list(currentSurface.TList)
-    #surfData = open('..\\tmp\\SurfaceData.txt', 'w')
-    surfData = open('SurfaceData.txt', 'w')
-    surfText = ''
-    for j in range(len(currentSurface.XList[0])):
-        for i in range(len(currentSurface.XList)):
-            surfText += (str(currentSurface.XList[i][j] * currentSurface.WList[i][j]) + ',' +
-                         str(currentSurface.YList[i][j] * currentSurface.WList[i][j]) + ',' +
-                         str(currentSurface.ZList[i][j] * currentSurface.WList[i][j]) + ',' +
-                         str(currentSurface.WList[i][j]))
-            if i == (len(currentSurface.XList) - 1):
-                surfText += '\n'
-            else:
-                surfText += ';'
-    surfData.write(surfText)
-    surfData.close()
-    #newSurface.read_ctrlptsw('..\\tmp\\SurfaceData.txt')
-    newSurface.read_ctrlptsw('SurfaceData.txt')
-    newSurface.evaluate_rational()
-    return list(newSurface.surfpts), list(newSurface.normal_direct)
+    surfacePoints = newSurface.evaluate_rational()
+    normals = newSurface.normal_direct
+    return surfacePoints, normals, newSurface.grid_shape
 
 def generatePcd(cloudPoints, filePath):
     """
     # Function: generatePcd.
     # Description: This function generates a file CloudData.pcd containing all the
     cloud points specified in the cloudPoints list.
-    # Parameters: * List cloudPoints = The list of desired points.
+    # Parameters: * PointCloud cloudPoints = The desired points, as a PointCloud object or a list
+                  containing a list of points for each face.
                   * Str filePath = A string containing the file path for saving.
     """
-    numberOfPoints = 0
-    for item in cloudPoints:
-        numberOfPoints += len(item)
+    points = cloudPointsArray(cloudPoints)
+    numberOfPoints = len(points)
     pcdText = ('# .PCD v.7 - Point Cloud Data file format\n' +
                'VERSION .7\n' +
                'FIELDS x y z\n' +
@@ -461,11 +663,7 @@ def generatePcd(cloudPoints, filePath):
                'HEIGHT 1\n' +
                'POINTS ' + str(numberOfPoints) + '\n' +
                'DATA ascii\n')
-    for item in cloudPoints:
-        for point in item:
-            pcdText += (str(point[0]) + ' ' +
-                        str(point[1]) + ' ' +
-                        str(point[2]) + '\n')
+    pcdText += ''.join(str(x) + ' ' + str(y) + ' ' + str(z) + '\n' for x, y, z in points.tolist())
     pcdFile = open(filePath, 'w')
     pcdFile.write(pcdText)
     pcdFile.close()
@@ -475,15 +673,27 @@ def generateTxt(cloudPoints, filePath):
     # Function: generateTxt.
     # Description: This function generates a file TxtData.txt containing all the
     cloud points specified in the cloudPoints list.
-    # Parameters: * List cloudPoints = The list of desired points.
+    # Parameters: * PointCloud cloudPoints = The desired points, as a PointCloud object or a list
+                  containing a list of points for each face.
                   * Str filePath = A string containing the file path for saving.
     """
-    txtText = ''
-    for item in cloudPoints:
-        for point in item:
-            txtText += (str(point[0]) + ' ' +
-                        str(point[1]) + ' ' +
-                        str(point[2]) + '\n')
+    points = cloudPointsArray(cloudPoints)
+    txtText = ''.join(str(x) + ' ' + str(y) + ' ' + str(z) + '\n' for x, y, z in points.tolist())
     pcdFile = open(filePath, 'w')
     pcdFile.write(txtText)
     pcdFile.close()
+
+def cloudPointsArray(cloudPoints):
+    """
+    # Function: cloudPointsArray.
+    # Description: Gathers the points of a point cloud in a single array.
+    # Parameters: * PointCloud cloudPoints = A PointCloud object or a list containing a list of
+                  points for each face.
+    # Returns: * Array = A (N, 3) array of all the points.
+    """
+    if(isinstance(cloudPoints, PointCloud)):
+        return cloudPoints.points
+    faces = [asarray(item, dtype=float).reshape(-1, 3) for item in cloudPoints]
+    if(not faces):
+        return empty((0, 3))
+    return concatenate(faces)
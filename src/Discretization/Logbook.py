@@ -0,0 +1,202 @@
+"""
+# Module: Logbook.py
+# Description: This module reads the logbook files saved by the Log menu and replays them
+without the user interface. The logbook is split into entries, each one made of a header
+line (e.g. '> [Deviation] Flexion:') followed by one '\tKey: value' line for each parameter,
+and each entry is converted to an operation of the Pipeline module: a dictionary with the
+type of the operation and its typed parameters.
+# Author: Willian Hideak Arita da Silva.
+"""
+
+from Discretization.PointCloud import PointCloud
+from Discretization.Pipeline import applyOperation
+
+def logNumber(value):
+    """
+    # Function: logNumber.
+    # Description: Converts a logbook value to a float, ignoring its unit (e.g. '0.1 mm', '2.0°').
+    """
+    return float(value.split()[0].rstrip('°'))
+
+def logInteger(value):
+    """
+    # Function: logInteger.
+    # Description: Converts a logbook value to an integer (e.g. '20', '4.0').
+    """
+    return int(logNumber(value))
+
+def logOptionalInteger(value):
+    """
+    # Function: logOptionalInteger.
+    # Description: Converts a logbook value to an integer, or to None if the value is 'None'.
+    """
+    return None if value == 'None' else logInteger(value)
+
+def logEntities(value):
+    """
+    # Function: logEntities.
+    # Description: Converts a logbook entity list (e.g. '[3, 4]') to a list of integers.
+    """
+    return [int(float(item)) for item in value.strip('[]').split(',') if item.strip()]
+
+def logBoolean(value):
+    """
+    # Function: logBoolean.
+    # Description: Converts a logbook value ('True' or 'False') to a bool.
+    """
+    return value.lower() == 'true'
+
+def logGrid(value):
+    """
+    # Function: logGrid.
+    # Description: Converts a logbook discretization mode to True for 'N x N' and False for
+    'N points/mm'.
+    """
+    return value == 'N x N'
+
+def logText(value):
+    """
+    # Function: logText.
+    # Description: Keeps a logbook value as a string.
+    """
+    return value
+
+# The operation type of each logbook header and the (key, parameter, converter) of its fields:
+logEntries = {
+    '> [Discretization] Automatic:': ('automatic', [('mode', 'grid', logGrid), ('n value', 'density', logNumber),
+                                                    ('precision', 'precision', logNumber),
+                                                    ('u value', 'uParameter', logOptionalInteger),
+                                                    ('v value', 'vParameter', logOptionalInteger)]),
+    '> [Discretization] Flat:': ('flat', [('entity list', 'entities', logEntities), ('mode', 'grid', logGrid),
+                                          ('n value', 'density', logNumber), ('precision', 'precision', logNumber)]),
+    '> [Discretization] Parametric:': ('parametric', [('entity list', 'entities', logEntities),
+                                                      ('u value', 'uParameter', logInteger),
+                                                      ('v value', 'vParameter', logInteger)]),
+    '> [Deviation] Translational:': ('translation', [('entity list', 'entities', logEntities), ('x value', 'x', logText),
+                                                     ('y value', 'y', logText), ('z value', 'z', logText),
+                                                     ('offset', 'offset', logNumber)]),
+    '> [Deviation] Rotation:': ('rotation', [('entity list', 'entities', logEntities), ('x value', 'x', logNumber),
+                                             ('y value', 'y', logNumber), ('z value', 'z', logNumber)]),
+    '> [Deviation] Random:': ('random', [('entity list', 'entities', logEntities), ('min. offset', 'minOffset', logNumber),
+                                         ('max. offset', 'maxOffset', logNumber)]),
+    '> [Deviation] Flexion:': ('flexion', [('entity list', 'entities', logEntities), ('long. axis', 'longAxis', logText),
+                                           ('norm. axis', 'perpAxis', logText),
+                                           ('max. deflection', 'maxDeflection', logNumber)]),
+    '> [Deviation] Torsion:': ('torsion', [('entity list', 'entities', logEntities), ('long. axis', 'longAxis', logText),
+                                           ('perp. axis', 'perpAxis', logText),
+                                           ('max. deflection', 'maxDeflection', logNumber)]),
+    '> [Deviation] Periodic Pattern:': ('periodic', [('entity list', 'entities', logEntities),
+                                                     ('along drill axis', 'drillAxis', logBoolean),
+                                                     ('amplitude', 'amplitude', logNumber),
+                                                     ('frequency', 'frequency', logNumber)]),
+    '> [Deviation] Ovalization:': ('oval', [('entity list', 'entities', logEntities),
+                                            ('max. offset', 'maxDeviation', logNumber)]),
+    '> [Deviation] Spindle:': ('spindle', [('entity list', 'entities', logEntities),
+                                           ('tool condition', 'toolCondition', logText),
+                                           ('depth of cut', 'depth', logNumber), ('feed rate', 'feed', logNumber),
+                                           ('spindle speed', 'spindle', logNumber),
+                                           ('fixture entity', 'fixture', logInteger)]),
+}
+
+def splitLog(text):
+    """
+    # Function: splitLog.
+    # Description: Splits the text of a logbook into its entries.
+    # Parameters: * Str text = The text of the logbook.
+    # Returns: * List entries = The text of each entry, as it is stored in the logbookList of the
+               main window.
+    """
+    entries = []
+    for lineNumber, line in enumerate(text.splitlines(True)):
+        if(line.startswith('> ')):
+            entries.append(line)
+        elif(entries):
+            entries[-1] += line
+        elif(line.strip()):
+            raise ValueError('line ' + str(lineNumber + 1) + ': expected an entry header')
+    return entries
+
+def parseEntry(entry):
+    """
+    # Function: parseEntry.
+    # Description: Converts a logbook entry to an operation of the Pipeline module.
+    # Parameters: * Str entry = The text of the entry.
+    # Returns: * Dict operation = The operation, with its 'type' and its parameters.
+    """
+    lines = entry.splitlines()
+    header = lines[0].strip()
+    if(header not in logEntries):
+        raise ValueError('unknown logbook entry: ' + header)
+    operationType, fields = logEntries[header]
+
+    values = {}
+    for line in lines[1:]:
+        if(line.strip()):
+            key, separator, value = line.strip().partition(':')
+            if(not separator):
+                raise ValueError(header + ' invalid line: ' + line.strip())
+            values[key.strip().lower()] = value.strip()
+
+    operation = {'type': operationType}
+    for key, name, converter in fields:
+        if(key not in values):
+            raise ValueError(header + ' missing field: ' + key)
+        try:
+            operation[name] = converter(values[key])
+        except (ValueError, IndexError):
+            raise ValueError(header + ' invalid value of ' + key + ': ' + values[key])
+
+    # Gathering the components of the vectors:
+    if(operationType == 'translation'):
+        components = [operation.pop(name) for name in ('x', 'y', 'z')]
+        if(components[0] == 'Multiple Values'):
+            operation['direction'] = 'normal'
+        else:
+            try:
+                operation['direction'] = [float(component) for component in components]
+            except ValueError:
+                raise ValueError(header + ' invalid direction: ' + ', '.join(components))
+    elif(operationType == 'rotation'):
+        operation['angles'] = [operation.pop(name) for name in ('x', 'y', 'z')]
+    return operation
+
+def parseLog(text):
+    """
+    # Function: parseLog.
+    # Description: Converts the text of a logbook to a list of operations of the Pipeline module.
+    # Parameters: * Str text = The text of the logbook.
+    # Returns: * List operations = The operations, in the order of the logbook.
+    """
+    return [parseEntry(entry) for entry in splitLog(text)]
+
+def readLog(filePath):
+    """
+    # Function: readLog.
+    # Description: Reads a logbook file and converts it to a list of operations.
+    # Parameters: * Str filePath = The path of the logbook file.
+    # Returns: * List operations = The operations, in the order of the logbook.
+    """
+    with open(filePath, 'r') as logFile:
+        return parseLog(logFile.read())
+
+def replayLog(operations, objectList, cloud=None, generator=None, workers=1, boundingBox=None):
+    """
+    # Function: replayLog.
+    # Description: Applies a list of operations to a point cloud, in order.
+    # Parameters: * List operations = The operations, e.g. obtained with parseLog.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  * PointCloud cloud = The point cloud. Defaults to a new empty one.
+                  * Generator generator = The numpy random generator used by random deviations.
+                  * Int workers = The number of processes used by automatic discretizations.
+                  * Function boundingBox = The bounding box function of deviations. Defaults to
+                  the box of the geometry of the faces (see Pipeline.applyDeviation).
+    # Returns: * PointCloud cloud = The point cloud.
+    """
+    if(cloud is None):
+        cloud = PointCloud()
+    for number, operation in enumerate(operations):
+        try:
+            applyOperation(cloud, objectList, operation, generator, workers, boundingBox)
+        except (ValueError, IndexError, TypeError, ZeroDivisionError) as error:
+            raise ValueError('operation ' + str(number + 1) + ' (' + str(operation.get('type')) + '): ' + str(error))
+    return cloud
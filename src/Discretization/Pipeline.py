@@ -0,0 +1,340 @@
+"""
+# Module: Pipeline.py
+# Description: This module applies the discretizations of the Discretize menus and the
+deviations of the Defects menus to a PointCloud without the user interface. Each operation is
+described by a dictionary with its type, the entity numbers of the faces (as shown in the
+Entities menu and in the logbook) and its parameters, so a sequence of operations can be read
+from a job file or a logbook and applied in order. The geometry that the menus take from the
+OpenCASCADE bounding box of the selected shapes is taken by default from the IGES geometry of
+the faces (see DiscretizeModel.faceBoundingBox), as OpenCASCADE may not be available; the user
+interface passes a bounding box function built from the shapes instead.
+# Author: Willian Hideak Arita da Silva.
+"""
+
+import math
+import numpy
+from Discretization.DiscretizeModel import pos, surfaceDimensions, facePlane, faceBoundingBox, \
+                                           discretizeModel, discretizeFace, discretizeSurface
+from Discretization.Deviations import translatePoints, rotatePoints, randomPoints, flexionPoints, \
+                                      torsionPoints, periodicPoints, ovalPoints, spindlePoints, axisIndex
+
+# The tool conditions of the spindle deviation, by their index in the network input:
+toolConditions = ['New', 'Worn']
+
+def faceIndexes(cloud, entities=None):
+    """
+    # Function: faceIndexes.
+    # Description: Finds the faces of the point cloud from their entity numbers.
+    # Parameters: * PointCloud cloud = The point cloud.
+                  * List entities = The entity numbers of the faces, or None for all the faces.
+    # Returns: * List = The index of each face in the point cloud.
+    """
+    if(entities is None):
+        return list(range(len(cloud)))
+    indexes = []
+    for entity in entities:
+        index = cloud.faceIndex(2*int(entity) - 1)
+        if(index == len(cloud)):
+            raise ValueError('entity ' + str(entity) + ' is not a discretized face')
+        indexes.append(index)
+    return indexes
+
+def pointsBoundingBox(cloud, indexes):
+    """
+    # Function: pointsBoundingBox.
+    # Description: Provides the bounding box of the points of some faces.
+    # Parameters: * PointCloud cloud = The point cloud.
+                  * List indexes = The indexes of the faces.
+    # Returns: * Array minimum = The (xMin, yMin, zMin) corner of the box.
+               * Array maximum = The (xMax, yMax, zMax) corner of the box.
+    """
+    points = numpy.concatenate([cloud.facePoints(i) for i in indexes] + [numpy.empty((0, 3))])
+    if(not len(points)):
+        raise ValueError('the selected faces have no points')
+    return points.min(axis=0), points.max(axis=0)
+
+def geometryBoundingBox(objectList):
+    """
+    # Function: geometryBoundingBox.
+    # Description: Provides a bounding box function that takes the box of some faces from their
+    IGES geometry, as the OpenCASCADE box of the shapes used by the menus.
+    # Parameters: * List objectList = A list of Entity objects obtained with the IGESImport module.
+    # Returns: * Function = The bounding box function, called as boundingBox(cloud, indexes).
+    """
+    def boundingBox(cloud, indexes):
+        if(not indexes):
+            raise ValueError('no faces were selected')
+        boxes = [faceBoundingBox(objectList[pos(cloud.sequenceNumbers[i])], cloud.sequenceNumbers[i], objectList)
+                 for i in indexes]
+        return numpy.min([box[0] for box in boxes], axis=0), numpy.max([box[1] for box in boxes], axis=0)
+    return boundingBox
+
+def checkAxes(deviation):
+    """
+    # Function: checkAxes.
+    # Description: Validates the longitudinal and perpendicular axes of a deviation.
+    # Parameters: * Dict deviation = The deviation, with the 'longAxis' and 'perpAxis' keys.
+    # Returns: * Tuple = The two axes, as 'x', 'y' or 'z'.
+    """
+    longAxis = str(deviation['longAxis']).lower()
+    perpAxis = str(deviation['perpAxis']).lower()
+    if(longAxis not in ('x', 'y', 'z') or perpAxis not in ('x', 'y', 'z')):
+        raise ValueError('the axes must be x, y or z')
+    if(longAxis == perpAxis):
+        raise ValueError('the longitudinal and perpendicular axes must be different')
+    return longAxis, perpAxis
+
+def translationDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: translationDeviation.
+    # Description: Moves the faces by the direction times the offset, as the Translational
+    menu, or by the normal vectors of their points times the offset when the direction is 'normal'.
+    # Parameters: * See applyDeviation. The deviation has the 'direction' and 'offset' keys and
+                  the optional 'normalize' key (False by default), which scales the direction to
+                  a unit vector first.
+    """
+    offset = float(deviation['offset'])
+    direction = deviation['direction']
+    if(not isinstance(direction, str)):
+        direction = numpy.asarray(direction, dtype=float)
+        if(direction.shape != (3,)):
+            raise ValueError('the direction must be an (x, y, z) vector or normal')
+        if(deviation.get('normalize', False)):
+            if(not numpy.linalg.norm(direction)):
+                raise ValueError('a normalized direction must not be zero')
+            direction = direction/numpy.linalg.norm(direction)
+    elif(direction.lower() != 'normal'):
+        raise ValueError('the direction must be an (x, y, z) vector or normal')
+    for i in indexes:
+        faceDirection = cloud.faceNormals(i) if isinstance(direction, str) else direction
+        cloud.setFacePoints(i, translatePoints(cloud.facePoints(i), faceDirection, offset))
+
+def rotationDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: rotationDeviation.
+    # Description: Rotates each face around the center of its bounding box.
+    # Parameters: * See applyDeviation. The deviation has the 'angles' key, with the rotation
+                  angles around the X, Y and Z axes in degrees.
+    """
+    xAngle, yAngle, zAngle = [float(angle) for angle in deviation['angles']]
+    for i in indexes:
+        minimum, maximum = boundingBox(cloud, [i])
+        cloud.setFacePoints(i, rotatePoints(cloud.facePoints(i), (minimum + maximum)/2, xAngle, yAngle, zAngle))
+
+def randomDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: randomDeviation.
+    # Description: Moves each point of the faces in a random direction.
+    # Parameters: * See applyDeviation. The deviation has the 'minOffset' and 'maxOffset' keys.
+    """
+    minOffset = float(deviation['minOffset'])
+    maxOffset = float(deviation['maxOffset'])
+    for i in indexes:
+        cloud.setFacePoints(i, randomPoints(cloud.facePoints(i), minOffset, maxOffset, generator))
+
+def flexionDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: flexionDeviation.
+    # Description: Bends the faces along their common bounding box.
+    # Parameters: * See applyDeviation. The deviation has the 'longAxis', 'perpAxis' and
+                  'maxDeflection' keys.
+    """
+    longAxis, perpAxis = checkAxes(deviation)
+    maxDeflection = float(deviation['maxDeflection'])
+    minimum, maximum = boundingBox(cloud, indexes)
+    start = minimum[axisIndex(longAxis)]
+    length = maximum[axisIndex(longAxis)] - start
+    for i in indexes:
+        cloud.setFacePoints(i, flexionPoints(cloud.facePoints(i), longAxis, perpAxis, start, length, maxDeflection))
+
+def torsionDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: torsionDeviation.
+    # Description: Twists the faces around the center of their common bounding box.
+    # Parameters: * See applyDeviation. The deviation has the 'longAxis', 'perpAxis' and
+                  'maxDeflection' keys.
+    """
+    longAxis, perpAxis = checkAxes(deviation)
+    maxDeflection = float(deviation['maxDeflection'])
+    minimum, maximum = boundingBox(cloud, indexes)
+    halfLength = (maximum - minimum)[axisIndex(longAxis)]/2
+    r = (maximum - minimum)[axisIndex(perpAxis)]/2
+    if(not r):
+        raise ValueError('the faces have no extent along the perpendicular axis')
+    maxAngle = math.atan(maxDeflection/r)
+    for i in indexes:
+        cloud.setFacePoints(i, torsionPoints(cloud.facePoints(i), (minimum + maximum)/2, longAxis, maxAngle, halfLength))
+
+def periodicDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: periodicDeviation.
+    # Description: Applies a sinusoidal pattern along the normal vectors of the faces.
+    # Parameters: * See applyDeviation. The deviation has the 'amplitude' and 'frequency' keys
+                  and the optional 'drillAxis' key (False by default), which applies the pattern
+                  along the points instead of along the rows of a parametric grid. The faces
+                  without a parametric grid, e.g. the planar faces, always use the points.
+    """
+    amplitude = float(deviation['amplitude'])
+    frequency = float(deviation['frequency'])
+    if(not frequency):
+        raise ValueError('the frequency must not be zero')
+    for i in indexes:
+        gridShape = cloud.gridShapes[i]
+        rowLength = 1 if deviation.get('drillAxis', False) or gridShape is None else gridShape[0]
+        cloud.setFacePoints(i, periodicPoints(cloud.facePoints(i), cloud.faceNormals(i), amplitude, frequency, rowLength))
+
+def ovalDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: ovalDeviation.
+    # Description: Flattens rounded faces discretized over their parametric surface.
+    # Parameters: * See applyDeviation. The deviation has the 'maxDeviation' key.
+    """
+    maxDeviation = float(deviation['maxDeviation'])
+    for i in indexes:
+        if(cloud.gridShapes[i] is None):
+            raise ValueError('entity ' + str((cloud.sequenceNumbers[i] + 1)//2) + ' is not a rounded face')
+        cloud.setFacePoints(i, ovalPoints(cloud.facePoints(i), cloud.faceNormals(i), maxDeviation, cloud.gridShapes[i][0]))
+
+def spindleDeviation(cloud, objectList, indexes, deviation, generator, boundingBox):
+    """
+    # Function: spindleDeviation.
+    # Description: Applies the diameter deviations of a turning operation predicted by the
+    trained spindle network.
+    # Parameters: * See applyDeviation. The deviation has the 'toolCondition' ('New' or 'Worn'),
+                  'depth', 'feed', 'spindle' and 'fixture' (the entity number of the planar
+                  fixture face) keys.
+    """
+    from Resources.NetworkRegistry import loadNetwork
+    toolCondition = deviation['toolCondition']
+    if(toolCondition not in toolConditions):
+        raise ValueError('the tool condition must be ' + ' or '.join(toolConditions))
+    fixture = 2*int(deviation['fixture']) - 1
+    A, B, C, D = facePlane(objectList[pos(fixture)], fixture, objectList)
+    for i in indexes:
+        sequence = cloud.sequenceNumbers[i]
+        diameter, length = surfaceDimensions(objectList[pos(sequence)], sequence, objectList)
+        network = loadNetwork('trainedANN_SpindleDefects_v0.net')
+        cloud.setFacePoints(i, spindlePoints(cloud.facePoints(i), cloud.faceNormals(i), network,
+                                             toolConditions.index(toolCondition), float(deviation['depth']),
+                                             float(deviation['feed']), float(deviation['spindle']),
+                                             diameter, length, (A, B, C, D)))
+
+# The deviations of rounded faces, applied by default to the faces with a parametric grid:
+roundedDeviations = ('oval', 'spindle')
+
+# The functions that apply each type of deviation:
+deviationFunctions = {
+    'translation': translationDeviation,
+    'rotation': rotationDeviation,
+    'random': randomDeviation,
+    'flexion': flexionDeviation,
+    'torsion': torsionDeviation,
+    'periodic': periodicDeviation,
+    'oval': ovalDeviation,
+    'spindle': spindleDeviation,
+}
+
+def applyDeviation(cloud, objectList, deviation, generator=None, boundingBox=None):
+    """
+    # Function: applyDeviation.
+    # Description: Applies a deviation to the faces of a point cloud, changing its points.
+    # Parameters: * PointCloud cloud = The point cloud.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  * Dict deviation = The deviation, with the 'type' key (see deviationFunctions),
+                  the optional 'entities' key (the entity numbers of the faces) and the parameters
+                  of its type. Without entities, the deviation is applied to all the faces, or to
+                  the faces discretized over a parametric grid for the roundedDeviations.
+                  * Generator generator = The numpy random generator used by random deviations.
+                  * Function boundingBox = The function giving the (minimum, maximum) corners of
+                  the bounding box of some faces, called as boundingBox(cloud, indexes). It
+                  defines the rotation center and the flexion and torsion dimensions. Defaults to
+                  the box of the geometry of the faces (see geometryBoundingBox); pointsBoundingBox
+                  gives the box of their points instead.
+    """
+    if(deviation.get('type') not in deviationFunctions):
+        raise ValueError('unknown deviation type: ' + str(deviation.get('type')))
+    indexes = faceIndexes(cloud, deviation.get('entities'))
+    if(deviation.get('entities') is None and deviation['type'] in roundedDeviations):
+        indexes = [i for i in indexes if cloud.gridShapes[i] is not None]
+    if(boundingBox is None):
+        boundingBox = geometryBoundingBox(objectList)
+    try:
+        deviationFunctions[deviation['type']](cloud, objectList, indexes, deviation, generator, boundingBox)
+    except KeyError as error:
+        raise ValueError('missing parameter of the ' + deviation['type'] + ' deviation: ' + str(error))
+
+def automaticDiscretization(cloud, objectList, operation, workers=1):
+    """
+    # Function: automaticDiscretization.
+    # Description: Discretizes all the faces of the model, as the Automatic discretization menu,
+    and appends them to the point cloud.
+    # Parameters: * PointCloud cloud = The point cloud.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  * Dict operation = The discretization, with the 'grid' (True for N x N points,
+                  False for N points/mm), 'density', 'precision' and the optional 'uParameter' and
+                  'vParameter' keys. The non-planar faces are discretized over their parametric
+                  surface when uParameter isn't None.
+                  * Int workers = The number of processes used to discretize the faces.
+    """
+    Uparam = operation.get('uParameter')
+    Vparam = operation.get('vParameter')
+    useParametric = Uparam is not None
+    cloud.extend(discretizeModel(objectList, float(operation['density']), float(operation['precision']),
+                                 int(Uparam) if useParametric else None, int(Vparam) if useParametric else None,
+                                 useParametric, bool(operation['grid']), workers))
+
+def flatDiscretization(cloud, objectList, operation, workers=1):
+    """
+    # Function: flatDiscretization.
+    # Description: Discretizes some planar faces, as the Flat discretization menu, and appends
+    them to the point cloud.
+    # Parameters: * See automaticDiscretization. The operation has the 'entities', 'grid',
+                  'density' and 'precision' keys.
+    """
+    for entity in operation['entities']:
+        sequence = 2*int(entity) - 1
+        points, normals = discretizeFace(objectList[pos(sequence)], objectList, float(operation['density']),
+                                         float(operation['precision']), bool(operation['grid']))
+        cloud.addFace(sequence, points, normals)
+
+def parametricDiscretization(cloud, objectList, operation, workers=1):
+    """
+    # Function: parametricDiscretization.
+    # Description: Discretizes some faces over their parametric surface, as the Parametric
+    discretization menu, and appends them to the point cloud.
+    # Parameters: * See automaticDiscretization. The operation has the 'entities', 'uParameter'
+                  and 'vParameter' keys.
+    """
+    for entity in operation['entities']:
+        sequence = 2*int(entity) - 1
+        points, normals, gridShape = discretizeSurface(objectList[pos(sequence)], objectList,
+                                                       int(operation['uParameter']), int(operation['vParameter']))
+        cloud.addFace(sequence, points, normals, gridShape)
+
+# The functions that apply each type of discretization:
+discretizationFunctions = {
+    'automatic': automaticDiscretization,
+    'flat': flatDiscretization,
+    'parametric': parametricDiscretization,
+}
+
+def applyOperation(cloud, objectList, operation, generator=None, workers=1, boundingBox=None):
+    """
+    # Function: applyOperation.
+    # Description: Applies a discretization or a deviation to a point cloud.
+    # Parameters: * PointCloud cloud = The point cloud.
+                  * List objectList = A list of Entity objects obtained with the IGESImport module.
+                  * Dict operation = The operation, with the 'type' key (see discretizationFunctions
+                  and deviationFunctions) and the parameters of its type.
+                  * Generator generator = The numpy random generator used by random deviations.
+                  * Int workers = The number of processes used by automatic discretizations.
+                  * Function boundingBox = The bounding box function of deviations (see
+                  applyDeviation).
+    """
+    if(operation.get('type') not in discretizationFunctions):
+        applyDeviation(cloud, objectList, operation, generator, boundingBox)
+        return
+    try:
+        discretizationFunctions[operation['type']](cloud, objectList, operation, workers)
+    except KeyError as error:
+        raise ValueError('missing parameter of the ' + operation['type'] + ' discretization: ' + str(error))
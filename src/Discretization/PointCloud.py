@@ -0,0 +1,242 @@
+"""
+# Module: PointCloud.py
+# Description: This module contains the PointCloud class, a container for the discretized
+points of a CAD model and their normal vectors, grouped by face.
+# Author: Willian Hideak Arita da Silva.
+"""
+
+import numpy
+
+class PointCloud(object):
+    """
+    # Class: PointCloud.
+    # Description: A point cloud grouped by face. The points and normal vectors of all the faces
+    are stored in two contiguous (N, 3) float arrays, and the points of the face i are the rows
+    offsets[i] to offsets[i+1] of these arrays. The faces also keep the sequence number of the
+    IGES face entity, the (nu, nv) grid shape of faces discretized over their parametric surface
+    (None for the other faces) and a flag telling if their normal vectors were reversed.
+    The arrays grow geometrically, so adding faces one by one takes amortized linear time.
+    """
+
+    def __init__(self):
+        """
+        # Method: __init__.
+        # Description: The init method for creating an empty point cloud.
+        """
+
+        self.sequenceNumbers = []
+        self.gridShapes = []
+        self.reversedNormals = []
+        self._points = numpy.empty((0, 3))
+        self._normals = numpy.empty((0, 3))
+        self._offsets = numpy.zeros(1, dtype=int)
+        self._size = 0
+
+    def __len__(self):
+        return len(self.sequenceNumbers)
+
+    @property
+    def points(self):
+        """
+        # Property: points.
+        # Description: A (N, 3) view of the points of all the faces.
+        """
+        return self._points[:self._size]
+
+    @property
+    def normals(self):
+        """
+        # Property: normals.
+        # Description: A (N, 3) view of the normal vectors of all the points.
+        """
+        return self._normals[:self._size]
+
+    @property
+    def offsets(self):
+        """
+        # Property: offsets.
+        # Description: An array with the index of the first point of each face, followed by the
+        total number of points.
+        """
+        return self._offsets[:len(self) + 1]
+
+    @property
+    def numPoints(self):
+        """
+        # Property: numPoints.
+        # Description: The total number of points of the cloud.
+        """
+        return self._size
+
+    def _reserve(self, numPoints, numFaces):
+        """
+        # Method: _reserve.
+        # Description: Grows the arrays, if necessary, to hold the given number of points and faces.
+        # Parameters: * Int numPoints = The number of points that must fit in the arrays.
+                      * Int numFaces = The number of faces that must fit in the offsets array.
+        """
+        if(numPoints > len(self._points)):
+            capacity = max(numPoints, 2*len(self._points), 1024)
+            for name in ('_points', '_normals'):
+                newArray = numpy.empty((capacity, 3))
+                newArray[:self._size] = getattr(self, name)[:self._size]
+                setattr(self, name, newArray)
+        if(numFaces + 1 > len(self._offsets)):
+            newOffsets = numpy.zeros(max(numFaces + 1, 2*len(self._offsets)), dtype=int)
+            newOffsets[:len(self) + 1] = self.offsets
+            self._offsets = newOffsets
+
+    def _checkFace(self, i):
+        """
+        # Method: _checkFace.
+        # Description: Raises an IndexError if there is no face with the given index.
+        # Parameters: * Int i = The index of the face.
+        """
+        if(not 0 <= i < len(self)):
+            raise IndexError('face index out of range')
+
+    def addFace(self, sequenceNumber, points, normals, gridShape=None, reversedNormals=False):
+        """
+        # Method: addFace.
+        # Description: Appends the points of a face to the point cloud.
+        # Parameters: * Int sequenceNumber = The sequence number of the IGES face entity.
+                      * Array points = A (N, 3) array or a list of points (tuples).
+                      * Array normals = A (N, 3) array or a list of normal vectors, one for each point.
+                      * Tuple gridShape = The (nu, nv) grid shape of the points, or None.
+                      * Boolean reversedNormals = True if the normal vectors were reversed.
+        """
+        points = numpy.asarray(points, dtype=float).reshape(-1, 3)
+        normals = numpy.asarray(normals, dtype=float).reshape(-1, 3)
+        if(len(points) != len(normals)):
+            raise ValueError('the number of points and normal vectors must be the same')
+        numFaces = len(self)
+        self._reserve(self._size + len(points), numFaces + 1)
+        self._points[self._size:self._size + len(points)] = points
+        self._normals[self._size:self._size + len(points)] = normals
+        self._size += len(points)
+        self._offsets[numFaces + 1] = self._size
+        self.sequenceNumbers.append(sequenceNumber)
+        self.gridShapes.append(None if gridShape is None else tuple(gridShape))
+        self.reversedNormals.append(reversedNormals)
+
+    def extend(self, other):
+        """
+        # Method: extend.
+        # Description: Appends all the faces of another point cloud.
+        # Parameters: * PointCloud other = The point cloud to be appended.
+        """
+        for i in range(len(other)):
+            self.addFace(other.sequenceNumbers[i], other.facePoints(i), other.faceNormals(i),
+                         other.gridShapes[i], other.reversedNormals[i])
+
+    def copy(self):
+        """
+        # Method: copy.
+        # Description: Provides an independent copy of the point cloud.
+        # Returns: * PointCloud = The copy.
+        """
+        cloud = PointCloud()
+        cloud.extend(self)
+        return cloud
+
+    def faceIndex(self, sequenceNumber):
+        """
+        # Method: faceIndex.
+        # Description: Finds the first face of the point cloud with the given sequence number.
+        # Parameters: * Int sequenceNumber = The sequence number of the IGES face entity.
+        # Returns: * Int = The index of the face, or len(self) if the face isn't in the point cloud,
+                   so accessing it raises an IndexError.
+        """
+        try:
+            return self.sequenceNumbers.index(sequenceNumber)
+        except ValueError:
+            return len(self)
+
+    def facePoints(self, i):
+        """
+        # Method: facePoints.
+        # Description: Provides the points of a face. The result is a view, so changing its values
+        changes the point cloud.
+        # Parameters: * Int i = The index of the face.
+        # Returns: * Array = A (n, 3) view of the points of the face.
+        """
+        self._checkFace(i)
+        return self._points[self._offsets[i]:self._offsets[i + 1]]
+
+    def faceNormals(self, i):
+        """
+        # Method: faceNormals.
+        # Description: Provides the normal vectors of a face. The result is a view, so changing its
+        values changes the point cloud.
+        # Parameters: * Int i = The index of the face.
+        # Returns: * Array = A (n, 3) view of the normal vectors of the face.
+        """
+        self._checkFace(i)
+        return self._normals[self._offsets[i]:self._offsets[i + 1]]
+
+    def setFacePoints(self, i, points):
+        """
+        # Method: setFacePoints.
+        # Description: Replaces the points of a face by new ones. The number of points must be kept.
+        # Parameters: * Int i = The index of the face.
+                      * Array points = A (n, 3) array or a list of points (tuples).
+        """
+        self.facePoints(i)[:] = numpy.asarray(points, dtype=float).reshape(-1, 3)
+
+    def reverseNormals(self, i):
+        """
+        # Method: reverseNormals.
+        # Description: Reverses the normal vectors of a face and toggles its reversedNormals flag.
+        # Parameters: * Int i = The index of the face.
+        """
+        numpy.negative(self.faceNormals(i), out=self.faceNormals(i))
+        self.reversedNormals[i] = not self.reversedNormals[i]
+
+    def removeFace(self, i):
+        """
+        # Method: removeFace.
+        # Description: Removes a face and all of its points from the point cloud.
+        # Parameters: * Int i = The index of the face.
+        """
+        self._checkFace(i)
+        start, end = self._offsets[i], self._offsets[i + 1]
+        self._removeRows(start, end)
+        numFaces = len(self)
+        self._offsets[i + 1:numFaces] = self._offsets[i + 2:numFaces + 1] - (end - start)
+        del self.sequenceNumbers[i]
+        del self.gridShapes[i]
+        del self.reversedNormals[i]
+
+    def removePoint(self, i, j):
+        """
+        # Method: removePoint.
+        # Description: Removes a single point of a face. The face loses its grid shape.
+        # Parameters: * Int i = The index of the face.
+                      * Int j = The index of the point inside the face.
+        """
+        self._checkFace(i)
+        if(not 0 <= j < self._offsets[i + 1] - self._offsets[i]):
+            raise IndexError('point index out of range')
+        row = self._offsets[i] + j
+        self._removeRows(row, row + 1)
+        self._offsets[i + 1:len(self) + 1] -= 1
+        self.gridShapes[i] = None
+
+    def _removeRows(self, start, end):
+        """
+        # Method: _removeRows.
+        # Description: Removes the rows start to end of the points and normal vectors arrays.
+        # Parameters: * Int start = The first row to be removed.
+                      * Int end = The row after the last one to be removed.
+        """
+        count = end - start
+        self._points[start:self._size - count] = self._points[end:self._size]
+        self._normals[start:self._size - count] = self._normals[end:self._size]
+        self._size -= count
+
+    def clear(self):
+        """
+        # Method: clear.
+        # Description: Removes all the faces of the point cloud.
+        """
+        self.__init__()
@@ -5,6 +5,8 @@ if a given point (x, y) lies inside a polygon with a tuple of vertices 'poly'.
 # Author: Willian Hideak Arita da Silva.
 """
 
+import numpy
+
 def pointInPolygon(x, y, poly):
     """
     # Function: pointInPolygon.
@@ -27,3 +29,111 @@ def pointInPolygon(x, y, poly):
                 result = not result
             j = i
     return result
+
+def scanlineRuns(xValues, yValues, poly):
+    """
+    # Function: scanlineRuns.
+    # Description: This function rasterizes a polygon over a rectilinear grid using the Even-Odd
+    Rule. For each grid row it computes the edge crossings with the same expression used by
+    pointInPolygon and returns only the runs of grid columns that lie inside the polygon.
+    # Parameters: * Array xValues = The sorted X coordinates of the grid columns.
+                  * Array yValues = The sorted Y coordinates of the grid rows.
+                  * List poly = A list of tuples, each tuple being a polygon vertex.
+    # Returns: * Array rows = The grid row of each run.
+               * Array starts = The first grid column of each run.
+               * Array ends = The grid column after the last one of each run.
+    """
+
+    rowList = []
+    columnList = []
+    num = len(poly)
+    j = num - 1
+    # Computing the crossings of each edge with the grid rows it spans:
+    for i in range(num):
+        yi, yj = poly[i][1], poly[j][1]
+        if yi != yj:
+            first = numpy.searchsorted(yValues, min(yi, yj), 'left')
+            last = numpy.searchsorted(yValues, max(yi, yj), 'left')
+            if first < last:
+                y = yValues[first:last]
+                crossing = (poly[j][0] - poly[i][0]) * (y - poly[i][1]) / \
+                           (poly[j][1] - poly[i][1]) + poly[i][0]
+                # A column is to the left of the crossing when x < crossing:
+                columnList.append(numpy.searchsorted(xValues, crossing, 'left'))
+                rowList.append(numpy.arange(first, last))
+        j = i
+    if not rowList:
+        empty = numpy.zeros(0, dtype=int)
+        return empty, empty, empty
+    rows = numpy.concatenate(rowList)
+    columns = numpy.concatenate(columnList)
+
+    # Sorting the crossings along each row. A column is inside when an odd number of crossings
+    # lies to its right, so each run ends at a crossing with an even number of crossings after
+    # it and starts at the preceding crossing (or at the first column):
+    order = numpy.lexsort((columns, rows))
+    rows = rows[order]
+    columns = columns[order]
+    counts = numpy.bincount(rows)
+    rowStarts = numpy.cumsum(counts) - counts
+    position = numpy.arange(len(rows)) - rowStarts[rows]
+    isEnd = (counts[rows] - 1 - position) % 2 == 0
+    previous = numpy.concatenate(([0], columns[:-1]))
+    starts = numpy.where(position > 0, previous, 0)[isEnd]
+    ends = columns[isEnd]
+    rows = rows[isEnd]
+    valid = starts < ends
+    return rows[valid], starts[valid], ends[valid]
+
+def gridPointsInFace(xValues, yValues, outerPoly, innerPolys=()):
+    """
+    # Function: gridPointsInFace.
+    # Description: This function finds the points of a rectilinear grid that lie inside a face,
+    i.e. inside its outer boundary and outside all of its holes. The grid is filled row by row
+    with scanlineRuns, so the work done depends on the number of points inside the face and not
+    on the size of the grid. The result is the same as testing every grid point with pointInPolygon
+against the outer boundary and each hole.
+    # Parameters: * Array xValues = The sorted X coordinates of the grid columns.
+                  * Array yValues = The sorted Y coordinates of the grid rows.
+                  * List outerPoly = A list of tuples, each tuple being a vertex of the outer boundary.
+                  * List innerPolys = A list of polygons, one for each hole of the face.
+    # Returns: * Array columns = The grid column of each inside point.
+               * Array rows = The grid row of each inside point.
+               The points are ordered by column and then by row.
+    """
+
+    xValues = numpy.asarray(xValues, dtype=float)
+    yValues = numpy.asarray(yValues, dtype=float)
+    rows, starts, ends = scanlineRuns(xValues, yValues, outerPoly)
+
+    if innerPolys and len(rows):
+        # Subtracting the holes from the outer runs by sweeping the run boundaries of each row:
+        rowList, positionList, outerList, holeList = [rows, rows], [starts, ends], [], []
+        outerList += [numpy.ones(len(rows), dtype=int), -numpy.ones(len(rows), dtype=int)]
+        holeList += [numpy.zeros(2*len(rows), dtype=int)]
+        for poly in innerPolys:
+            holeRows, holeStarts, holeEnds = scanlineRuns(xValues, yValues, poly)
+            rowList += [holeRows, holeRows]
+            positionList += [holeStarts, holeEnds]
+            outerList += [numpy.zeros(2*len(holeRows), dtype=int)]
+            holeList += [numpy.ones(len(holeRows), dtype=int), -numpy.ones(len(holeRows), dtype=int)]
+        eventRows = numpy.concatenate(rowList)
+        eventPositions = numpy.concatenate(positionList)
+        order = numpy.lexsort((eventPositions, eventRows))
+        eventRows = eventRows[order]
+        eventPositions = eventPositions[order]
+        outerCount = numpy.cumsum(numpy.concatenate(outerList)[order])
+        holeCount = numpy.cumsum(numpy.concatenate(holeList)[order])
+        inside = (outerCount[:-1] > 0) & (holeCount[:-1] == 0) & \
+                 (eventRows[:-1] == eventRows[1:]) & (eventPositions[:-1] < eventPositions[1:])
+        rows = eventRows[:-1][inside]
+        starts = eventPositions[:-1][inside]
+        ends = eventPositions[1:][inside]
+
+    # Expanding the runs into grid indexes:
+    lengths = ends - starts
+    offsets = numpy.cumsum(lengths) - lengths
+    rows = numpy.repeat(rows, lengths)
+    columns = numpy.arange(lengths.sum()) - numpy.repeat(offsets - starts, lengths)
+    order = numpy.lexsort((rows, columns))
+    return columns[order], rows[order]
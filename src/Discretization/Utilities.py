@@ -12,7 +12,10 @@
 """
 
 import decimal
+import functools
 import math
+import numpy
+from collections import OrderedDict
 
 
 # A float range function, implementation of http://stackoverflow.com/a/7267280
@@ -35,6 +38,31 @@ def frange(x, y, step):
         x += step
 
 
+# Generates evenly spaced parameters between 0 and 1
+@functools.lru_cache(maxsize=64)
+def sample_params(delta=0.1, endpoints=True):
+    """ Generates evenly spaced parameters between 0 and 1 for the given evaluation delta.
+
+    The [0, 1] interval is divided into ``round(1 / delta)`` intervals with ``numpy.linspace``. Unlike :func:`.frange`,
+    the number of parameters never depends on the rounding of the accumulated steps: there are always
+    ``round(1 / delta) + 1`` parameters, or ``round(1 / delta) - 1`` without the end points. The arrays are cached and
+    shared by all evaluators, so they are read-only.
+
+    :param delta: evaluation delta
+    :type delta: float
+    :param endpoints: if False, 0 and 1 are not included
+    :type endpoints: boolean
+    :return: parameters
+    :rtype: numpy.ndarray
+    """
+    num_intervals = max(int(round(1.0 / delta)), 1)
+    params = numpy.linspace(0.0, 1.0, num_intervals + 1)
+    if not endpoints:
+        params = params[1:-1].copy()
+    params.setflags(write=False)
+    return params
+
+
 # Normalizes knot vector (internal functionality)
 def knotvector_normalize(knotvector=()):
     """ Normalizes the input knot vector between 0 and 1.
@@ -132,6 +160,35 @@ def find_span(degree=0, knotvector=(), num_ctrlpts=0, knot=0, tol=0.001):
     return mid
 
 
+# Algorithm A2.1 - vectorized (internal functionality)
+def find_spans(degree=0, knotvector=(), num_ctrlpts=0, knots=(), tol=0.001):
+    """ Vectorized version of Algorithm A2.1 of The NURBS Book by Piegl & Tiller.
+
+    Finds the knot spans of all input parameters at once. The results are the same as calling
+    :func:`.find_span()` for each parameter.
+
+    :param degree: degree of the knot vector direction
+    :type degree: integer
+    :param knotvector: knot vector
+    :type knotvector: tuple
+    :param num_ctrlpts: number of control points on that direction
+    :type num_ctrlpts: integer
+    :param knots: parameters to be evaluated
+    :type knots: list, tuple or numpy.ndarray
+    :return: knot span of each parameter
+    :rtype: numpy.ndarray
+    """
+    knotvector = numpy.asarray(knotvector, dtype=float)
+    knots = numpy.asarray(knots, dtype=float)
+    n = num_ctrlpts - 1
+    # The last span containing each knot is the one where knotvector[span] <= knot < knotvector[span + 1]
+    spans = numpy.searchsorted(knotvector, knots, side='right') - 1
+    spans = numpy.clip(spans, degree, n)
+    # Knots close to the end of the knot vector belong to the last span
+    spans[numpy.abs(knotvector[n + 1] - knots) <= tol] = n
+    return spans
+
+
 # Finds knot multiplicity (internal functionality)
 def find_multiplicity(knot=-1, knotvector=(), tol=0.001):
     """ Finds knot multiplicity."""
@@ -168,6 +225,47 @@ def basis_functions(degree=0, knotvector=(), span=0, knot=0):
     return N
 
 
+# Algorithm A2.2 - vectorized (internal functionality)
+def basis_functions_batch(degree=0, knotvector=(), spans=(), knots=()):
+    """ Vectorized version of Algorithm A2.2 of The NURBS Book by Piegl & Tiller.
+
+    Computes the non-vanishing basis functions of all input parameters at once, following the same
+    sequence of operations of :func:`.basis_functions()`.
+
+    :param degree: degree of the knot vector direction
+    :type degree: integer
+    :param knotvector: knot vector
+    :type knotvector: tuple
+    :param spans: knot span of each parameter, as returned by :func:`.find_spans()`
+    :type spans: numpy.ndarray
+    :param knots: parameters to be evaluated
+    :type knots: list, tuple or numpy.ndarray
+    :return: basis functions matrix, one row of (degree + 1) values for each parameter
+    :rtype: numpy.ndarray
+    """
+    knotvector = numpy.asarray(knotvector, dtype=float)
+    spans = numpy.asarray(spans, dtype=int)
+    knots = numpy.asarray(knots, dtype=float)
+    left = numpy.zeros((degree + 1, knots.size))
+    right = numpy.zeros((degree + 1, knots.size))
+    N = numpy.zeros((degree + 1, knots.size))
+
+    # N[0] = 1.0 by definition
+    N[0] = 1.0
+
+    for j in range(1, degree+1):
+        left[j] = knots - knotvector[spans+1-j]
+        right[j] = knotvector[spans+j] - knots
+        saved = 0.0
+        for r in range(0, j):
+            temp = N[r] / (right[r+1] + left[j-r])
+            N[r] = saved + right[r+1] * temp
+            saved = left[j-r] * temp
+        N[j] = saved
+
+    return numpy.ascontiguousarray(N.T)
+
+
 # Algorithm A2.2 - modified (internal functionality)
 def basis_functions_all(degree=0, knotvector=(), span=0, knot=0):
     """ A modified version of Algorithm A2.2 of The NURBS Book by Piegl & Tiller."""
@@ -257,6 +355,223 @@ def basis_functions_ders(degree=0, knotvector=(), span=0, knot=0, order=0):
     return ders
 
 
+# Algorithm A2.3 - vectorized (internal functionality)
+def basis_functions_ders_batch(degree=0, knotvector=(), spans=(), knots=(), order=0):
+    """ Vectorized version of Algorithm A2.3 of The NURBS Book by Piegl & Tiller.
+
+    Computes the non-vanishing basis functions and their derivatives for all input parameters at once,
+    following the same sequence of operations of :func:`.basis_functions_ders()`.
+
+    :param degree: degree of the knot vector direction
+    :type degree: integer
+    :param knotvector: knot vector
+    :type knotvector: tuple
+    :param spans: knot span of each parameter, as returned by :func:`.find_spans()`
+    :type spans: numpy.ndarray
+    :param knots: parameters to be evaluated
+    :type knots: list, tuple or numpy.ndarray
+    :param order: derivative order
+    :type order: integer
+    :return: array ders, where ders[k] is the matrix of k-th derivatives, one row of (degree + 1) values for each parameter
+    :rtype: numpy.ndarray
+    """
+    knotvector = numpy.asarray(knotvector, dtype=float)
+    spans = numpy.asarray(spans, dtype=int)
+    knots = numpy.asarray(knots, dtype=float)
+    num_knots = knots.size
+    left = numpy.zeros((degree + 1, num_knots))
+    right = numpy.zeros((degree + 1, num_knots))
+    ndu = numpy.zeros((degree + 1, degree + 1, num_knots))
+
+    # N[0][0] = 1.0 by definition
+    ndu[0][0] = 1.0
+
+    for j in range(1, degree+1):
+        left[j] = knots - knotvector[spans+1-j]
+        right[j] = knotvector[spans+j] - knots
+        saved = 0.0
+        for r in range(0, j):
+            # Lower triangle
+            ndu[j][r] = right[r+1] + left[j-r]
+            temp = ndu[r][j-1] / ndu[j][r]
+            # Upper triangle
+            ndu[r][j] = saved + (right[r+1] * temp)
+            saved = left[j-r] * temp
+        ndu[j][j] = saved
+
+    # Load the basis functions
+    ders = numpy.zeros((min(degree, order) + 1, degree + 1, num_knots))
+    for j in range(0, degree+1):
+        ders[0][j] = ndu[j][degree]
+
+    # Start calculating derivatives
+    a = numpy.zeros((2, degree + 1, num_knots))
+    # Loop over function index
+    for r in range(0, degree+1):
+        # Alternate rows in array a
+        s1 = 0
+        s2 = 1
+        a[0][0] = 1.0
+        # Loop to compute k-th derivative
+        for k in range(1, min(degree, order)+1):
+            d = numpy.zeros(num_knots)
+            rk = r - k
+            pk = degree - k
+            if r >= k:
+                a[s2][0] = a[s1][0] / ndu[pk+1][rk]
+                d = a[s2][0] * ndu[rk][pk]
+            if rk >= -1:
+                j1 = 1
+            else:
+                j1 = -rk
+            if (r - 1) <= pk:
+                j2 = k - 1
+            else:
+                j2 = degree - r
+            for j in range(j1, j2+1):
+                a[s2][j] = (a[s1][j] - a[s1][j-1]) / ndu[pk+1][rk+j]
+                d = d + (a[s2][j] * ndu[rk+j][pk])
+            if r <= pk:
+                a[s2][k] = -a[s1][k-1] / ndu[pk+1][r]
+                d = d + (a[s2][k] * ndu[r][pk])
+            ders[k][r] = d
+
+            # Switch rows
+            j = s1
+            s1 = s2
+            s2 = j
+
+    # Multiply through by the the correct factors
+    r = float(degree)
+    for k in range(1, min(degree, order)+1):
+        ders[k] *= r
+        r *= (degree - k)
+
+    # Return the basis function derivatives, one row for each parameter
+    return numpy.ascontiguousarray(ders.transpose(0, 2, 1))
+
+
+# LRU cache of basis function tables
+class BasisCache(object):
+    """ A bounded cache of basis function tables with least-recently-used eviction.
+
+    The tables are keyed by (degree, number of control points, normalized knot vector, derivative
+    order, sample parameters), so surfaces sharing the same parametrization in one direction reuse the
+    spans and basis function matrices computed by :func:`.find_spans()` and
+    :func:`.basis_functions_ders_batch()`. The cached arrays are read-only.
+
+    :param maxsize: maximum number of cached tables
+    :type maxsize: integer
+    """
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("Cache size should be at least 1.")
+        self._mMaxSize = int(maxsize)
+        self._mTables = OrderedDict()
+        self._mHits = 0
+        self._mMisses = 0
+
+    @property
+    def maxsize(self):
+        """ Maximum number of cached tables
+
+        :getter: Gets the maximum number of cached tables
+        :setter: Sets the maximum number of cached tables, evicting the least recently used ones if necessary
+        :type: integer
+        """
+        return self._mMaxSize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        if value < 1:
+            raise ValueError("Cache size should be at least 1.")
+        self._mMaxSize = int(value)
+        while len(self._mTables) > self._mMaxSize:
+            self._mTables.popitem(last=False)
+
+    @property
+    def hits(self):
+        """ Number of lookups answered from the cache
+
+        :getter: Gets the number of cache hits
+        :type: integer
+        """
+        return self._mHits
+
+    @property
+    def misses(self):
+        """ Number of lookups which computed a new table
+
+        :getter: Gets the number of cache misses
+        :type: integer
+        """
+        return self._mMisses
+
+    def __len__(self):
+        return len(self._mTables)
+
+    # Returns the cache statistics
+    def info(self):
+        """ Returns the cache statistics.
+
+        :return: hits, misses, current size and maximum size of the cache
+        :rtype: dict
+        """
+        return {'hits': self._mHits, 'misses': self._mMisses,
+                'size': len(self._mTables), 'maxsize': self._mMaxSize}
+
+    # Removes all the tables and resets the counters
+    def clear(self):
+        """ Removes all the cached tables and resets the hit and miss counters.
+
+        :return: None
+        """
+        self._mTables.clear()
+        self._mHits = 0
+        self._mMisses = 0
+
+    # Gets the basis function tables, computing them if necessary
+    def lookup(self, degree=0, knotvector=(), num_ctrlpts=0, knots=(), order=0):
+        """ Gets the spans and the basis function derivatives of the input parameters.
+
+        :param degree: degree of the knot vector direction
+        :type degree: integer
+        :param knotvector: normalized knot vector
+        :type knotvector: tuple
+        :param num_ctrlpts: number of control points on that direction
+        :type num_ctrlpts: integer
+        :param knots: parameters to be evaluated
+        :type knots: list, tuple or numpy.ndarray
+        :param order: derivative order
+        :type order: integer
+        :return: spans array and basis function derivatives array, as returned by :func:`.find_spans()` and :func:`.basis_functions_ders_batch()`
+        :rtype: tuple
+        """
+        knots = numpy.ascontiguousarray(knots, dtype=float).ravel()
+        key = (int(degree), int(num_ctrlpts), tuple(float(kv) for kv in knotvector), int(order),
+               knots.size, knots.tobytes())
+        tables = self._mTables.get(key)
+        if tables is not None:
+            self._mHits += 1
+            self._mTables.move_to_end(key)
+            return tables
+
+        self._mMisses += 1
+        spans = find_spans(degree, knotvector, num_ctrlpts, knots)
+        ders = basis_functions_ders_batch(degree, knotvector, spans, knots, order)
+        spans.setflags(write=False)
+        ders.setflags(write=False)
+        tables = (spans, ders)
+        self._mTables[key] = tables
+        if len(self._mTables) > self._mMaxSize:
+            self._mTables.popitem(last=False)
+        return tables
+
+
+# Shared basis function tables cache used by the Curve and Surface classes
+basis_cache = BasisCache()
+
+
 # Checks if the input (u, v) values are valid (internal functionality)
 def check_uv(u=-1, v=-1, test_normal=False, delta=0.1):
     """ Checks if the input (u, v) values are valid."""
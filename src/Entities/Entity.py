@@ -15,6 +15,9 @@ class Entity(object):
     # Static Property
     numEntities = 0
 
+    # Fixed set of properties (subclasses may define their own slots)
+    __slots__ = ('entityType', 'PDPointer', 'parCount', 'seqNumber')
+
     # Getting global parameters
     def __init__(self, entityType, PDPointer, parCount, seqNumber):
         """
@@ -5,6 +5,7 @@ to store data from IGES Entities, such as points, planes, surfaces and more.
 # Author: Willian Hideak Arita da Silva.
 """
 
+import numpy
 from Entities.Entity import Entity
 
 # Class: RationalBSplineCurve
@@ -14,9 +15,14 @@ from Entities.Entity import Entity
 class RationalBSplineCurve(Entity):
     """
     # Class: RationalBSplineCurve.
-    # Description: This class contains data from Rational B-Spline Curves.
+    # Description: This class contains data from Rational B-Spline Curves. The knot sequence is
+    stored as an array and the control points as a (K+1, 4) array of (x, y, z, w) values;
+    XList, YList, ZList and WList are views of this control polygon.
     """
 
+    __slots__ = ('K', 'M', 'PROP1', 'PROP2', 'PROP3', 'PROP4', 'TList', 'net',
+                 'V0', 'V1', 'XNORM', 'YNORM', 'ZNORM')
+
     # Defining Properties
     def __init__ (self, entityType, PDPointer, parCount, seqNumber, \
                   K, M, PROP1, PROP2, PROP3, PROP4, TList, WList, XList, YList, ZList, \
@@ -35,11 +41,11 @@ class RationalBSplineCurve(Entity):
                       * Str PROP2 = Flag for checking if the curve is closed.
                       * Str PROP3 = Flag for checking if it is Rational or Polynomial.
                       * Str PROP4 = Flag for checking if it is periodic.
-                      * List TList = List of the Knot Sequence.
-                      * List WList = List of weights.
-                      * List XList = List control points (coordinate X).
-                      * List YList = List control points (coordinate Y).
-                      * List ZList = List control points (coordinate Z).
+                      * List TList = List or array of the Knot Sequence.
+                      * List WList = List or array of weights.
+                      * List XList = List or array of control points (coordinate X).
+                      * List YList = List or array of control points (coordinate Y).
+                      * List ZList = List or array of control points (coordinate Z).
                       * Str V0 = Starting parameter value.
                       * Str V1 = Ending parameter value.
                       * Str XNORM = Unit normal (coordinate X).
@@ -54,17 +60,50 @@ class RationalBSplineCurve(Entity):
         self.PROP2 = PROP2
         self.PROP3 = PROP3
         self.PROP4 = PROP4
-        self.TList = TList
-        self.WList = WList
+        self.TList = numpy.array(TList, dtype=float)
+        self.net = numpy.empty((int(K)+1, 4))
         self.XList = XList
         self.YList = YList
         self.ZList = ZList
+        self.WList = WList
         self.V0 = V0
         self.V1 = V1
         self.XNORM = XNORM
         self.YNORM = YNORM
         self.ZNORM = ZNORM
 
+    @property
+    def XList(self):
+        return self.net[:, 0]
+
+    @XList.setter
+    def XList(self, value):
+        self.net[:, 0] = value
+
+    @property
+    def YList(self):
+        return self.net[:, 1]
+
+    @YList.setter
+    def YList(self, value):
+        self.net[:, 1] = value
+
+    @property
+    def ZList(self):
+        return self.net[:, 2]
+
+    @ZList.setter
+    def ZList(self, value):
+        self.net[:, 2] = value
+
+    @property
+    def WList(self):
+        return self.net[:, 3]
+
+    @WList.setter
+    def WList(self, value):
+        self.net[:, 3] = value
+
     def description(self):
         """
         # Method: description.
@@ -5,14 +5,20 @@ to store data from IGES Entities, such as points, planes, surfaces and more.
 # Author: Willian Hideak Arita da Silva.
 """
 
+import numpy
 from Entities.Entity import Entity
 
 class RationalBSplineSurface(Entity):
     """
     # Class: RationalBSplineSurface
-    # Description: This class contains data from Rational B-Spline Surfaces.
+    # Description: This class contains data from Rational B-Spline Surfaces. The knot sequences
+    are stored as arrays and the control points as a (K1+1, K2+1, 4) array of (x, y, z, w)
+    values; XList, YList, ZList and WList are views of this control net.
     """
 
+    __slots__ = ('K1', 'K2', 'M1', 'M2', 'PROP1', 'PROP2', 'PROP3', 'PROP4', 'PROP5',
+                 'SList', 'TList', 'net', 'U0', 'U1', 'V0', 'V1')
+
     # Defining Prpoerties
     def __init__(self, entityType, PDPointer, parCount, seqNumber, \
                  K1, K2, M1, M2, PROP1, PROP2, PROP3, PROP4, PROP5, \
@@ -34,12 +40,12 @@ class RationalBSplineSurface(Entity):
                       * Str PROP3 = Flag for checking if it is Rational or Polynomial.
                       * Str PROP4 = Flag for checking if it is periodic in U direction.
                       * Str PROP5 = Flag for checking if it is periodic in V direction.
-                      * List SList = List of the first Knot Sequence.
-                      * List TList = List of the second Knot Sequence.
-                      * List WList = List of weights.
-                      * List XList = List control points (coordinate X).
-                      * List YList = List control points (coordinate Y).
-                      * List ZList = List control points (coordinate Z).
+                      * List SList = List or array of the first Knot Sequence.
+                      * List TList = List or array of the second Knot Sequence.
+                      * List WList = Nested list or (K1+1, K2+1) array of weights.
+                      * List XList = Nested list or (K1+1, K2+1) array of control points (coordinate X).
+                      * List YList = Nested list or (K1+1, K2+1) array of control points (coordinate Y).
+                      * List ZList = Nested list or (K1+1, K2+1) array of control points (coordinate Z).
                       * Str U0 = Starting parameter value in U direction.
                       * Str U1 = Ending parameter value in U direction.
                       * Str V0 = Starting parameter value in V direction.
@@ -56,17 +62,50 @@ class RationalBSplineSurface(Entity):
         self.PROP3 = PROP3
         self.PROP4 = PROP4
         self.PROP5 = PROP5
-        self.SList = SList
-        self.TList = TList
-        self.WList = WList
+        self.SList = numpy.array(SList, dtype=float)
+        self.TList = numpy.array(TList, dtype=float)
+        self.net = numpy.empty((int(K1)+1, int(K2)+1, 4))
         self.XList = XList
         self.YList = YList
         self.ZList = ZList
+        self.WList = WList
         self.U0 = U0
         self.U1 = U1
         self.V0 = V0
         self.V1 = V1
 
+    @property
+    def XList(self):
+        return self.net[:, :, 0]
+
+    @XList.setter
+    def XList(self, value):
+        self.net[:, :, 0] = value
+
+    @property
+    def YList(self):
+        return self.net[:, :, 1]
+
+    @YList.setter
+    def YList(self, value):
+        self.net[:, :, 1] = value
+
+    @property
+    def ZList(self):
+        return self.net[:, :, 2]
+
+    @ZList.setter
+    def ZList(self, value):
+        self.net[:, :, 2] = value
+
+    @property
+    def WList(self):
+        return self.net[:, :, 3]
+
+    @WList.setter
+    def WList(self, value):
+        self.net[:, :, 3] = value
+
     def description(self):
         out = ('(' + str(int(self.seqNumber)//2+1) + ') B-Spline Surface (IGES 128)', [])
         out[1].append(('- Upper Index of First Sum (K1): ' + str(self.K1), []))
@@ -5,6 +5,10 @@ file, such as geometrical entities.
 # Author: Willian Hideak Arita da Silva.
 """
 
+import mmap
+import re
+import warnings
+import numpy
 from Import.LoadEdgeList import loadEdgeList
 from Import.LoadFace import loadFace
 from Import.LoadLoop import loadLoop
@@ -39,6 +43,149 @@ def convertData(data):
         except ValueError:
             return data
 
+# Entity types that can be loaded as Python objects (see loadSingleEntity)
+supportedEntityTypes = (186, 514, 510, 508, 126, 128, 502, 504)
+
+# Pattern of a Hollerith constant prefix (e.g. '8H'), possibly preceded by blanks
+hollerithPattern = re.compile(r' *([0-9]+)H')
+
+def getDelimiters(RawHeader):
+    """
+    # Function: getDelimiters.
+    # Description: Function to retrieve the parameter and record delimiters defined in the
+    first two fields of the Global Section of an IGES file.
+    # Parameters: * List RawHeader = A list of strings containing each line of the Global Section.
+    # Returns: * Tuple = The parameter delimiter and the record delimiter characters.
+    """
+
+    header = ''.join([line[0:72] for line in RawHeader]).lstrip()
+    parameterDelimiter, recordDelimiter = ',', ';'
+    if header[0:2] == '1H':
+        parameterDelimiter = header[2]
+        header = header[3:]
+    header = header[1:].lstrip()
+    if header[0:2] == '1H':
+        recordDelimiter = header[2]
+    return parameterDelimiter, recordDelimiter
+
+def tokenizeParameters(parameterString, parameterDelimiter=',', recordDelimiter=';'):
+    """
+    # Function: tokenizeParameters.
+    # Description: Function to split the parameter data of an entity into tokens, up to the
+    record delimiter. Blanks are removed from every token except from Hollerith constants,
+    whose contents are kept intact even if they contain delimiters.
+    # Parameters: * Str parameterString = The parameter data of an entity (columns 1-64 of
+                  its Parameter Section lines).
+                  * Str parameterDelimiter = The parameter delimiter character.
+                  * Str recordDelimiter = The record delimiter character.
+    # Returns: * List tokens = A list of strings, one for each parameter.
+               * List hollerithIndexes = The indexes of the tokens which are Hollerith constants.
+    """
+
+    # Without Hollerith constants, the delimiters can't appear inside a parameter:
+    if 'H' not in parameterString:
+        parameterString = parameterString.split(recordDelimiter, 1)[0]
+        tokens = parameterString.replace(' ', '').split(parameterDelimiter)
+        return tokens, []
+
+    tokens = []
+    hollerithIndexes = []
+    position = 0
+    length = len(parameterString)
+    while position <= length:
+        match = hollerithPattern.match(parameterString, position)
+        if match:
+            start = match.end()
+            position = start + int(match.group(1))
+            hollerithIndexes.append(len(tokens))
+            tokens.append(parameterString[start:position])
+        else:
+            tokens.append(None)
+        # Looking for the end of the parameter:
+        endParameter = parameterString.find(parameterDelimiter, position)
+        endRecord = parameterString.find(recordDelimiter, position)
+        if endParameter == -1 or (endRecord != -1 and endRecord < endParameter):
+            end = length if endRecord == -1 else endRecord
+        else:
+            end = endParameter
+        if tokens[-1] is None:
+            tokens[-1] = parameterString[position:end].replace(' ', '')
+        if end == length or parameterString[end] == recordDelimiter:
+            break
+        position = end + 1
+    return tokens, hollerithIndexes
+
+def convertNumericData(numericString):
+    """
+    # Function: convertNumericData.
+    # Description: Function to convert a comma separated sequence of IGES numeric parameters at
+    once. Parameters without a decimal point or exponent are converted to int, the others to float.
+    # Parameters: * Str numericString = The parameters, without blanks and with 'E' exponents.
+    # Returns: * List parameters = A list containing each converted parameter, or None if some
+               parameter is not numeric or is defaulted.
+    """
+
+    if (not numericString) or numericString[0] == ',' or numericString[-1] == ',' or ',,' in numericString:
+        return None
+    content = numpy.frombuffer(numericString.encode('latin-1'), dtype=numpy.uint8)
+    delimiters = numpy.flatnonzero(content == ord(','))
+    numTokens = len(delimiters) + 1
+    with warnings.catch_warnings():
+        # Unparsable data is reported by NumPy as a warning
+        warnings.simplefilter('error')
+        try:
+            values = numpy.fromstring(numericString, dtype=float, sep=',')
+        except (ValueError, DeprecationWarning):
+            return None
+    if len(values) != numTokens:
+        return None
+
+    # Finding the integer parameters (without a decimal point or an exponent):
+    realMarks = numpy.flatnonzero((content == ord('.')) | (content == ord('E')) | (content == ord('e')))
+    realTokens = numpy.zeros(numTokens, dtype=bool)
+    realTokens[numpy.searchsorted(delimiters, realMarks)] = True
+    parameters = values.tolist()
+    for i in numpy.flatnonzero(~realTokens).tolist():
+        parameters[i] = int(parameters[i])
+    return parameters
+
+def parseParameters(parameterString, parameterDelimiter=',', recordDelimiter=';'):
+    """
+    # Function: parseParameters.
+    # Description: Function to convert the parameter data of an entity to Python data types.
+    Numeric parameters are converted in bulk: integers (without a decimal point or exponent)
+    to int and reals (with 'E' or 'D' exponents) to float. Hollerith constants are converted to
+    strings and defaulted parameters are kept as empty strings, as in convertData.
+    # Parameters: * Str parameterString = The parameter data of an entity (columns 1-64 of
+                  its Parameter Section lines).
+                  * Str parameterDelimiter = The parameter delimiter character.
+                  * Str recordDelimiter = The record delimiter character.
+    # Returns: * List parameters = A list containing each parameter of the entity.
+    """
+
+    # Records without Hollerith constants are usually fully numeric:
+    if 'H' not in parameterString and (parameterDelimiter == ',' or ',' not in parameterString):
+        numericString = parameterString.split(recordDelimiter, 1)[0].replace(' ', '').replace('D', 'E')
+        parameters = convertNumericData(numericString.replace(parameterDelimiter, ','))
+        if parameters is not None:
+            return parameters
+
+    tokens, hollerithIndexes = tokenizeParameters(parameterString, parameterDelimiter, recordDelimiter)
+    isText = [False] * len(tokens)
+    for i in hollerithIndexes:
+        isText[i] = True
+    numericIndexes = [i for i in range(len(tokens)) if tokens[i] and not isText[i]]
+    # Tokens with commas (with other delimiters) would be split by the bulk conversion:
+    values = None
+    if not any(',' in tokens[i] for i in numericIndexes):
+        values = convertNumericData(','.join([tokens[i] for i in numericIndexes]).replace('D', 'E'))
+    if values is None:
+        return [convertData(token) if not text else token for token, text in zip(tokens, isText)]
+    parameters = list(tokens)
+    for i, value in zip(numericIndexes, values):
+        parameters[i] = value
+    return parameters
+
 def loadIGESFile(IGESPath):
     """
     # Function: loadIGESFile.
@@ -50,14 +197,279 @@ def loadIGESFile(IGESPath):
     IGESFile = open(IGESPath, mode='r')
     return IGESFile
 
+class IGESIndex(object):
+    """
+    # Class: IGESIndex.
+    # Description: A section index of an IGES file, built with a single pass over its bytes.
+    Each line is classified by the section letter in column 73, and the Directory Entry and
+    Parameter Data sections are indexed so that the parameter record of any entity can be
+    sliced on demand. Lines are decoded as Latin-1, so columns always match the bytes of the file.
+    """
+
+    def __init__(self, buffer, bufferFile=None):
+        """
+        # Method: __init__.
+        # Description: The init method for indexing the contents of an IGES file.
+        # Parameters: * Bytes buffer = The contents of the IGES file (a bytes or mmap object).
+                      * File bufferFile = The file object owning the buffer, closed with the index.
+        """
+
+        self.buffer = buffer
+        self.bufferFile = bufferFile
+
+        # Locating every line of the file:
+        content = numpy.frombuffer(buffer, dtype=numpy.uint8) if len(buffer) else numpy.zeros(0, numpy.uint8)
+        newLines = numpy.flatnonzero(content == ord('\n'))
+        start = 3 if bytes(buffer[0:3]) == b'\xef\xbb\xbf' else 0
+        lineStarts = numpy.concatenate(([start], newLines + 1))
+        lineEnds = numpy.concatenate((newLines, [len(buffer)]))
+        lineStarts, lineEnds = lineStarts[lineStarts <= lineEnds], lineEnds[lineStarts <= lineEnds]
+
+        # Classifying the lines by the section letter in column 73:
+        validLines = (lineEnds - lineStarts) >= 73
+        self.lineStarts = lineStarts[validLines]
+        self.lineEnds = lineEnds[validLines]
+        self.sections = content[self.lineStarts + 72].tobytes().decode('latin-1')
+
+        # Section offsets, as (first line, last line + 1) indexes of each section:
+        self.sectionOffsets = {}
+        for letter in 'SGDPT':
+            first = self.sections.find(letter)
+            if first != -1:
+                self.sectionOffsets[letter] = (first, self.sections.rfind(letter) + 1)
+
+        # Directory Entry to Parameter Data pointers (one entry for each pair of DE lines):
+        self.dataLines = numpy.flatnonzero(numpy.frombuffer(self.sections.encode('latin-1'), numpy.uint8) == ord('D'))
+        self.dataLines = self.dataLines[0:len(self.dataLines) - len(self.dataLines) % 2].reshape(-1, 2)
+        self.entityTypes = self.integerField(content, self.dataLines[:, 0], 0, 8)
+        self.parameterPointers = self.integerField(content, self.dataLines[:, 0], 8, 16)
+        self.parameterCounts = self.integerField(content, self.dataLines[:, 1], 24, 32)
+
+        # Counting the lines that can't be sliced as part of a block of 80 column lines:
+        blockLines = (self.lineEnds - self.lineStarts) == 80
+        blockLines[:-1] &= self.lineStarts[1:] == self.lineEnds[:-1] + 1
+        self.irregularLines = numpy.concatenate(([0], numpy.cumsum(~blockLines))).tolist()
+
+    def integerField(self, content, lines, first, last):
+        """
+        # Method: integerField.
+        # Description: Reads a fixed-width integer field (such as the columns of a Directory Entry)
+        from several lines at once.
+        # Parameters: * Array content = The bytes of the IGES file as an array.
+                      * Array lines = The indexes of the lines to be read.
+                      * Int first = The first column of the field (starting at 0).
+                      * Int last = The column after the end of the field.
+        # Returns: * Array values = The integer value of the field of each line (0 if blank).
+        """
+
+        if len(lines) == 0:
+            return numpy.zeros(0, dtype=int)
+        chars = content[self.lineStarts[lines][:, numpy.newaxis] + numpy.arange(first, last)]
+        isDigit = (chars >= ord('0')) & (chars <= ord('9'))
+        isSpace = chars == ord(' ')
+        # Right-justified fields: only leading spaces followed by digits
+        if numpy.all(isDigit | isSpace) and not numpy.any(isSpace[:, 1:] & isDigit[:, :-1]):
+            powers = 10 ** numpy.arange(last - first - 1, -1, -1)
+            return numpy.where(isDigit, chars.astype(int) - ord('0'), 0).dot(powers)
+        return numpy.array([int(self.line(i)[first:last].strip() or 0) for i in lines], dtype=int)
+
+    def __len__(self):
+        """
+        # Method: __len__.
+        # Description: Provides the number of entities in the Directory Entry Section.
+        # Returns: * Int = The number of entities.
+        """
+
+        return len(self.dataLines)
+
+    def line(self, i):
+        """
+        # Method: line.
+        # Description: Provides the contents of a line of the file, without the line break.
+        # Parameters: * Int i = The index of the line among the classified lines.
+        # Returns: * Str = The contents of the line.
+        """
+
+        return bytes(self.buffer[self.lineStarts[i]:self.lineEnds[i]]).decode('latin-1').rstrip('\r')
+
+    def sectionLines(self, letter):
+        """
+        # Method: sectionLines.
+        # Description: Provides every line of a section, in the format of a file line.
+        # Parameters: * Str letter = The section letter ('S', 'G', 'D', 'P' or 'T').
+        # Returns: * List = A list of strings containing each line of the section.
+        """
+
+        if letter not in self.sectionOffsets:
+            return []
+        first, last = self.sectionOffsets[letter]
+        return [self.line(i) + '\n' for i in range(first, last) if self.sections[i] == letter]
+
+    def dataEntry(self, i):
+        """
+        # Method: dataEntry.
+        # Description: Provides the Directory Entry of an entity, as read by getRawData.
+        # Parameters: * Int i = The index of the entity in the Directory Entry Section.
+        # Returns: * Str = A string containing both lines of the entry.
+        """
+
+        firstLine, secondLine = self.dataLines[i]
+        return self.line(firstLine).ljust(80)[0:80] + '\n' + self.line(secondLine).ljust(80)[0:80] + '\n'
+
+    def parameterRecord(self, i):
+        """
+        # Method: parameterRecord.
+        # Description: Slices the Parameter Data record of an entity using its Parameter Data
+        pointer and its Parameter Line Count, as read by getRawParameters.
+        # Parameters: * Int i = The index of the entity in the Directory Entry Section.
+        # Returns: * Str = A string containing every line of the parameter record.
+        """
+
+        if 'P' not in self.sectionOffsets:
+            return ''
+        first = self.sectionOffsets['P'][0] + int(self.parameterPointers[i]) - 1
+        last = min(first + max(int(self.parameterCounts[i]), 1), self.sectionOffsets['P'][1])
+        # Lines with exactly 80 columns and a single line break can be sliced as a single block
+        if self.irregularLines[last-1] == self.irregularLines[first]:
+            block = bytes(self.buffer[self.lineStarts[first]:self.lineEnds[last-1]])
+            return block.decode('latin-1') + '\n'
+        return ''.join([self.line(j).ljust(80)[0:80] + '\n' for j in range(first, last)])
+
+    def close(self):
+        """
+        # Method: close.
+        # Description: Releases the buffer of the index and its file (if memory mapped).
+        """
+
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self.bufferFile is not None:
+            self.bufferFile.close()
+        self.buffer = b''
+        self.bufferFile = None
+
+def indexIGESFile(IGESPath, useMmap=False):
+    """
+    # Function: indexIGESFile.
+    # Description: This function reads an .IGS or .IGES file once and indexes its sections.
+    # Parameters: * Str IGESPath = The path to the IGES file.
+                  * Boolean useMmap = Determines if the file will be memory mapped instead of
+                  being read into memory.
+    # Returns: * IGESIndex index = The section index of the IGES file.
+    """
+
+    IGESFile = open(IGESPath, mode='rb')
+    if useMmap:
+        try:
+            return IGESIndex(mmap.mmap(IGESFile.fileno(), 0, access=mmap.ACCESS_READ), IGESFile)
+        except ValueError:
+            # Empty files can't be memory mapped
+            pass
+    try:
+        return IGESIndex(IGESFile.read())
+    finally:
+        IGESFile.close()
+
+class EntityTable(object):
+    """
+    # Class: EntityTable.
+    # Description: A lazy list of the entities of an IGES file. Only the section index is kept
+    in memory at first; each entity is parsed the first time it is accessed (e.g. through
+    objectList[pos(seqNumber)]) and then reused. Entities of unsupported types are None and
+    are never parsed. It can be used anywhere a list of Entity objects is expected.
+    """
+
+    def __init__(self, index, parameterDelimiter=',', recordDelimiter=';', IGESPath=None, useMmap=False):
+        """
+        # Method: __init__.
+        # Description: The init method for creating an entity table over an indexed IGES file.
+        # Parameters: * IGESIndex index = The section index of the IGES file.
+                      * Str parameterDelimiter = The parameter delimiter character.
+                      * Str recordDelimiter = The record delimiter character.
+                      * Str IGESPath = The path to the IGES file, used to rebuild the index when
+                      the table is pickled (e.g. when sent to another process).
+                      * Boolean useMmap = Determines if a rebuilt index memory maps the file.
+        """
+
+        self.index = index
+        self.parameterDelimiter = parameterDelimiter
+        self.recordDelimiter = recordDelimiter
+        self.IGESPath = IGESPath
+        self.useMmap = useMmap
+        self.entities = [None] * len(index)
+        self.loaded = [False] * len(index)
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __getitem__(self, i):
+        """
+        # Method: __getitem__.
+        # Description: Provides an entity, parsing it if it wasn't accessed before.
+        # Parameters: * Int i = The index of the entity (as returned by pos), or a slice.
+        # Returns: * Entity = The Python object representing the entity, or None if its type is
+                   not supported.
+        """
+
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('entity index out of range')
+        if not self.loaded[i]:
+            if int(self.index.entityTypes[i]) in supportedEntityTypes:
+                self.entities[i] = loadSingleEntity(self.index.dataEntry(i), self.index.parameterRecord(i),
+                                                    self.parameterDelimiter, self.recordDelimiter)
+            self.loaded[i] = True
+        return self.entities[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getstate__(self):
+        # Tables of files on disk are pickled by path; the others carry every entity.
+        state = self.__dict__.copy()
+        del state['index']
+        if self.IGESPath is not None:
+            state['entities'] = [None] * len(self.entities)
+            state['loaded'] = [False] * len(self.loaded)
+        else:
+            state['entities'] = list(self)
+            state['loaded'] = [True] * len(self.loaded)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.index = indexIGESFile(self.IGESPath, self.useMmap) if self.IGESPath is not None else None
+
+def loadEntityTable(IGESPath, useMmap=False):
+    """
+    # Function: loadEntityTable.
+    # Description: This function indexes an .IGS or .IGES file and provides its entities as a
+    lazy EntityTable.
+    # Parameters: * Str IGESPath = The path to the IGES file.
+                  * Boolean useMmap = Determines if the file will be memory mapped instead of
+                  being read into memory.
+    # Returns: * EntityTable table = The lazy list of entities of the IGES file.
+    """
+
+    index = indexIGESFile(IGESPath, useMmap)
+    parameterDelimiter, recordDelimiter = getDelimiters(getRawHeader(index))
+    return EntityTable(index, parameterDelimiter, recordDelimiter, IGESPath, useMmap)
+
 def getRawHeader(IGESFile):
     """
     # Function: getRawHeader.
     # Description: Function to retrieve the data of the Header Section of an IGES file.
-    # Parameters: * _io.TextIOWrapper IGESFile = The Python object for the IGES file.
+    # Parameters: * _io.TextIOWrapper IGESFile = The Python object for the IGES file (or its
+                  IGESIndex).
     # Returns: * Str header = A string containing the information of the Header Section.
     """
 
+    if isinstance(IGESFile, IGESIndex):
+        return IGESFile.sectionLines('G')
     IGESFile.seek(3)
     header = []
     for line in IGESFile:
@@ -69,10 +481,13 @@ def getRawData(IGESFile):
     """
     # Function: getRawData.
     # Description: Function to retrieve the data of the Data Entry Section of an IGES file.
-    # Parameters: * _io.TextIOWrapper IGESFile = The Python object for the IGES file.
+    # Parameters: * _io.TextIOWrapper IGESFile = The Python object for the IGES file (or its
+                  IGESIndex).
     # Returns: * List data = A list of strings containing each entry of the Data Section.
     """
 
+    if isinstance(IGESFile, IGESIndex):
+        return [IGESFile.dataEntry(i) for i in range(len(IGESFile))]
     IGESFile.seek(3)
     data = []
     while True:
@@ -88,11 +503,14 @@ def getRawParameters(IGESFile):
     """
     # Function: getRawParameters.
     # Description: Function to retrieve the data of the Parameter Data Section of an IGES file.
-    # Parameters: * _io.TextIOWrapper IGESFile = The Python object for the IGES file.
+    # Parameters: * _io.TextIOWrapper IGESFile = The Python object for the IGES file (or its
+                  IGESIndex).
     # Returns: * List parameters = A list of strings containing each entry of the Parameter
     Section.
     """
 
+    if isinstance(IGESFile, IGESIndex):
+        return [IGESFile.parameterRecord(i) for i in range(len(IGESFile))]
     IGESFile.seek(3)
     parameters = []
     lastSeqNumber = None
@@ -102,18 +520,20 @@ def getRawParameters(IGESFile):
             break
         elif firstRead[72] == 'P':
             if int(firstRead[64:72]) == lastSeqNumber:
-                parameters[len(parameters)-1] += firstRead
+                parameters[-1].append(firstRead)
             else:
-                parameters.append(firstRead)
+                parameters.append([firstRead])
                 lastSeqNumber = int(firstRead[64:72])
-    return parameters
+    return [''.join(lines) for lines in parameters]
 
-def loadEntities(RawData, RawParameters):
+def loadEntities(RawData, RawParameters, parameterDelimiter=',', recordDelimiter=';'):
     """
     # Function: loadEntities.
     # Description: Function to load and transform IGES entities into Python Objects.
     # Parameters: * Str RawData = A raw string of the Data Section.
                   * Str RawParameters = A raw string of the Parameter Section.
+                  * Str parameterDelimiter = The parameter delimiter character (see getDelimiters).
+                  * Str recordDelimiter = The record delimiter character (see getDelimiters).
     # Returns: * List loadedEntities = A list of Entity Python objects representing each
     IGES entity.
     """
@@ -127,17 +547,19 @@ def loadEntities(RawData, RawParameters):
         print('Imcompatible Number of Data and Parameters!')
         return
     for i in range(len(RawData)):
-        loadedObject = loadSingleEntity(RawData[i], RawParameters[i])
+        loadedObject = loadSingleEntity(RawData[i], RawParameters[i], parameterDelimiter, recordDelimiter)
         loadedEntities.append(loadedObject)
     return loadedEntities
 
-def loadSingleEntity(RawDataItem, RawParameterItem):
+def loadSingleEntity(RawDataItem, RawParameterItem, parameterDelimiter=',', recordDelimiter=';'):
     """
     # Function: loadSingleEntity.
     # Description: Function to load a single entity from an IGES File given its Data Section
     and Parameter Section strings.
     # Parameters: * Str RawDataItem = A string containing the Data Section of an entity.
                   * Str RawParameterItem = A string containing the Parameter Section of an entity.
+                  * Str parameterDelimiter = The parameter delimiter character.
+                  * Str recordDelimiter = The record delimiter character.
     # Returns: * Entity loadedObject = The Python object representing the entity.
     """
 
@@ -150,14 +572,13 @@ def loadSingleEntity(RawDataItem, RawParameterItem):
 
     # Splitting the String RawParameterItem into a RawParameterList
     numLines = len(RawParameterItem)//81
-    parameterString = ''
-    for i in range(numLines):
-        parameterString += RawParameterItem[(0 + i*81):(64 + i*81)]
-    parameterString = parameterString.replace(' ', '')
-    parameterString = parameterString.replace(';', '')
-    RawParameterList = parameterString.split(',')
-    for i in range(len(RawParameterList)):
-        RawParameterList[i] = convertData(RawParameterList[i])
+    if len(RawParameterItem) == numLines*81 and RawParameterItem.isascii():
+        # Slicing the columns 1-64 of every line at once
+        lines = numpy.frombuffer(RawParameterItem.encode('latin-1'), dtype=numpy.uint8).reshape(numLines, 81)
+        parameterString = lines[:, 0:64].tobytes().decode('latin-1')
+    else:
+        parameterString = ''.join([RawParameterItem[(0 + i*81):(64 + i*81)] for i in range(numLines)])
+    RawParameterList = parseParameters(parameterString, parameterDelimiter, recordDelimiter)
     entityType = RawParameterList[0]
 
     # Loading the object
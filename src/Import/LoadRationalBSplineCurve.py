@@ -4,6 +4,7 @@
 # Author: Willian Hideak Arita da Silva.
 """
 
+import numpy
 from Entities.RationalBSplineCurve import RationalBSplineCurve
 
 # Function to load a Rational B-Spline Curve (Type 126)
@@ -27,20 +28,14 @@ def loadRationalBSplineCurve(RawDataList, RawParameterList):
     PROP2 = RawParameterList[4]
     PROP3 = RawParameterList[5]
     PROP4 = RawParameterList[6]
-    TList = []
-    WList = []
-    XList = []
-    YList = []
-    ZList = []
     i = 7
-    for j in range(int(K)+int(M)+2):
-        TList.append(RawParameterList[i]); i += 1
-    for k in range(int(K)+1):
-        WList.append(RawParameterList[i]); i += 1
-    for w in range(int(K)+1):
-        XList.append(RawParameterList[i]); i += 1
-        YList.append(RawParameterList[i]); i += 1
-        ZList.append(RawParameterList[i]); i += 1
+    numKnots = int(K)+int(M)+2
+    numCtrlPts = int(K)+1
+    TList = numpy.array(RawParameterList[i:i+numKnots], dtype=float); i += numKnots
+    WList = numpy.array(RawParameterList[i:i+numCtrlPts], dtype=float); i += numCtrlPts
+    coords = numpy.array(RawParameterList[i:i+3*numCtrlPts], dtype=float).reshape(numCtrlPts, 3)
+    i += 3*numCtrlPts
+    XList, YList, ZList = coords[:, 0], coords[:, 1], coords[:, 2]
     V0 = RawParameterList[i]; i += 1
     V1 = RawParameterList[i]; i += 1
     XNORM = RawParameterList[i]; i += 1
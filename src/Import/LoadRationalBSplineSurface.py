@@ -4,6 +4,7 @@
 # Author: Willian Hideak Arita da Silva.
 """
 
+import numpy
 from Entities.RationalBSplineSurface import RationalBSplineSurface
 
 # Function to load a Rational B-Spline Surface (Type 128)
@@ -30,31 +31,20 @@ def loadRationalBSplineSurface(RawDataList, RawParameterList):
     PROP3 = RawParameterList[7]
     PROP4 = RawParameterList[8]
     PROP5 = RawParameterList[9]
-    SList = []
-    TList = []
-    WList = []
-    XList = []
-    YList = []
-    ZList = []
     i = 10
-    for j in range(int(K1)+int(M1)+2):
-        SList.append(RawParameterList[i]); i += 1
-    for k in range(int(K2)+int(M2)+2):
-        TList.append(RawParameterList[i]); i += 1
-    for w in range(int(K1)+1):
-        WList.append([])
-    for z in range(int(K2)+1):
-        for x in range(int(K1)+1):
-            WList[x].append(RawParameterList[i]); i += 1
-    for a in range(int(K1)+1):
-        XList.append([])
-        YList.append([])
-        ZList.append([])
-    for b in range(int(K2)+1):
-        for c in range(int(K1)+1):
-            XList[c].append(RawParameterList[i]); i += 1
-            YList[c].append(RawParameterList[i]); i += 1
-            ZList[c].append(RawParameterList[i]); i += 1
+    numKnotsS = int(K1)+int(M1)+2
+    numKnotsT = int(K2)+int(M2)+2
+    numCtrlPtsS = int(K1)+1
+    numCtrlPtsT = int(K2)+1
+    numCtrlPts = numCtrlPtsS*numCtrlPtsT
+    SList = numpy.array(RawParameterList[i:i+numKnotsS], dtype=float); i += numKnotsS
+    TList = numpy.array(RawParameterList[i:i+numKnotsT], dtype=float); i += numKnotsT
+    # Weights and control points are listed with the first index varying fastest:
+    WList = numpy.array(RawParameterList[i:i+numCtrlPts], dtype=float).reshape(numCtrlPtsT, numCtrlPtsS).T
+    i += numCtrlPts
+    coords = numpy.array(RawParameterList[i:i+3*numCtrlPts], dtype=float).reshape(numCtrlPtsT, numCtrlPtsS, 3)
+    i += 3*numCtrlPts
+    XList, YList, ZList = coords[:, :, 0].T, coords[:, :, 1].T, coords[:, :, 2].T
     U0 = RawParameterList[i]; i += 1
     U1 = RawParameterList[i]; i += 1
     V0 = RawParameterList[i]; i += 1
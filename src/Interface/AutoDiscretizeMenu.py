@@ -183,17 +183,15 @@ class autoDiscretizeMenu(QWidget):
 
         try:
             # Performs the autoDiscretization using the Discretization package:
-            sequence, normals, points = discretizeModel(parent, parent.entitiesObject, density, precision,
-                                                        Uparam, Vparam, useParametric, gridDiscretization, False)
+            cloud = discretizeModel(parent.entitiesObject, density, precision, Uparam, Vparam,
+                                    useParametric, gridDiscretization, parent.discretizationWorkers)
         # Handling the error case in which the user inputs a value for U or V less than 2
         except ValueError:
             QMessageBox.information(parent, MyStrings.popupInvalidUVTitle,
                                     MyStrings.popupInvalidUVDescription,
                                     QMessageBox.Ok, QMessageBox.Ok)
             return
-        parent.faceSequenceNumbers += sequence
-        parent.faceNormalVectors += normals
-        parent.cloudPointsList += points
+        parent.cloudPoints.extend(cloud)
 
         # Builds the generated point cloud
         buildCloud(parent)
@@ -9,6 +9,7 @@ import sys
 from PyQt5.QtWidgets import QWidget, QApplication, QTreeView
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 from PyQt5.QtCore import QCoreApplication, QSize, Qt
+from Resources.Strings import MyStrings
 
 class entitiesMenu(QTreeView):
     """
@@ -35,9 +36,25 @@ class entitiesMenu(QTreeView):
         """
         self.setHeaderHidden(True)
         self.model = QStandardItemModel()
+        if(not parent.entitiesList):
+            self.loadDescriptions(parent)
         self.addItems(self.model, parent.entitiesList)
         self.setModel(self.model)
 
+    def loadDescriptions(self, parent):
+        """
+        # Method: loadDescriptions.
+        # Description: This method generates the description of each loaded IGES entity into the
+        parent.entitiesList property of the main window. It's only called the first time the
+        Entities menu is opened for a model.
+        # Parameters: * MainWindow parent = A reference for the main window object.
+        """
+        for entity in parent.entitiesObject:
+            if(entity != None):
+                parent.entitiesList.append(entity.description())
+            else:
+                parent.entitiesList.append((MyStrings.nonImplementedEntity, []))
+
     def addItems(self, parent, elements):
         """
         # Method: addItems.
@@ -83,7 +83,7 @@ class exportMenu(QWidget):
         fileName = QFileDialog.getSaveFileName(parent, MyStrings.exportPcdTitle, defaultName, MyStrings.exportPcdFormat)[0]
         if not fileName:
             return
-        generatePcd(parent.cloudPointsList, fileName)
+        generatePcd(parent.cloudPoints, fileName)
 
     def exportTxt(self, parent):
         """
@@ -99,7 +99,7 @@ class exportMenu(QWidget):
         fileName = QFileDialog.getSaveFileName(parent, MyStrings.exportTxtTitle, defaultName, MyStrings.exportTxtFormat)[0]
         if not fileName:
             return
-        generateTxt(parent.cloudPointsList, fileName)
+        generateTxt(parent.cloudPoints, fileName)
 
     def exportScreenshot(self, parent):
         """
@@ -185,11 +185,7 @@ class faceDiscretizeMenu(QWidget):
             for sequence in selectedFaces:
                 points, normals = discretizeFace(parent.entitiesObject[pos(sequence)], parent.entitiesObject,
                                                  density, precision, gridDiscretization)
-                parent.faceSequenceNumbers.append(sequence)
-                parent.faceNormalVectors.append(normals)
-                parent.cloudPointsList.append(points)
-                parent.UVproperty.append([None, None])
-                parent.normVectorsToggle.append(True)
+                parent.cloudPoints.addFace(sequence, points, normals)
         else:
             QMessageBox.information(parent, "Surface not selected",
                                     "Surface not selected. Please, select one to generate a point cloud.", QMessageBox.Ok, QMessageBox.Ok)
@@ -204,14 +200,7 @@ class faceDiscretizeMenu(QWidget):
         # Building the logbook tupple
         selectedEntityList = []
         for i in range(len(selectedFaces)):
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFaces[i]):
-                    break
-                index += 1
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(selectedFaces[i]/2+0.5))
 
         if(gridDiscretization):
             discrMode = "N x N"
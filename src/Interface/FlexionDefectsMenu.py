@@ -4,9 +4,6 @@
 # Author: Rodrigo de Oliveira Neto.
 """
 
-# System imports:
-import math
-
 # PyQt5 Imports:
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QToolButton, QLineEdit, QComboBox, QMessageBox, QCheckBox, QFrame
 
@@ -16,6 +13,7 @@ from OCC.BRepBndLib import brepbndlib_Add
 
 # Local Imports:
 from Actions.Functions import *
+from Discretization.Deviations import flexionPoints
 from Resources.Strings import MyStrings
 
 class flexionDefectsMenu(QWidget):
@@ -170,72 +168,23 @@ class flexionDefectsMenu(QWidget):
         deltaX = xMax - xMin
         deltaY = yMax - yMin
         deltaZ = zMax - zMin
-        centerX = xMin + deltaX/2
-        centerY = yMin + deltaY/2
-        centerZ = zMin + deltaZ/2
 
         # Declaring the list of index of deviated surface(s)
         selectedEntityList = []
 
         # Getting information about the selected surfaces:
         for i in range(len(selectedFacesNumber)):
-            index = 0
-            seqNumber = None
-
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFacesNumber[i]):
-                    break
-                index += 1
+            index = parent.cloudPoints.faceIndex(selectedFacesNumber[i])
 
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(selectedFacesNumber[i]/2+0.5))
 
             try:
                 # Flexioning all the points on the selected surface based on given parameters:
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    x0 = parent.cloudPointsList[index][i][0]
-                    y0 = parent.cloudPointsList[index][i][1]
-                    z0 = parent.cloudPointsList[index][i][2]
-
-                    if(long_axis == "x"):
-                        # associating the parameter maximum deformation to the homogeneos load applied
-                        q = -(384*max_def)/(5*deltaX**4)
-                        # applying the deflection formula to the points of selected face
-                        v = -(q/24)*(x0-xMin)**4 + (q/12)*deltaX*(x0-xMin)**3 -0.0417*(deltaX**3)*q*(x0-xMin)
-                        if(perp_axis == "y"):
-                                point = (x0,
-                                y0 + v,
-                                z0)
-                        elif(perp_axis == "z"):
-                                point = (x0,
-                                y0,
-                                z0 + v)
-                    elif(long_axis == "y"):
-                        q = -(384*max_def)/(5*deltaY**4)
-                        v = -(q/24)*(y0-yMin)**4 + (q/12)*deltaY*(y0-yMin)**3 -0.0417*(deltaY**3)*q*(y0-yMin)
-                        if(perp_axis == "x"):
-                                point = (x0 + v,
-                                y0,
-                                z0)
-                        elif(perp_axis == "z"):
-                                point = (x0,
-                                y0,
-                                z0 + v)
-                    elif(long_axis == "z"):
-                        q = -(384*max_def)/(5*deltaZ**4)
-                        v = -(q/24)*(z0-zMin)**4 + (q/12)*deltaZ*(z0-zMin)**3 -0.0417*(deltaZ**3)*q*(z0-zMin)
-                        if(perp_axis == "x"):
-                                point = (x0 + v,
-                                y0,
-                                z0)
-                        elif(perp_axis == "y"):
-                                point = (x0,
-                                y0 + v,
-                                z0)
-
-                    newPointsList.append(point)
-                parent.cloudPointsList[index] = newPointsList
+                start = {'x': xMin, 'y': yMin, 'z': zMin}[long_axis]
+                length = {'x': deltaX, 'y': deltaY, 'z': deltaZ}[long_axis]
+                newPoints = flexionPoints(parent.cloudPoints.facePoints(index), long_axis, perp_axis,
+                                          start, length, max_def)
+                parent.cloudPoints.setFacePoints(index, newPoints)
             # Non-discretized surface error handling
             except IndexError:
                 QMessageBox.information(parent, MyStrings.popupInvalidSurf, MyStrings.popupInvalidSurfDescription, QMessageBox.Ok, QMessageBox.Ok)
@@ -13,7 +13,8 @@ from OCC.IGESControl import IGESControl_Reader
 from OCC.IFSelect import IFSelect_RetDone, IFSelect_ItemsByEntity
 
 # Local Imports:
-from Import.IGESImport import loadIGESFile, loadEntities, getRawData, getRawParameters
+from Import.IGESImport import loadEntityTable
+from Discretization.DiscretizeModel import clearCurveCache, clearProbeCache
 from Resources.Strings import MyStrings
 
 class importMenu(QWidget):
@@ -117,14 +118,12 @@ class importMenu(QWidget):
         parent.activeCADFile = fileName[0]
         parent.setWindowTitle(parent.title + ' - ' + fileName[0])
 
-        # Loading the IGES entities as Python objects for generating the entitiesList:
-        myfile = loadIGESFile(parent.activeCADFile)
-        parent.entitiesObject = loadEntities(getRawData(myfile), getRawParameters(myfile))
-        for entity in parent.entitiesObject:
-            if(entity != None):
-                parent.entitiesList.append(entity.description())
-            else:
-                parent.entitiesList.append((MyStrings.nonImplementedEntity, []))
+        # Indexing the IGES entities; they are loaded as Python objects when first used, and the
+        # entitiesList is generated when the Entities menu is opened:
+        parent.entitiesObject = loadEntityTable(parent.activeCADFile)
+        parent.entitiesList = []
+        clearCurveCache()
+        clearProbeCache()
         parent.loadingWindow.close()
 
     def importPcd(self, parent):
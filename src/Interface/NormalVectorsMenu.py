@@ -195,30 +195,29 @@ class normalVectorsMenu(QWidget):
 
         # (Auxiliary) discretizating every face of the model with points only in the center regions.
         # These points will be the reference for creation of the 3D Vectors.
-        sequence, normals, points = discretizeModel(parent, parent.entitiesObject, 2, 10, 2, 4, True, True, True)
+        cloud = discretizeModel(parent.entitiesObject, 2, 10, 2, 4, True, True)
 
         # Attributing points and vectors references to tupples that will be used to create the 3D Vectors.
-        for i in range (len(points)):
-            index = 0
+        for i in range (len(cloud)):
+            # Checking if the normal vectors of the correspondent surface have been reversed yet.
             inverseVector = False
-            for j in range (len(points[i])):
-                pnts.append(points[i][j])
-                while index < len(parent.faceSequenceNumbers):
-                    if(sequence[i] == parent.faceSequenceNumbers[index]):
-                        # Checking in a auxiliary tupple if the normal vector of the correspondent surface has been reversed yet.
-                        if(not parent.normVectorsToggle[index]):
-                            inverseVector = True
-                    index += 1
-                # If it wasn't reversed, the reference considered for normal vector will be product of the latest auxiliary discretization
-                if(not inverseVector):
-                    nmls.append(normals[i][j])
-                # If it was reversed, the reference considered for normal vector will be product of the latest auxiliary discretization, but negative
-                else:
-                    newNormalVec = [numpy.negative(x) for x in normals[i][j]]
-                    nmls.append(newNormalVec)
+            for index in range(len(parent.cloudPoints)):
+                if(cloud.sequenceNumbers[i] == parent.cloudPoints.sequenceNumbers[index]):
+                    if(parent.cloudPoints.reversedNormals[index]):
+                        inverseVector = True
+            pnts += cloud.facePoints(i).tolist()
+            # If it wasn't reversed, the reference considered for normal vector will be product of the latest auxiliary discretization
+            if(not inverseVector):
+                nmls += cloud.faceNormals(i).tolist()
+            # If it was reversed, the reference considered for normal vector will be product of the latest auxiliary discretization, but negative
+            else:
+                nmls += numpy.negative(cloud.faceNormals(i)).tolist()
 
         # Calling the methods to create 3D Vectors in the workspace
         for i in range (len(pnts)):
+            # Skipping degenerate normal vectors (zero-length vectors can't define a direction)
+            if(not any(nmls[i])):
+                continue
             p1 = gp_Pnt(pnts[i][0], pnts[i][1], pnts[i][2])
             pntList.append(p1)
             dir = gp_Dir(nmls[i][0], nmls[i][1], nmls[i][2])
@@ -241,14 +240,6 @@ class normalVectorsMenu(QWidget):
             parent.normalArrowsShapeList.append(AIScone)
         self.show3DNormalVectors(parent)
 
-    def toggle(self, a):
-        """
-        # Method: toggle.
-        # Description: This method makes a toggle operation over a bool variable.
-        # Parameters: * Bool a = Generic bool variable to be toggled.
-        """
-        return not a
-
     def reverse3DNormalVectors(self, parent):
         """
         # Method: reverse3DNormalVectors.
@@ -257,20 +248,10 @@ class normalVectorsMenu(QWidget):
         """
         try:
             for i in range(len(parent.selectedSequenceNumber)):
-                index = 0
-                seqNumber = None
-                while index < len(parent.faceSequenceNumbers):
-                    seqNumber = parent.faceSequenceNumbers[index]
-                    if(seqNumber == parent.selectedSequenceNumber[i]):
-                        break
-                    index += 1
-                # Getting the negative values of the selected discretized surface that will have its normal vectors reversed
-                aux = [numpy.negative(x) for x in parent.faceNormalVectors[index]]
-                newNormalVec = [p for p in [(l[0], l[1], l[2]) for l in aux]]
-                # Reversing its normal vectors
-                parent.faceNormalVectors[index] = newNormalVec
-                # Applying the toggle operation over the appropriate index of normVectorsToggle, to save the occurrence of reversing operation
-                parent.normVectorsToggle[index] = self.toggle(parent.normVectorsToggle[index])
+                index = parent.cloudPoints.faceIndex(parent.selectedSequenceNumber[i])
+                # Reversing the normal vectors of the selected discretized surface. The point cloud
+                # also toggles its reversedNormals flag, to save the occurrence of reversing operation
+                parent.cloudPoints.reverseNormals(index)
             self.delete3DNormalVectors(parent)
             self.create3DNormalVectors(parent)
         # Handling the error of trying to reverse non-discretized surfaces
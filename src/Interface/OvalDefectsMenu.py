@@ -5,7 +5,6 @@
 """
 
 # System Imports:
-import math
 import numpy as np
 
 # PyQt5 Imports:
@@ -18,6 +17,7 @@ from OCC.BRepBndLib import brepbndlib_Add
 # Local Imports:
 from Interface.PeriodicDefectsMenu import periodicDefectsMenu
 from Actions.Functions import *
+from Discretization.Deviations import ovalPoints
 from Resources.Strings import MyStrings
 
 
@@ -128,37 +128,18 @@ class ovalDefectsMenu(QWidget):
 
         # Getting information about the selected surfaces:
         for i in range(len(selectedFacesNumber)):
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFacesNumber[i]):
-                    break
-                index += 1
+            index = parent.cloudPoints.faceIndex(selectedFacesNumber[i])
 
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(selectedFacesNumber[i]/2+0.5))
 
             try:
                 # calculating parameters to properly generate a sine wave that flattens the rounded surface
-                numPointsMainAxis = parent.UVproperty[index][0] -1
-                freq = int((len(parent.cloudPointsList[index])/(numPointsMainAxis))/2)
-
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    x0 = parent.cloudPointsList[index][i][0]
-                    y0 = parent.cloudPointsList[index][i][1]
-                    z0 = parent.cloudPointsList[index][i][2]
-
-                    # applying the sine function to generate an offset to the points
-                    offset = maxDev * math.sin(int(i/numPointsMainAxis)/freq*2*math.pi)
-                    # shifting points
-                    point = (x0 + parent.faceNormalVectors[index][i][0] * offset,
-                             y0 + parent.faceNormalVectors[index][i][1] * offset,
-                             z0 + parent.faceNormalVectors[index][i][2] * offset)
-                    newPointsList.append(point)
-                parent.cloudPointsList[index] = newPointsList
+                numPointsMainAxis = parent.cloudPoints.gridShapes[index][0]
+                newPoints = ovalPoints(parent.cloudPoints.facePoints(index), parent.cloudPoints.faceNormals(index),
+                                       maxDev, numPointsMainAxis)
+                parent.cloudPoints.setFacePoints(index, newPoints)
             # Handling non-rounded surface error
-            except AttributeError:
+            except (AttributeError, TypeError):
                 QMessageBox.information(parent, MyStrings.popupNotRoundedSurf,MyStrings.popupNotRoundedSurfDescription, QMessageBox.Ok, QMessageBox.Ok)
                 return
             # Handling non-discretized surface error
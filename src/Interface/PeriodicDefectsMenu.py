@@ -5,7 +5,6 @@
 """
 
 # System Imports:
-import math
 import numpy as np
 
 # PyQt5 Imports:
@@ -17,6 +16,7 @@ from OCC.BRepBndLib import brepbndlib_Add
 
 # Local Imports:
 from Actions.Functions import *
+from Discretization.Deviations import periodicPoints
 from Resources.Strings import MyStrings
 
 class periodicDefectsMenu(QWidget):
@@ -149,39 +149,23 @@ class periodicDefectsMenu(QWidget):
 
         # Getting information about the selected surfaces:
         for i in range(len(selectedFacesNumber)):
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFacesNumber[i]):
-                    break
-                index += 1
+            index = parent.cloudPoints.faceIndex(selectedFacesNumber[i])
 
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(selectedFacesNumber[i]/2+0.5))
             if(drillAxisCheck):
                 drillAxisLength = 1
             else:
                 try:
-                    drillAxisLength = parent.UVproperty[index][0] - 1
+                    drillAxisLength = parent.cloudPoints.gridShapes[index][0]
                 # case in which the surface isn't rounded (U property = None)
                 except TypeError:
                         drillAxisLength = 1
                         pass
 
             try:
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    x0 = parent.cloudPointsList[index][i][0]
-                    y0 = parent.cloudPointsList[index][i][1]
-                    z0 = parent.cloudPointsList[index][i][2]
-
-                    offset = amp * math.sin((int(i/drillAxisLength)/freq)*2*math.pi)
-
-                    point = (x0 + parent.faceNormalVectors[index][i][0] * offset,
-                             y0 + parent.faceNormalVectors[index][i][1] * offset,
-                             z0 + parent.faceNormalVectors[index][i][2] * offset)
-                    newPointsList.append(point)
-                parent.cloudPointsList[index] = newPointsList
+                newPoints = periodicPoints(parent.cloudPoints.facePoints(index), parent.cloudPoints.faceNormals(index),
+                                           amp, freq, drillAxisLength)
+                parent.cloudPoints.setFacePoints(index, newPoints)
             except ZeroDivisionError:
                 QMessageBox.information(parent, MyStrings.popupInvalidFreq, MyStrings.popupInvalidFreqDescription, QMessageBox.Ok, QMessageBox.Ok)
                 return
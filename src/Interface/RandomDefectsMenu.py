@@ -5,14 +5,12 @@ for calling the discretization functions.
 # Author: Willian Hideak Arita da Silva.
 """
 
-# System Imports:
-import random
-
 # PyQt5 Imports:
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QToolButton, QLineEdit, QMessageBox
 
 # Local Imports:
 from Actions.Functions import *
+from Discretization.Deviations import randomPoints
 from Resources.Strings import MyStrings
 
 class randomDefectsMenu(QWidget):
@@ -133,26 +131,14 @@ class randomDefectsMenu(QWidget):
 
         # Getting information about the selected surfaces:
         for sequence in selectedFaces:
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == sequence):
-                    break
-                index += 1
+            index = parent.cloudPoints.faceIndex(sequence)
 
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(sequence/2+0.5))
 
             try:
                 # Randomizing all the points based on given random parameters:
-                newPointsList = []
-                for point in parent.cloudPointsList[index]:
-                    direction = self.randomDirection()
-                    newPoint = (point[0] + direction[0] * self.randomOffset(minOffset, maxOffset),
-                                point[1] + direction[1] * self.randomOffset(minOffset, maxOffset),
-                                point[2] + direction[2] * self.randomOffset(minOffset, maxOffset))
-                    newPointsList.append(newPoint)
-                parent.cloudPointsList[index] = newPointsList
+                newPoints = randomPoints(parent.cloudPoints.facePoints(index), minOffset, maxOffset)
+                parent.cloudPoints.setFacePoints(index, newPoints)
             # Handling non-discretized surface error
             except IndexError:
                 QMessageBox.information(parent, "Invalid selected surface",
@@ -215,23 +201,3 @@ class randomDefectsMenu(QWidget):
             parent.selectedSequenceNumber.append(2*i+1)
             selectedObjectText += str(i+1) + ' '
         self.selectedObject.setText(selectedObjectText)
-
-    def randomDirection(self):
-        """
-        # Method: randomDirection.
-        # Description: Method for generating a random and not biased 3D vector.
-        """
-        direction = [random.gauss(0, 1) for i in range(3)]
-        magnitude = sum(x**2 for x in direction)**(0.5)
-        normalizedDirection = [x/magnitude for x in direction]
-        return normalizedDirection
-
-    def randomOffset(self, minOffset, maxOffset):
-        """
-        # Method: randomOffset.
-        # Description: Method for generating a random number between two specified offset values.
-        # Parameters: * Float minOffset = The minimum value for the offset.
-                      * Float maxOffset = The maximum value for the offset.
-        """
-        randomNumber = random.random()
-        return minOffset + (maxOffset-minOffset)*randomNumber
@@ -5,9 +5,6 @@ for calling the discretization functions.
 # Author: Willian Hideak Arita da Silva.
 """
 
-# Numpy Imports:
-from numpy import array, dot
-
 # PyQt5 Imports:
 from PyQt5.QtWidgets import QWidget, QLabel, QGridLayout, QToolButton, QLineEdit, QMessageBox
 
@@ -17,11 +14,9 @@ from OCC.BRepBndLib import brepbndlib_Add
 
 # Local Imports:
 from Actions.Functions import *
+from Discretization.Deviations import rotatePoints
 from Resources.Strings import MyStrings
 
-# System Imports:
-import math
-
 class rotationalDefectsMenu(QWidget):
     """
     # Class: rotationalDefectsMenu
@@ -156,30 +151,9 @@ class rotationalDefectsMenu(QWidget):
 
         # Getting information about the selected surfaces:
         for i in range(len(selectedFacesNumber)):
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFacesNumber[i]):
-                    break
-                index += 1
-
-            selectedEntityList.append(int(seqNumber/2+0.5))
-
-            angleX = (xAngle/180) * math.pi
-            angleY = (yAngle/180) * math.pi
-            angleZ = (zAngle/180) * math.pi
+            index = parent.cloudPoints.faceIndex(selectedFacesNumber[i])
 
-            # Defining the rotation matrix along the three axis:
-            matrixX = array([[1, 0, 0],
-                             [0, math.cos(angleX), -math.sin(angleX)],
-                             [0, math.sin(angleX), math.cos(angleX)]])
-            matrixY = array([[math.cos(angleY), 0, math.sin(angleY)],
-                             [0, 1, 0],
-                             [-math.sin(angleY), 0, math.cos(angleY)]])
-            matrixZ = array([[math.cos(angleZ), -math.sin(angleZ), 0],
-                             [math.sin(angleZ), math.cos(angleZ), 0],
-                             [0, 0, 1]])
+            selectedEntityList.append(int(selectedFacesNumber[i]/2+0.5))
 
             # Apply the boundary box functions to define the center point of a face:
             boundaryBox = Bnd_Box()
@@ -193,35 +167,10 @@ class rotationalDefectsMenu(QWidget):
             centerZ = zMin + deltaZ/2
 
             try:
-                # Translating the points near to the default basis vector:
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    point = (parent.cloudPointsList[index][i][0] - centerX,
-                             parent.cloudPointsList[index][i][1] - centerY,
-                             parent.cloudPointsList[index][i][2] - centerZ)
-                    newPointsList.append(point)
-                parent.cloudPointsList[index] = newPointsList
-
-                # Rotating all the points on the selected surface based on given parameters:
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    point = array([[parent.cloudPointsList[index][i][0]],
-                                   [parent.cloudPointsList[index][i][1]],
-                                   [parent.cloudPointsList[index][i][2]]])
-                    point = dot(matrixX, point)
-                    point = dot(matrixY, point)
-                    point = dot(matrixZ, point)
-                    newPointsList.append((point[0][0], point[1][0], point[2][0]))
-                parent.cloudPointsList[index] = newPointsList
-
-                # Translating the points back to the origianl basis vector:
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    point = (parent.cloudPointsList[index][i][0] + centerX,
-                             parent.cloudPointsList[index][i][1] + centerY,
-                             parent.cloudPointsList[index][i][2] + centerZ)
-                    newPointsList.append(point)
-                parent.cloudPointsList[index] = newPointsList
+                # Rotating all the points on the selected surface around the center of the face:
+                newPoints = rotatePoints(parent.cloudPoints.facePoints(index), (centerX, centerY, centerZ),
+                                         xAngle, yAngle, zAngle)
+                parent.cloudPoints.setFacePoints(index, newPoints)
             # Non-discretized surface error handling
             except IndexError:
                 QMessageBox.information(parent, "Invalid selected surface",
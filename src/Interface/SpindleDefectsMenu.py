@@ -6,13 +6,6 @@
 # Author: Rodrigo de Oliveira Neto.
 """
 
-# Artificial Neural Network Library Import:
-import neurolab as nl
-
-# Numpy and Math Imports:
-import numpy
-import math
-
 # PyQt5 Imports:
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QToolButton, QLineEdit, QComboBox, QMessageBox, QCheckBox, QFrame, QDoubleSpinBox, QSpacerItem
 from PyQt5.QtCore import QRect
@@ -25,6 +18,8 @@ from OCC.BRepBndLib import brepbndlib_Add
 from Actions.Functions import *
 from Resources.Strings import MyStrings
 from Discretization.DiscretizeModel import *
+from Discretization.Deviations import spindlePoints
+from Resources.NetworkRegistry import loadNetwork
 
 class spindleDefectsMenu(QWidget):
     """
@@ -175,19 +170,6 @@ class spindleDefectsMenu(QWidget):
         QMessageBox.information(parent, MyStrings.spindleInfos, MyStrings.spindleInfosDescription, QMessageBox.Ok, QMessageBox.Ok)
         return
 
-    def interval_mapping(self, image, from_min, from_max, to_min, to_max):
-        """
-        # Method: interval_mapping.
-        # Description: This method maps a list of numbers from a range to another.
-        # Parameters: * List image = input array.
-                      * Float from_min, from_max = limits of the range of the input array
-                      * Float to_min, to_max = limits of the desired range
-        """
-        from_range = from_max - from_min
-        to_range = to_max - to_min
-        scaled = numpy.array((image - from_min) / float(from_range), dtype=float)
-        return to_min + (scaled * to_range)
-
     def spindleDefects(self, parent):
         """
         # Method: spindleDefects.
@@ -196,8 +178,8 @@ class spindleDefectsMenu(QWidget):
         # Parameters: * MainWindow parent = A reference for the main window object.
         """
 
-        # Getting flexion parameters
-        tool = self.toolCondBox.currentText()
+        # Getting spindle parameters
+        toolCond = self.toolCondBox.currentIndex()
         depth = self.depth.value()
         feed = self.feed.value()
         spindle = self.spindle.value()
@@ -213,94 +195,30 @@ class spindleDefectsMenu(QWidget):
 
         # Getting information about the selected surfaces:
         for i in range(len(selectedFacesNumber)):
-            index = 0
-            seqNumber = None
-
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFacesNumber[i]):
-                    break
-                index += 1
+            index = parent.cloudPoints.faceIndex(selectedFacesNumber[i])
 
-            selectedEntityList.append(int(seqNumber/2+0.5))
-            U, V = 160, 120
-            points1, normals1 = discretizeSurface(parent.entitiesObject[pos(parent.faceSequenceNumbers[i])], parent.entitiesObject, U, V)
+            selectedEntityList.append(int(selectedFacesNumber[i]/2+0.5))
 
-            # Calculating the aproximated diameter and length of the curved profile
-            numPointsPerim = V-1
-            numPointsLength = U-2
-            x1,y1,z1 = points1[0]
-            x2,y2,z2 = points1[int(numPointsPerim/2)*(numPointsLength+1)]
-            x3,y3,z3 = points1[numPointsLength-1]
-
-            diam = ((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)**0.5
-            length = ((x3-x1)**2 + (y3-y1)**2 + (z3-z1)**2)**0.5
-
-            # Extracting the plane equation from the selected referency face
-
-            # First creating a discretized surface with 3 points
+            try:
+                # Getting the aproximated diameter and length of the curved profile and the plane
+                # equation Ax+By+Cz=D of the fixture face; both are cached for each face:
+                diam, length = surfaceDimensions(parent.entitiesObject[pos(selectedFacesNumber[i])], selectedFacesNumber[i], parent.entitiesObject)
+                A, B, C, D = facePlane(parent.entitiesObject[pos(self.selectedFixFaceSeqNumber[0])], self.selectedFixFaceSeqNumber[0], parent.entitiesObject)
+            # Invalid surface or fixture face error handling
+            except (AttributeError, ValueError):
+                QMessageBox.information(parent, MyStrings.popupInvalidSurf, MyStrings.popupInvalidSurfDescription, QMessageBox.Ok, QMessageBox.Ok)
+                parent.loadingWindow.close()
+                return
             seqFixNumber = self.selectedFixFaceSeqNumber[0]/2+0.5
-            points2, normals2 = discretizeFace(parent.entitiesObject[pos(self.selectedFixFaceSeqNumber[0])], parent.entitiesObject, 5, 10, True)
-            u = points2[0]
-            v = points2[8]
-            w = points2[15]
-            n = crossProduct(subVec(v,u), subVec(w,u))
 
-            # plane characteristic equation: Ax+By+Cy=D, (A,B,C) = n
-            A, B, C = n
-            D = A*u[0]+B*u[1]+C*u[2]
-
-            # Acquiring imputed data
-            toolCond = self.toolCondBox.currentIndex()
-            depth = self.depth.value()
-            feed = self.feed.value()
-            spindle = self.spindle.value()
-            LDratio = length/diam
-
-            # Importing the range from training data, to be used in normalization process of data imputed
-            normVec = [(0.0, 1.0), (0.5, 2.0), (0.1, 0.2), (800.0, 1400.0), (2.567, 4.089), (0.07, 0.9), (-0.188, 0.065)]
-
-            # Normalizating imputed data to be inserted on the NN model
-            depth = self.interval_mapping(depth, normVec[1][0], normVec[1][1], 0, 1)
-            feed = self.interval_mapping(feed, normVec[2][0], normVec[2][1], 0, 1)
-            spindle = self.interval_mapping(spindle, normVec[3][0], normVec[3][1], 0, 1)
-            LDratio = self.interval_mapping(LDratio, normVec[4][0], normVec[4][1], 0, 1)
-
-            aux = [toolCond, depth, feed, spindle, LDratio]
-
-            # Loading the Trained Neural Network, according to some geometrical specifications
-            NN = nl.load("..\\neural networks\\trainedANN_SpindleDefects_v0.net")
+            # Getting the Trained Neural Network, according to some geometrical specifications
+            NN = loadNetwork('trainedANN_SpindleDefects_v0.net')
 
             try:
-                newPointsList = []
-                for i in range(len(parent.cloudPointsList[index])):
-                    x0 = parent.cloudPointsList[index][i][0]
-                    y0 = parent.cloudPointsList[index][i][1]
-                    z0 = parent.cloudPointsList[index][i][2]
-
-                    # Calculating the distance between each point and the plane at the reference face
-                    dist = abs(A*x0 + B*y0 + C*z0 - D)/((A**2 + B**2 + C**2)**.5)
-
-                    # Creating LiLratio parameter, and normalizing it
-                    LiLratio = dist/length
-                    LiLratio = self.interval_mapping(LiLratio, normVec[5][0], normVec[5][1], 0, 1)
-
-                    # Creating the vector with every parameter (normalized) needed to compose the input of the NN model
-                    normInput = [[toolCond, depth, feed, spindle, LDratio, LiLratio]]
-
-                    # Obtaining the output (normalized) from the NN model
-                    nnOutput = NN.sim(normInput)
-
-                    # Desnormalizing the output
-                    nnOutput = self.interval_mapping(nnOutput, 0, 1, normVec[6][0], normVec[6][1])
-
-                    offset = nnOutput[0][0]
-
-                    # Applying the offset for each point
-                    point = (x0 + parent.faceNormalVectors[index][i][0] * offset, y0 + parent.faceNormalVectors[index][i][1] * offset, z0 + parent.faceNormalVectors[index][i][2] * offset)
-
-                    newPointsList.append(point)
-                parent.cloudPointsList[index] = newPointsList
+                # Applying the offsets predicted by the NN model to all the points at once
+                newPoints = spindlePoints(parent.cloudPoints.facePoints(index), parent.cloudPoints.faceNormals(index), NN,
+                                          toolCond, depth, feed, spindle, diam, length, (A, B, C, D))
+                parent.cloudPoints.setFacePoints(index, newPoints)
             # Non-discretized surface error handling
             except IndexError:
                 QMessageBox.information(parent, MyStrings.popupInvalidSurf, MyStrings.popupInvalidSurfDescription, QMessageBox.Ok, QMessageBox.Ok)
@@ -149,19 +149,15 @@ class surfaceDiscretizeMenu(QWidget):
             # Performs the surfaceDiscretization using the Discretization package:
             for sequence in selectedFaces:
                 try:
-                    points, normals = discretizeSurface(parent.entitiesObject[pos(sequence)], parent.entitiesObject,
-                                                        Uparam, Vparam)
+                    points, normals, gridShape = discretizeSurface(parent.entitiesObject[pos(sequence)],
+                                                                   parent.entitiesObject, Uparam, Vparam)
                 # Handling the error case in which the user inputs a value less than 2
                 except ValueError:
                     QMessageBox.information(parent, MyStrings.popupInvalidUVTitle,
                                             MyStrings.popupInvalidUVDescription,
                                             QMessageBox.Ok, QMessageBox.Ok)
                     return
-                parent.faceSequenceNumbers.append(sequence)
-                parent.faceNormalVectors.append(normals)
-                parent.cloudPointsList.append(points)
-                parent.UVproperty.append([Uparam, Vparam])
-                parent.normVectorsToggle.append(True)
+                parent.cloudPoints.addFace(sequence, points, normals, gridShape)
         else:
             QMessageBox.information(parent, "Surface not selected",
                                     "Surface not selected. Please, select one to generate a point cloud.", QMessageBox.Ok, QMessageBox.Ok)
@@ -176,14 +172,7 @@ class surfaceDiscretizeMenu(QWidget):
         # Building the logbook tupple
         selectedEntityList = []
         for i in range(len(selectedFaces)):
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFaces[i]):
-                    break
-                index += 1
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(selectedFaces[i]/2+0.5))
         logText = '> [Discretization] Parametric:\n\tEntity list: '+str(selectedEntityList)+'\n\tU Value: '+str(Uparam)+'\n\tV Value: '+str(Vparam)+'\n\n'
         parent.logbookList.append(logText)
 
@@ -7,9 +7,6 @@
 # System Imports:
 import math
 
-# Numpy Imports:
-from numpy import array, dot
-
 # PyQt5 Imports:
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QToolButton, QLineEdit, QComboBox, QMessageBox, QCheckBox, QFrame
 
@@ -19,6 +16,7 @@ from OCC.BRepBndLib import brepbndlib_Add
 
 # Local Imports:
 from Actions.Functions import *
+from Discretization.Deviations import torsionPoints
 from Resources.Strings import MyStrings
 
 
@@ -173,93 +171,30 @@ class torsionDefectsMenu(QWidget):
         deltaX = xMax - xMin
         deltaY = yMax - yMin
         deltaZ = zMax - zMin
-        self.centerX = xMin + deltaX/2
-        self.centerY = yMin + deltaY/2
-        self.centerZ = zMin + deltaZ/2
+        centerX = xMin + deltaX/2
+        centerY = yMin + deltaY/2
+        centerZ = zMin + deltaZ/2
 
         # Declaring the list of index of deviated surface(s)
         selectedEntityList = []
 
         # Getting information about the selected surfaces:
         for i in range(len(selectedFacesNumber)):
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == selectedFacesNumber[i]):
-                    break
-                index += 1
-
-            selectedEntityList.append(int(seqNumber/2+0.5))
-
-            # Identifying the longitudional axis and verifying if it is a circular beam or not
-            if(long_axis == 'z'):
-                Li_max = (deltaZ/2)*10**(-3)
-                if(round(deltaX,4) == round(deltaY, 4)):
-                    circBeam = True
-                    c = (deltaX/2)*10**(-3)
-                else:
-                    circBeam = False
-                    if(deltaX != 0):
-                        a = deltaX
-                    else:
-                        a = deltaY
-            elif(long_axis == 'x'):
-                Li_max = (deltaX/2)*10**(-3)
-                if(round(deltaZ, 4) == round(deltaY, 4)):
-                    circBeam = True
-                    c = (deltaZ/2)*10**(-3)
-                else:
-                    circBeam = False
-                    if(deltaY != 0):
-                        a = deltaY
-                    else:
-                        a = deltaZ
-            else:
-                Li_max = (deltaY/2)*10**(-3)
-                if(round(deltaX, 4) == round(deltaZ, 4)):
-                    circBeam = True
-                    c = (deltaX/2)*10**(-3)
-                else:
-                    circBeam = False
-                    if(deltaX != 0):
-                        a = deltaX
-                    else:
-                        a = deltaZ
-
-            if(perp_axis == 'x'):
-                r = deltaX/2
-            elif(perp_axis == 'y'):
-                r = deltaY/2
-            else:
-                r = deltaZ/2
-
-            if(circBeam):
-                J = (1/2)*math.pi*c**4
-            else:
-                c2 = 0.1406
-                a = a*10**(-3)
-                b = a
-                J = c2*a*b**3
+            index = parent.cloudPoints.faceIndex(selectedFacesNumber[i])
+
+            selectedEntityList.append(int(selectedFacesNumber[i]/2+0.5))
+
+            # Getting the half length along the longitudional axis and the radius along the perpendicular axis:
+            halfLength = {'x': deltaX, 'y': deltaY, 'z': deltaZ}[long_axis]/2
+            r = {'x': deltaX, 'y': deltaY, 'z': deltaZ}[perp_axis]/2
 
             theta_max = math.atan(max_def/r)
 
             try:
-                # Flexioning all the points on the selected surface based on given parameters:
-                for i in range(len(parent.cloudPointsList[index])):
-                    x0 = parent.cloudPointsList[index][i][0]
-                    y0 = parent.cloudPointsList[index][i][1]
-                    z0 = parent.cloudPointsList[index][i][2]
-                    if(long_axis == "x"):
-                        L = (x0 - self.centerX)*10**(-3)
-                    elif(long_axis == "y"):
-                        L = (y0 - self.centerY)*10**(-3)
-                    elif(long_axis == "z"):
-                        L = (z0 - self.centerZ)*10**(-3)
-
-                    torsionAngle = theta_max*L/Li_max
-
-                    self.rotatePoints(parent, torsionAngle, index, i, long_axis)
+                # Twisting all the points on the selected surface based on given parameters:
+                newPoints = torsionPoints(parent.cloudPoints.facePoints(index), (centerX, centerY, centerZ),
+                                          long_axis, theta_max, halfLength)
+                parent.cloudPoints.setFacePoints(index, newPoints)
             # Handling non-discretized surface error
             except IndexError:
                 QMessageBox.information(parent, MyStrings.popupInvalidSurf, MyStrings.popupInvalidSurfDescription, QMessageBox.Ok, QMessageBox.Ok)
@@ -322,59 +257,3 @@ class torsionDefectsMenu(QWidget):
             parent.selectedSequenceNumber.append(2*i+1)
             selectedObjectText += str(i+1) + ' '
         self.selectedObject.setText(selectedObjectText)
-
-    def rotatePoints(self, parent, torsionAngle, index, i, long_axis):
-        """
-        # Method: rotatePoints.
-        # Description: This complementary method applies a rotational defect in the
-                       surface with angles varying according to the current discrete posisition.
-        # Parameters: * MainWindow parent = A reference for the main window object.
-                      * Float torsionAngle = Angle value to rotate.
-                      * Int index = A index used in the discretized surfaces list.
-                      # Int i = A index used in the selected faces list.
-                      * Char long_axis = Longitudional axis.
-
-        """
-        # Defining the rotation matrix along the three axis:
-        if(long_axis == 'x'):
-            rotMatrixX = array([[1, 0, 0],
-                             [0, math.cos(torsionAngle), -math.sin(torsionAngle)],
-                             [0, math.sin(torsionAngle), math.cos(torsionAngle)]])
-            rotMatrixY = array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
-            rotMatrixZ = rotMatrixY
-        elif(long_axis == 'y'):
-            rotMatrixY = array([[math.cos(torsionAngle), 0, math.sin(torsionAngle)],
-                             [0, 1, 0],
-                             [-math.sin(torsionAngle), 0, math.cos(torsionAngle)]])
-            rotMatrixX = array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
-            rotMatrixZ = rotMatrixX
-        elif(long_axis == 'z'):
-            rotMatrixZ = array([[math.cos(torsionAngle), -math.sin(torsionAngle), 0],
-                             [math.sin(torsionAngle), math.cos(torsionAngle), 0],
-                             [0, 0, 1]])
-            rotMatrixX = array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
-            rotMatrixY = rotMatrixX
-
-        # Translating the points near to the default basis vector:
-        point = (parent.cloudPointsList[index][i][0] - self.centerX,
-                 parent.cloudPointsList[index][i][1] - self.centerY,
-                 parent.cloudPointsList[index][i][2] - self.centerZ)
-
-        parent.cloudPointsList[index][i] = point
-
-        # Rotating all the points on the selected surface based on given parameters:
-        point = array([[parent.cloudPointsList[index][i][0]],
-                       [parent.cloudPointsList[index][i][1]],
-                       [parent.cloudPointsList[index][i][2]]])
-        point = dot(rotMatrixX, point)
-        point = dot(rotMatrixY, point)
-        point = dot(rotMatrixZ, point)
-
-        parent.cloudPointsList[index][i] = (point[0][0], point[1][0], point[2][0]) # newPointsList
-
-        # Translating the points back to the origianl basis vector:
-        point = (parent.cloudPointsList[index][i][0] + self.centerX,
-                 parent.cloudPointsList[index][i][1] + self.centerY,
-                 parent.cloudPointsList[index][i][2] + self.centerZ)
-
-        parent.cloudPointsList[index][i] = point # newPointsList
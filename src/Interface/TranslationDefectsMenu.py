@@ -10,6 +10,7 @@ from PyQt5.QtWidgets import QWidget, QLabel, QGridLayout, QToolButton, QLineEdit
 
 # Local Imports:
 from Actions.Functions import *
+from Discretization.Deviations import translatePoints
 from Resources.Strings import MyStrings
 
 class translationDefectsMenu(QWidget):
@@ -183,37 +184,23 @@ class translationDefectsMenu(QWidget):
 
         # Getting information about the selected surfaces:
         for sequence in selectedFaces:
-            index = 0
-            seqNumber = None
-            while index < len(parent.faceSequenceNumbers):
-                seqNumber = parent.faceSequenceNumbers[index]
-                if(seqNumber == sequence):
-                    break
-                index += 1
+            index = parent.cloudPoints.faceIndex(sequence)
 
-            selectedEntityList.append(int(seqNumber/2+0.5))
+            selectedEntityList.append(int(sequence/2+0.5))
 
             # Translating all the points on the selected surface based on given parameters:
-            newPointsList = []
             try:
                 if(xDirection == 'Multiple Values'):
-                    for i in range(len(parent.cloudPointsList[index])):
-                        point = (parent.cloudPointsList[index][i][0] + parent.faceNormalVectors[index][i][0] * offset,
-                                 parent.cloudPointsList[index][i][1] + parent.faceNormalVectors[index][i][1] * offset,
-                                 parent.cloudPointsList[index][i][2] + parent.faceNormalVectors[index][i][2] * offset)
-                        newPointsList.append(point)
+                    direction = parent.cloudPoints.faceNormals(index)
                 else:
-                    for i in range(len(parent.cloudPointsList[index])):
-                        point = (parent.cloudPointsList[index][i][0] + float(xDirection) * offset,
-                                 parent.cloudPointsList[index][i][1] + float(yDirection) * offset,
-                                 parent.cloudPointsList[index][i][2] + float(zDirection) * offset)
-                        newPointsList.append(point)
+                    direction = (float(xDirection), float(yDirection), float(zDirection))
+                newPoints = translatePoints(parent.cloudPoints.facePoints(index), direction, offset)
             # Handling non-discretized surface error
             except IndexError:
                 QMessageBox.information(parent, "Invalid selected surface",
                                         "Invalid selected surface. Please, select a discretized one to apply a deviation.", QMessageBox.Ok, QMessageBox.Ok)
                 return
-            parent.cloudPointsList[index] = newPointsList
+            parent.cloudPoints.setFacePoints(index, newPoints)
 
         # Building the logbook tupple
         logText = '> [Deviation] Translational:\n\tEntity list: '+str(selectedEntityList)+'\n\tX Value: '+xDirection+'\n\tY Value: '+yDirection+'\n\tZ Value: '+zDirection+'\n\tOffset: '+str(offset)+' mm\n\n'
@@ -10,6 +10,8 @@ from PyQt5.QtWidgets import QTextEdit, QWidget, QGridLayout, QLabel, QFileDialog
 
 # Local Imports:
 from Resources.Strings import MyStrings
+from Actions.Functions import rebuildCloud, shapesBoundingBox
+from Discretization.Logbook import splitLog, parseEntry, replayLog
 
 class logMenu(QWidget):
     """
@@ -135,139 +137,39 @@ class logMenu(QWidget):
         if not fileName:
             return
 
-        # Opening the file that contains the log to be loaded
-        file = open(fileName, 'r')
-
-        line = file.readline()
-        # Iterative process that reads each line of the file and internally calls the associated functions
-        while line:
-            if line == '> [Discretization] Automatic:\n':
-                mode = file.readline()[7:-1]
-                N = float(file.readline()[10:-1])
-                precision = float(file.readline()[12:-1])
-                try:
-                    U = float(file.readline()[10:-1])
-                    V = float(file.readline()[10:-1])
-                except:
-                    U, V = None, None
-                paramList = [mode, N, precision, U, V]
-
-                from Interface.AutoDiscretizeMenu import autoDiscretizeMenu
-                autoDiscretizeCall = autoDiscretizeMenu(parent)
-                autoDiscretizeCall.autoDiscretize(parent, True, paramList)
-
-            elif line == '> [Discretization] Flat:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                mode = file.readline()[7:-1]
-                N = float(file.readline()[10:-1])
-                precision = float(file.readline()[12:-1])
-                paramList = [entList, mode, N, precision]
-
-                from Interface.FaceDiscretizeMenu import faceDiscretizeMenu
-                faceDiscretizeCall = faceDiscretizeMenu(parent)
-                faceDiscretizeCall.faceDiscretize(parent, True, paramList)
-            elif line == '> [Discretization] Parametric:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                U = float(file.readline()[10:-1])
-                V = float(file.readline()[10:-1])
-                paramList = [entList, U, V]
-
-                from Interface.SurfaceDiscretizeMenu import surfaceDiscretizeMenu
-                surfaceDiscretizeCall = surfaceDiscretizeMenu(parent)
-                surfaceDiscretizeCall.surfaceDiscretize(parent, True, paramList)
-            elif line == '> [Deviation] Translational:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                X = file.readline()[10:-1]
-                Y = file.readline()[10:-1]
-                Z = file.readline()[10:-1]
-                offset = float(file.readline()[9:-4])
-                paramList = [entList, X, Y, Z, offset]
-
-                from Interface.TranslationDefectsMenu import translationDefectsMenu
-                translationDefectsCall = translationDefectsMenu(parent)
-                translationDefectsCall.translatePoints(parent, True, paramList)
-            elif line == '> [Deviation] Rotation:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                xAng = float(file.readline()[10:-2])
-                yAng = float(file.readline()[10:-2])
-                zAng = float(file.readline()[10:-2])
-                paramList = [entList, xAng, yAng, zAng]
-
-                from Interface.RotationalDefectsMenu import rotationalDefectsMenu
-                rotationalDefectsCall = rotationalDefectsMenu(parent)
-                rotationalDefectsCall.rotatePoints(parent, True, paramList)
-            elif line == '> [Deviation] Random:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                minOffset = float(file.readline()[14:-4])
-                maxOffset = float(file.readline()[14:-4])
-                paramList = [entList, minOffset, maxOffset]
-
-                from Interface.RandomDefectsMenu import randomDefectsMenu
-                randomDefectsCall = randomDefectsMenu(parent)
-                randomDefectsCall.randomPoints(parent, True, paramList)
-            elif line == '> [Deviation] Flexion:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                longAxis = file.readline()[13:-1]
-                perpAxis = file.readline()[13:-1]
-                maxDef = float(file.readline()[18:-4])
-                paramList = [entList, longAxis, perpAxis, maxDef]
-
-                from Interface.FlexionDefectsMenu import flexionDefectsMenu
-                flexionDefectsCall = flexionDefectsMenu(parent)
-                flexionDefectsCall.flexionPoints(parent, True, paramList)
-            elif line == '> [Deviation] Periodic Pattern:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                drillAxis = file.readline()[19:-1]
-                drillAxis = self.str2bool(drillAxis)
-                amp = float(file.readline()[12:-4])
-                freq = float(file.readline()[12:-1])
-                paramList = [entList, drillAxis, amp, freq]
-                from Interface.WaveDefectsMenu import waveDefectsMenu
-                waveDefectsCall = waveDefectsMenu(parent)
-                waveDefectsCall.wavePoints(parent, True, paramList)
-            elif line == '> [Deviation] Ovalization:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                maxDef = float(file.readline()[14:-4])
-                paramList = [entList, maxDef]
-
-                from Interface.OvalDefectsMenu import ovalDefectsMenu
-                ovalDefectsCall = ovalDefectsMenu(parent)
-                ovalDefectsCall.ovalPoints(parent, True, paramList)
-            elif line == '> [Deviation] Torsion:\n':
-                entList = file.readline()[15:-2]
-                entList = entList.split(',')
-                entList = [float(element) for element in entList]
-                longAxis = file.readline()[13:-1]
-                perpAxis = file.readline()[13:-1]
-                maxDef = float(file.readline()[18:-4])
-                paramList = [entList, longAxis, perpAxis, maxDef]
+        # Reading the log and converting its entries to operations:
+        try:
+            with open(fileName, 'r') as file:
+                entries = splitLog(file.read())
+            operations = [parseEntry(entry) for entry in entries]
+        except (OSError, UnicodeDecodeError, ValueError) as error:
+            QMessageBox.information(parent, MyStrings.popupInvalidLogTitle,
+                                    MyStrings.popupInvalidLogDescription + str(error),
+                                    QMessageBox.Ok, QMessageBox.Ok)
+            return
 
-                from Interface.TorsionDefectsMenu import torsionDefectsMenu
-                torsionDefectsCall = torsionDefectsMenu(parent)
-                torsionDefectsCall.torsionPoints(parent, True, paramList)
-            line = file.readline()
+        # Loads the loading window:
+        parent.loadingWindow.show()
+
+        # Applying the operations to a copy of the point cloud, without the side widgets. The copy
+        # replaces the point cloud only if all the operations were applied, so the session keeps
+        # matching its logbook. The deviations use the bounding boxes of the shapes, as the menus:
+        try:
+            cloud = replayLog(operations, parent.entitiesObject, parent.cloudPoints.copy(),
+                              workers=parent.discretizationWorkers,
+                              boundingBox=lambda cloud, indexes: shapesBoundingBox(parent, cloud, indexes))
+        except ValueError as error:
+            parent.loadingWindow.close()
+            QMessageBox.information(parent, MyStrings.popupInvalidLogTitle,
+                                    MyStrings.popupInvalidLogDescription + str(error),
+                                    QMessageBox.Ok, QMessageBox.Ok)
+            return
+        parent.cloudPoints = cloud
+        parent.logbookList += entries
 
-    def str2bool(self, v):
-        """
-        # Method: str2bool.
-        # Description: This method converts a string variable to a bool.
-        # Parameters: * String v = The variable to be converted.
-        """
+        # Rebuilding the point cloud object in the local context:
+        rebuildCloud(parent)
+        parent.activeCloudFile = MyStrings.currentSessionGeneratedPoints
 
-        return v.lower() in ('True', 'true')
+        # Closes the loading window:
+        parent.loadingWindow.close()
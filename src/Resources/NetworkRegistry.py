@@ -0,0 +1,296 @@
+"""
+# Module: NetworkRegistry.py
+# Description: This module loads the trained neural networks shipped in the 'neural networks'
+folder of the package. Each network is loaded from disk only once per process and kept in
+memory, with the weights of its layers extracted into plain numpy arrays for a fast forward
+pass that doesn't go through the neurolab objects. The networks can also be compiled to .npz
+files, which are read with numpy only, so neurolab isn't needed to run them.
+# Author: Willian Hideak Arita da Silva.
+"""
+
+import os
+import hashlib
+import warnings
+import numpy
+
+# The folder of the trained neural networks, found relative to this package:
+networksFolder = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                               '..', '..', 'neural networks'))
+
+# The element-wise transfer functions of neurolab, by the name of their class:
+transferFunctions = {
+    'TanSig': numpy.tanh,
+    'LogSig': lambda x: 1 / (1 + numpy.exp(-x)),
+    'PureLin': lambda x: x,
+    'HardLim': lambda x: (x > 0) * 1.0,
+    'HardLims': lambda x: (x > 0) * 2.0 - 1.0,
+    'SatLin': lambda x: numpy.clip(x, 0, 1),
+    'SatLins': lambda x: numpy.clip(x, -1, 1),
+}
+
+# The ids of the transfer functions in the compiled (.npz) networks:
+transferNames = ['PureLin', 'TanSig', 'LogSig', 'HardLim', 'HardLims', 'SatLin', 'SatLins']
+
+# The networks already loaded, by file name:
+loadedNetworks = {}
+
+class NetworkModel(object):
+    """
+    # Class: NetworkModel.
+    # Description: A trained feed-forward or recurrent (e.g. Elman) network made of perceptron
+    layers. Each layer computes transfer(W x + b), where x is the concatenation of the signals
+    listed in its connect entry (-1 is the network input, other numbers are layer outputs). Like
+    neurolab, the outputs of the layers are kept between calls, so recurrent connections see the
+    outputs of the previous input.
+    """
+
+    def __init__(self, weights, biases, transfers, connect, outputs):
+        """
+        # Method: __init__.
+        # Description: The init method for creating a network from its parameters.
+        # Parameters: * List weights = The (cn, ci) weight matrix of each layer.
+                      * List biases = The bias vector of each layer.
+                      * List transfers = The name of the transfer function of each layer.
+                      * List connect = The neurolab connect list: the sources of the signal of
+                      each layer, followed by the sources of the network output.
+                      * List outputs = The initial output vector of each layer.
+        """
+
+        self.weights = [numpy.asarray(w, dtype=float) for w in weights]
+        self.biases = [numpy.asarray(b, dtype=float) for b in biases]
+        self.transfers = list(transfers)
+        self.connect = [list(nums) for nums in connect]
+        self.initialOutputs = [numpy.array(out, dtype=float) for out in outputs]
+        for name in self.transfers:
+            if name not in transferFunctions:
+                raise ValueError('unsupported transfer function: ' + name)
+
+        # The layers up to the last one with a recurrent connection must be evaluated one input
+        # after the other. The layers after them are evaluated for all the inputs at once:
+        self.numLoopLayers = 0
+        for nl, nums in enumerate(self.connect[:-1]):
+            for ns in nums:
+                if(ns >= nl):
+                    self.numLoopLayers = max(self.numLoopLayers, ns + 1, nl + 1)
+        self.reset()
+
+    def reset(self):
+        """
+        # Method: reset.
+        # Description: Restores the outputs of the layers saved with the trained network.
+        """
+        self.outputs = [out.copy() for out in self.initialOutputs]
+
+    def sim(self, inputs):
+        """
+        # Method: sim.
+        # Description: Simulates the network, as neurolab's Net.sim. The layers without recurrent
+        connections are evaluated for all the inputs at once. The layers with recurrent
+        connections are evaluated one input after the other, as their outputs depend on the
+        previous inputs, but the part of their signal that comes from the network input is
+        computed for all the inputs at once.
+        # Parameters: * Array inputs = A (n, ci) array with one input vector in each row.
+        # Returns: * Array = A (n, co) array with the output vector of each input.
+        """
+        inputs = numpy.atleast_2d(numpy.asarray(inputs, dtype=float))
+        signals = {-1: inputs}
+
+        # Splitting the weights of the recurrent layers by the source of their signal:
+        sources = []
+        for nl in range(self.numLoopLayers):
+            start = 0
+            signals[nl] = numpy.tile(self.biases[nl], (len(inputs), 1))
+            layerSources = []
+            for ns in self.connect[nl]:
+                size = inputs.shape[1] if ns == -1 else len(self.outputs[ns])
+                block = self.weights[nl][:, start:start + size]
+                if(ns == -1):
+                    signals[nl] += numpy.dot(inputs, block.T)
+                else:
+                    layerSources.append((ns, block))
+                start += size
+            sources.append(layerSources)
+
+        # Evaluating the recurrent layers one input after the other:
+        for row in range(len(inputs)):
+            for nl in range(self.numLoopLayers):
+                signal = signals[nl][row]
+                for ns, block in sources[nl]:
+                    signal = signal + numpy.dot(block, self.outputs[ns])
+                self.outputs[nl] = transferFunctions[self.transfers[nl]](signal)
+                signals[nl][row] = self.outputs[nl]
+
+        # Evaluating the other layers for all the inputs at once:
+        for nl in range(self.numLoopLayers, len(self.weights)):
+            signal = numpy.concatenate([signals[ns] for ns in self.connect[nl]], axis=1)
+            signals[nl] = transferFunctions[self.transfers[nl]](numpy.dot(signal, self.weights[nl].T) + self.biases[nl])
+            if(len(inputs)):
+                self.outputs[nl] = signals[nl][-1].copy()
+        return numpy.concatenate([signals[ns] for ns in self.connect[-1]], axis=1)
+
+    def predict(self, inputs):
+        """
+        # Method: predict.
+        # Description: Simulates the network for a sequence of inputs starting from the outputs
+        saved with the trained network, without changing the current outputs of the layers.
+        # Parameters: * Array inputs = A (n, ci) array with one input vector in each row.
+        # Returns: * Array = A (n, co) array with the output vector of each input.
+        """
+        outputs = self.outputs
+        self.reset()
+        try:
+            return self.sim(inputs)
+        finally:
+            self.outputs = outputs
+
+def extractNetwork(net):
+    """
+    # Function: extractNetwork.
+    # Description: Extracts the parameters of a neurolab network into a NetworkModel.
+    # Parameters: * Net net = A neurolab network made of perceptron layers.
+    # Returns: * NetworkModel = The equivalent network.
+    """
+    for layer in net.layers:
+        if(set(layer.np) != {'w', 'b'}):
+            raise ValueError('unsupported layer: ' + type(layer).__name__)
+    return NetworkModel([layer.np['w'] for layer in net.layers],
+                        [layer.np['b'] for layer in net.layers],
+                        [type(layer.transf).__name__ for layer in net.layers],
+                        net.connect,
+                        [layer.out for layer in net.layers])
+
+def networkPath(fileName):
+    """
+    # Function: networkPath.
+    # Description: Provides the path of a file of the 'neural networks' folder.
+    # Parameters: * String fileName = The name of the network file.
+    # Returns: * String = The absolute path of the file.
+    """
+    return os.path.join(networksFolder, fileName)
+
+def fileHash(filePath):
+    """
+    # Function: fileHash.
+    # Description: Computes the SHA-1 hash of the contents of a file.
+    # Parameters: * String filePath = The path of the file.
+    # Returns: * String = The hexadecimal hash.
+    """
+    with open(filePath, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+def saveNetwork(network, filePath, sourceHash=''):
+    """
+    # Function: saveNetwork.
+    # Description: Saves a network to a compiled .npz file. The file stores the weights, biases
+    and initial outputs of each layer, the ids of the transfer functions (see transferNames),
+    the connect list and the hash of the neurolab file it was compiled from.
+    # Parameters: * NetworkModel network = The network to be saved.
+                  * String filePath = The path of the .npz file.
+                  * String sourceHash = The fileHash of the neurolab (.net) file of the network.
+    """
+    arrays = {'activations': numpy.array([transferNames.index(name) for name in network.transfers]),
+              'connectSources': numpy.array([ns for nums in network.connect for ns in nums], dtype=int),
+              'connectSizes': numpy.array([len(nums) for nums in network.connect], dtype=int),
+              'sourceHash': numpy.array(sourceHash)}
+    for nl in range(len(network.weights)):
+        arrays['weights' + str(nl)] = network.weights[nl]
+        arrays['biases' + str(nl)] = network.biases[nl]
+        arrays['outputs' + str(nl)] = network.initialOutputs[nl]
+    with open(filePath, 'wb') as file:
+        numpy.savez(file, **arrays)
+
+def readNetwork(filePath):
+    """
+    # Function: readNetwork.
+    # Description: Reads a network from a compiled .npz file written by saveNetwork.
+    # Parameters: * String filePath = The path of the .npz file.
+    # Returns: * NetworkModel = The network.
+    """
+    with numpy.load(filePath, allow_pickle=False) as arrays:
+        activations = arrays['activations']
+        sizes = arrays['connectSizes']
+        offsets = numpy.concatenate(([0], numpy.cumsum(sizes)))
+        connect = [arrays['connectSources'][offsets[i]:offsets[i + 1]].tolist() for i in range(len(sizes))]
+        return NetworkModel([arrays['weights' + str(nl)] for nl in range(len(activations))],
+                            [arrays['biases' + str(nl)] for nl in range(len(activations))],
+                            [transferNames[i] for i in activations],
+                            connect,
+                            [arrays['outputs' + str(nl)] for nl in range(len(activations))])
+
+def compiledHash(filePath):
+    """
+    # Function: compiledHash.
+    # Description: Reads the hash of the neurolab file stored in a compiled .npz file.
+    # Parameters: * String filePath = The path of the .npz file.
+    # Returns: * String = The hash, or '' if the file doesn't store it.
+    """
+    with numpy.load(filePath, allow_pickle=False) as arrays:
+        return str(arrays['sourceHash']) if 'sourceHash' in arrays.files else ''
+
+def compileNetwork(fileName):
+    """
+    # Function: compileNetwork.
+    # Description: Converts a neurolab (.net) network of the 'neural networks' folder to a
+    compiled .npz file with the same name, in the same folder.
+    # Parameters: * String fileName = The name of the neurolab network file.
+    # Returns: * NetworkModel = The converted network.
+    """
+    import neurolab
+    network = extractNetwork(neurolab.load(networkPath(fileName)))
+    saveNetwork(network, networkPath(os.path.splitext(fileName)[0] + '.npz'), fileHash(networkPath(fileName)))
+    return network
+
+def compileNetworks():
+    """
+    # Function: compileNetworks.
+    # Description: Converts all the neurolab (.net) networks of the 'neural networks' folder to
+    compiled .npz files.
+    """
+    for fileName in sorted(os.listdir(networksFolder)):
+        if(fileName.endswith('.net')):
+            compileNetwork(fileName)
+
+def loadNetwork(fileName):
+    """
+    # Function: loadNetwork.
+    # Description: Provides a trained network of the 'neural networks' folder. The file is only
+    read the first time the network is requested; later calls return the same NetworkModel,
+    reset to the outputs saved with the trained network. If there is a compiled .npz file with
+    the same name, it is read instead of the neurolab file, so neurolab isn't needed. A compiled
+    file whose stored hash doesn't match the neurolab file is considered stale (e.g. after
+    retraining): the neurolab file is read instead, or, if neurolab isn't installed, the stale
+    file is read with a warning.
+    # Parameters: * String fileName = The name of the neurolab (.net) network file.
+    # Returns: * NetworkModel = The loaded network.
+    """
+    if(fileName not in loadedNetworks):
+        sourcePath = networkPath(fileName)
+        compiledPath = networkPath(os.path.splitext(fileName)[0] + '.npz')
+        compiled = os.path.exists(compiledPath)
+        stale = compiled and os.path.exists(sourcePath) and compiledHash(compiledPath) != fileHash(sourcePath)
+        if(compiled and not stale):
+            loadedNetworks[fileName] = readNetwork(compiledPath)
+        else:
+            try:
+                import neurolab
+            except ImportError:
+                if(not stale):
+                    raise
+                warnings.warn(compiledPath + ' was not compiled from the current ' + fileName + ' and neurolab is '
+                              'not installed to read it; run python -m Resources.NetworkRegistry to compile it again')
+                loadedNetworks[fileName] = readNetwork(compiledPath)
+            else:
+                loadedNetworks[fileName] = extractNetwork(neurolab.load(sourcePath))
+    network = loadedNetworks[fileName]
+    network.reset()
+    return network
+
+def clearNetworks():
+    """
+    # Function: clearNetworks.
+    # Description: Removes all the loaded networks from memory.
+    """
+    loadedNetworks.clear()
+
+if __name__ == '__main__':
+    compileNetworks()
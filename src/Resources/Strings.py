@@ -254,6 +254,9 @@ class MyStrings():
     popupInvalidFreq = 'Invalid frequency value'
     popupInvalidFreqDescription = 'Invalid frequency value. Please, input a value different from 0.'
 
+    popupInvalidLogTitle = 'Invalid log file'
+    popupInvalidLogDescription = 'The log file could not be applied:\n'
+
     popupReverseNonDiscNormSurf = 'Invalid vector reversing operation'
     popupReverseNonDiscNormSurfDescription = "Error: the selected surface isn't discretized. Please, reverse normal vectors only from discretized surfaces"
 
@@ -0,0 +1,189 @@
+"""
+# Module: eggtol.py
+# Description: This is the command line entry point of the application. It runs discretization
+and deviation pipelines described in job files without the user interface, OpenCASCADE or Qt:
+    python -m eggtol run job.yaml [job2.yaml ...]
+    python -m eggtol replay model.igs logbook.txt -o cloud.pcd
+A job file is written in YAML (read with PyYAML when it is installed) or in JSON, e.g.:
+    model: ../examples/Cylinder.igs
+    discretization:
+      mode: grid            # grid (N x N points) or density (N points/mm)
+      density: 10
+      precision: 10         # between 10 and 50
+      parametric: true      # discretize the non-planar faces over a U x V grid
+      uParameter: 20
+      vParameter: 20
+      workers: 1
+    seed: 42                # optional, for the random deviations
+    deviations:
+      - type: translation   # see Discretization.Pipeline.deviationFunctions
+        entities: [3]       # optional, all the faces by default (the parametric ones for oval and spindle)
+        direction: [0, 0, 1] # or normal; multiplied by the offset, as in the menu
+        normalize: false    # optional, scales the direction to a unit vector first
+        offset: 0.1
+    output: [cloud.pcd, cloud.txt]
+Relative paths are taken from the folder of the job file. The replay command applies the
+discretizations and deviations of a logbook saved by the Log menu to a model. The format of
+each output file is chosen by its extension: .pcd or .txt.
+# Author: Willian Hideak Arita da Silva.
+"""
+
+# System Imports:
+import sys
+import os
+import json
+import argparse
+import numpy
+
+from Import.IGESImport import loadEntityTable
+from Discretization.DiscretizeModel import discretizeModel, generatePcd, generateTxt
+from Discretization.Pipeline import applyDeviation
+from Discretization.Logbook import readLog, replayLog
+
+# The functions that write each output format, by file extension:
+outputFunctions = {'.pcd': generatePcd, '.txt': generateTxt}
+
+def loadJob(jobPath):
+    """
+    # Function: loadJob.
+    # Description: Reads a job file. YAML is only imported when it is needed, and JSON is used
+    when it isn't installed (a JSON document is also a valid YAML document).
+    # Parameters: * Str jobPath = The path of the job file.
+    # Returns: * Dict job = The job description.
+    """
+    with open(jobPath) as jobFile:
+        text = jobFile.read()
+    if(os.path.splitext(jobPath)[1].lower() != '.json'):
+        try:
+            import yaml
+        except ImportError:
+            pass
+        else:
+            job = yaml.safe_load(text)
+            if(not isinstance(job, dict)):
+                raise ValueError('the job must be a mapping')
+            return job
+    job = json.loads(text)
+    if(not isinstance(job, dict)):
+        raise ValueError('the job must be a mapping')
+    return job
+
+def runJob(job, folder='.'):
+    """
+    # Function: runJob.
+    # Description: Imports the model of a job, discretizes it, applies its deviations in order
+    and writes its output files.
+    # Parameters: * Dict job = The job description (see the module description).
+                  * Str folder = The folder from which relative paths are taken.
+    # Returns: * PointCloud cloud = The deviated point cloud.
+    """
+    if('model' not in job):
+        raise ValueError('the job has no model')
+    settings = job.get('discretization', {})
+    mode = settings.get('mode', 'grid')
+    if(mode not in ('grid', 'density')):
+        raise ValueError('the discretization mode must be grid or density')
+    precision = float(settings.get('precision', 10))
+    if(precision > 50 or precision < 10):
+        raise ValueError('the precision must be between 10 and 50')
+    useParametric = bool(settings.get('parametric', False))
+    Uparam = int(settings['uParameter']) if useParametric else None
+    Vparam = int(settings['vParameter']) if useParametric else None
+    outputs = job.get('output', [])
+    if(isinstance(outputs, str)):
+        outputs = [outputs]
+    checkOutputs(outputs)
+
+    objectList = loadEntityTable(os.path.join(folder, job['model']))
+    cloud = discretizeModel(objectList, float(settings.get('density', 10)), precision, Uparam, Vparam,
+                            useParametric, mode == 'grid', int(settings.get('workers', 1)))
+
+    generator = numpy.random.default_rng(job.get('seed'))
+    for deviation in job.get('deviations', []):
+        applyDeviation(cloud, objectList, deviation, generator)
+
+    writeOutputs(cloud, outputs, folder)
+    return cloud
+
+def writeOutputs(cloud, outputs, folder='.'):
+    """
+    # Function: writeOutputs.
+    # Description: Writes a point cloud to some output files.
+    # Parameters: * PointCloud cloud = The point cloud.
+                  * List outputs = The paths of the output files (.pcd or .txt).
+                  * Str folder = The folder from which relative paths are taken.
+    """
+    for outputPath in outputs:
+        outputFunctions[os.path.splitext(outputPath)[1].lower()](cloud, os.path.join(folder, outputPath))
+
+def checkOutputs(outputs):
+    """
+    # Function: checkOutputs.
+    # Description: Raises a ValueError if the format of an output file is unknown.
+    # Parameters: * List outputs = The paths of the output files.
+    """
+    for outputPath in outputs:
+        if(os.path.splitext(outputPath)[1].lower() not in outputFunctions):
+            raise ValueError('unknown output format: ' + outputPath)
+
+def replay(modelPath, logPath, outputs, seed=None, workers=1):
+    """
+    # Function: replay.
+    # Description: Imports a model and applies the operations of a logbook to it.
+    # Parameters: * Str modelPath = The path of the IGES file.
+                  * Str logPath = The path of the logbook file.
+                  * List outputs = The paths of the output files (.pcd or .txt).
+                  * Int seed = The seed of the random deviations, or None.
+                  * Int workers = The number of processes used by automatic discretizations.
+    # Returns: * PointCloud cloud = The resulting point cloud.
+    """
+    checkOutputs(outputs)
+    operations = readLog(logPath)
+    cloud = replayLog(operations, loadEntityTable(modelPath), generator=numpy.random.default_rng(seed),
+                      workers=workers)
+    writeOutputs(cloud, outputs)
+    return cloud
+
+def main(argv=None):
+    """
+    # Function: main.
+    # Description: Parses the command line and runs the given job files or logbook. An invalid
+    job is reported and skipped, so the other jobs still run.
+    # Parameters: * List argv = The command line arguments, sys.argv[1:] by default.
+    # Returns: * Int = The exit status: 0 if all the jobs ran, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog='eggtol', description='Error Generator for Geometric Tolerancing.')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    runParser = commands.add_parser('run', help='run discretization and deviation jobs')
+    runParser.add_argument('jobs', nargs='+', help='job files (YAML or JSON)')
+    replayParser = commands.add_parser('replay', help='apply a logbook to a model')
+    replayParser.add_argument('model', help='IGES file')
+    replayParser.add_argument('logbook', help='logbook file saved by the Log menu')
+    replayParser.add_argument('-o', '--output', action='append', default=[], help='output file (.pcd or .txt)')
+    replayParser.add_argument('--seed', type=int, help='seed of the random deviations')
+    replayParser.add_argument('--workers', type=int, default=1, help='number of discretization processes')
+    arguments = parser.parse_args(argv)
+
+    if(arguments.command == 'replay'):
+        try:
+            cloud = replay(arguments.model, arguments.logbook, arguments.output, arguments.seed, arguments.workers)
+        except (OSError, ValueError) as error:
+            sys.stderr.write(arguments.logbook + ': error: ' + str(error) + '\n')
+            return 1
+        sys.stdout.write(arguments.logbook + ': ' + str(cloud.numPoints) + ' points in ' + str(len(cloud)) + ' faces\n')
+        return 0
+
+    status = 0
+    for jobPath in arguments.jobs:
+        try:
+            cloud = runJob(loadJob(jobPath), os.path.dirname(os.path.abspath(jobPath)))
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            sys.stderr.write(jobPath + ': error: ' + str(error) + '\n')
+            status = 1
+            continue
+        sys.stdout.write(jobPath + ': ' + str(cloud.numPoints) + ' points in ' + str(len(cloud)) + ' faces\n')
+    return status
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -34,6 +34,7 @@ from Interface.DefectsMenu import *
 from Interface.DiscretizeMenu import *
 from Interface.LoadingMenu import *
 from Actions.ActionList import *
+from Discretization.PointCloud import PointCloud
 
 # Defining the Main Window:
 class MainWindow(QMainWindow):
@@ -95,12 +96,8 @@ class MainWindow(QMainWindow):
         self.selectedShape = None
         self.selectedSequenceNumber = None
 
-        # Information about the loaded Cloud Points.
-        self.faceSequenceNumbers = []
-        self.faceNormalVectors = []
-        self.cloudPointsList = []
-        self.UVproperty = []
-        self.normVectorsToggle = []
+        # Information about the loaded Cloud Points, grouped by face.
+        self.cloudPoints = PointCloud()
 
         # Information about the face-normal Shape Vectors
         self.normalArrowsShapeList = []
@@ -113,6 +110,9 @@ class MainWindow(QMainWindow):
         # Information about the actions taken in the actual Session
         self.logbookList = []
 
+        # Number of processes used by the discretizations (1 discretizes in the main process):
+        self.discretizationWorkers = 1
+
         # Defining Actions.
         welcome = welcomeAction(self)
         entities = entitiesAction(self)
@@ -0,0 +1,9 @@
+"""
+# Module: conftest.py
+# Description: Makes the packages of the src folder importable by the tests.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
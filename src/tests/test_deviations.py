@@ -0,0 +1,182 @@
+"""
+# Module: test_deviations.py
+# Description: Checks the kernels of the Deviations module against the point by point loops
+of the Defects menus they replaced.
+"""
+
+import os
+import math
+import numpy
+import pytest
+
+from Import.IGESImport import loadEntityTable
+from Discretization.DiscretizeModel import discretizeModel
+from Discretization import Deviations
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'examples')
+
+@pytest.fixture(scope='module')
+def cylinder():
+    # The cylindrical face of the example, discretized over a 20 x 16 parametric grid:
+    objectList = loadEntityTable(os.path.join(examples, 'Cylinder.igs'))
+    cloud = discretizeModel(objectList, 10, 10, 20, 16, True, True)
+    index = [i for i in range(len(cloud)) if cloud.gridShapes[i] is not None][0]
+    return cloud.facePoints(index).copy(), cloud.faceNormals(index).copy(), cloud.gridShapes[index]
+
+def menuRotation(points, angles, center):
+    # RotationalDefectsMenu.rotatePoints:
+    angleX, angleY, angleZ = [(angle/180) * math.pi for angle in angles]
+    matrixX = numpy.array([[1, 0, 0], [0, math.cos(angleX), -math.sin(angleX)], [0, math.sin(angleX), math.cos(angleX)]])
+    matrixY = numpy.array([[math.cos(angleY), 0, math.sin(angleY)], [0, 1, 0], [-math.sin(angleY), 0, math.cos(angleY)]])
+    matrixZ = numpy.array([[math.cos(angleZ), -math.sin(angleZ), 0], [math.sin(angleZ), math.cos(angleZ), 0], [0, 0, 1]])
+    newPoints = []
+    for x0, y0, z0 in points.tolist():
+        point = numpy.array([[x0 - center[0]], [y0 - center[1]], [z0 - center[2]]])
+        point = numpy.dot(matrixZ, numpy.dot(matrixY, numpy.dot(matrixX, point)))
+        newPoints.append((point[0][0] + center[0], point[1][0] + center[1], point[2][0] + center[2]))
+    return numpy.array(newPoints)
+
+def menuFlexion(points, longAxis, perpAxis, minimum, maximum, maxDeflection):
+    # FlexionDefectsMenu.flexionPoints:
+    long, perp = 'xyz'.index(longAxis), 'xyz'.index(perpAxis)
+    delta = maximum[long] - minimum[long]
+    newPoints = []
+    for point in points.tolist():
+        q = -(384*maxDeflection)/(5*delta**4)
+        position = point[long] - minimum[long]
+        v = -(q/24)*position**4 + (q/12)*delta*position**3 - 0.0417*(delta**3)*q*position
+        point[perp] += v
+        newPoints.append(tuple(point))
+    return numpy.array(newPoints)
+
+def menuTorsion(points, longAxis, perpAxis, minimum, maximum, maxDeflection):
+    # TorsionDefectsMenu.torsionPoints and rotatePoints:
+    long = 'xyz'.index(longAxis)
+    delta = [maximum[n] - minimum[n] for n in range(3)]
+    center = [minimum[n] + delta[n]/2 for n in range(3)]
+    Li_max = (delta[long]/2)*10**(-3)
+    r = delta['xyz'.index(perpAxis)]/2
+    theta_max = math.atan(maxDeflection/r)
+    newPoints = []
+    for point in points.tolist():
+        L = (point[long] - center[long])*10**(-3)
+        angle = theta_max*L/Li_max
+        cos, sin = math.cos(angle), math.sin(angle)
+        if(longAxis == 'x'):
+            matrix = numpy.array([[1, 0, 0], [0, cos, -sin], [0, sin, cos]])
+        elif(longAxis == 'y'):
+            matrix = numpy.array([[cos, 0, sin], [0, 1, 0], [-sin, 0, cos]])
+        else:
+            matrix = numpy.array([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]])
+        moved = numpy.dot(matrix, numpy.array([[point[n] - center[n]] for n in range(3)]))
+        newPoints.append(tuple(moved[n][0] + center[n] for n in range(3)))
+    return numpy.array(newPoints)
+
+def menuPeriodic(points, normals, amp, freq, drillAxisLength):
+    # PeriodicDefectsMenu.periodicPoints:
+    newPoints = []
+    for i in range(len(points)):
+        offset = amp * math.sin((int(i/drillAxisLength)/freq)*2*math.pi)
+        newPoints.append(tuple(points[i][n] + normals[i][n] * offset for n in range(3)))
+    return numpy.array(newPoints)
+
+def menuOval(points, normals, maxDev, numPointsMainAxis):
+    # OvalDefectsMenu.ovalPoints:
+    freq = int((len(points)/(numPointsMainAxis))/2)
+    newPoints = []
+    for i in range(len(points)):
+        offset = maxDev * math.sin(int(i/numPointsMainAxis)/freq*2*math.pi)
+        newPoints.append(tuple(points[i][n] + normals[i][n] * offset for n in range(3)))
+    return numpy.array(newPoints)
+
+def menuTranslation(points, normals, direction, offset):
+    # TranslationDefectsMenu.translatePoints, along the normal vectors or a direction:
+    newPoints = []
+    for i in range(len(points)):
+        vector = normals[i] if direction is None else direction
+        newPoints.append(tuple(points[i][n] + float(vector[n]) * offset for n in range(3)))
+    return numpy.array(newPoints)
+
+def boundingBox(points):
+    return points.min(axis=0).tolist(), points.max(axis=0).tolist()
+
+def test_translation(cylinder):
+    points, normals, gridShape = cylinder
+    numpy.testing.assert_allclose(Deviations.translatePoints(points, (0.5, -1.0, 2.0), 0.3),
+                                  menuTranslation(points, normals, (0.5, -1.0, 2.0), 0.3), rtol=0, atol=1e-12)
+    numpy.testing.assert_allclose(Deviations.translatePoints(points, normals, 0.3),
+                                  menuTranslation(points, normals, None, 0.3), rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize('angles', [(30.0, 0.0, 0.0), (10.0, -20.0, 45.0), (0.0, 0.0, 180.0)])
+def test_rotation(cylinder, angles):
+    points, normals, gridShape = cylinder
+    minimum, maximum = boundingBox(points)
+    center = [(minimum[n] + maximum[n])/2 for n in range(3)]
+    numpy.testing.assert_allclose(Deviations.rotatePoints(points, center, *angles), menuRotation(points, angles, center),
+                                  rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize('longAxis, perpAxis', [('x', 'y'), ('y', 'z'), ('z', 'x'), ('z', 'y')])
+def test_flexion(cylinder, longAxis, perpAxis):
+    points, normals, gridShape = cylinder
+    minimum, maximum = boundingBox(points)
+    long = 'xyz'.index(longAxis)
+    result = Deviations.flexionPoints(points, longAxis, perpAxis, minimum[long], maximum[long] - minimum[long], 0.2)
+    numpy.testing.assert_allclose(result, menuFlexion(points, longAxis, perpAxis, minimum, maximum, 0.2),
+                                  rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize('longAxis, perpAxis', [('x', 'y'), ('y', 'x'), ('z', 'x'), ('z', 'y')])
+def test_torsion(cylinder, longAxis, perpAxis):
+    points, normals, gridShape = cylinder
+    minimum, maximum = boundingBox(points)
+    long, perp = 'xyz'.index(longAxis), 'xyz'.index(perpAxis)
+    center = [(minimum[n] + maximum[n])/2 for n in range(3)]
+    maxAngle = math.atan(0.1/((maximum[perp] - minimum[perp])/2))
+    result = Deviations.torsionPoints(points, center, longAxis, maxAngle, (maximum[long] - minimum[long])/2)
+    numpy.testing.assert_allclose(result, menuTorsion(points, longAxis, perpAxis, minimum, maximum, 0.1),
+                                  rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize('frequency, drillAxis', [(3.0, False), (2.5, True), (-4.0, False)])
+def test_periodic(cylinder, frequency, drillAxis):
+    points, normals, gridShape = cylinder
+    rowLength = 1 if drillAxis else gridShape[0]
+    numpy.testing.assert_allclose(Deviations.periodicPoints(points, normals, 0.05, frequency, rowLength),
+                                  menuPeriodic(points, normals, 0.05, frequency, rowLength), rtol=0, atol=1e-12)
+    with pytest.raises(ZeroDivisionError):
+        Deviations.periodicPoints(points, normals, 0.05, 0, rowLength)
+
+def test_oval(cylinder):
+    points, normals, gridShape = cylinder
+    numpy.testing.assert_allclose(Deviations.ovalPoints(points, normals, 0.1, gridShape[0]),
+                                  menuOval(points, normals, 0.1, gridShape[0]), rtol=0, atol=1e-12)
+
+def test_random_offsets_stay_in_their_range(cylinder):
+    # The menu used the random module, so only the range of the displacements can be compared:
+    points, normals, gridShape = cylinder
+    result = Deviations.randomPoints(points, 0.1, 0.2, numpy.random.default_rng(0))
+    displacement = numpy.linalg.norm(result - points, axis=1)
+    assert numpy.all(displacement >= 0.1 - 1e-12) and numpy.all(displacement <= 0.2 + 1e-12)
+
+def test_spindle(cylinder):
+    neurolab = pytest.importorskip('neurolab')
+    from Resources.NetworkRegistry import networkPath
+    points, normals, gridShape = cylinder
+    netFile = networkPath('trainedANN_SpindleDefects_v0.net')
+    plane, diameter, length = (0.0, 0.0, 1.0, 0.0), 10.0, 10.0
+
+    # SpindleDefectsMenu.spindleDefects, one network evaluation for each point:
+    ranges = Deviations.spindleRanges
+    mapping = Deviations.intervalMapping
+    network = neurolab.load(netFile)
+    inputs = [1, mapping(1.0, ranges[1][0], ranges[1][1], 0, 1), mapping(0.15, ranges[2][0], ranges[2][1], 0, 1),
+              mapping(1000.0, ranges[3][0], ranges[3][1], 0, 1), mapping(length/diameter, ranges[4][0], ranges[4][1], 0, 1)]
+    expected = []
+    for i in range(len(points)):
+        A, B, C, D = plane
+        dist = abs(A*points[i][0] + B*points[i][1] + C*points[i][2] - D)/((A**2 + B**2 + C**2)**.5)
+        output = network.sim([inputs + [mapping(dist/length, ranges[5][0], ranges[5][1], 0, 1)]])
+        offset = mapping(output, 0, 1, ranges[6][0], ranges[6][1])[0][0]
+        expected.append(tuple(points[i][n] + normals[i][n] * offset for n in range(3)))
+
+    result = Deviations.spindlePoints(points, normals, neurolab.load(netFile), 1, 1.0, 0.15, 1000.0, diameter, length,
+                                      plane, chunkSize=50)
+    numpy.testing.assert_allclose(result, numpy.array(expected), rtol=0, atol=1e-12)
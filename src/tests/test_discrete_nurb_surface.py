@@ -0,0 +1,76 @@
+"""
+# Module: test_discrete_nurb_surface.py
+# Description: Checks the batched evaluation of the DiscreteNurbSurface module against the
+scalar algorithms of The NURBS Book, evaluated one parameter at a time.
+"""
+
+import os
+import numpy
+import pytest
+
+from Import.IGESImport import loadEntityTable
+from Discretization.DiscreteNurbSurface import Surface
+from Discretization import Utilities as utils
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'examples')
+
+def rationalSurface(name, sequence):
+    objectList = loadEntityTable(os.path.join(examples, name))
+    return Surface.from_iges_entity(objectList[(sequence - 1)//2])
+
+def scalarPoint(surface, u, v):
+    # Algorithm A4.3 and the rational first derivatives (Eq. 4.20), for a single (u, v) parameter:
+    sizeU, sizeV = surface._mCtrlPts_sizeU, surface._mCtrlPts_sizeV
+    spanU = utils.find_span(surface._mDegreeU, tuple(surface._mKnotVectorU), sizeU, u)
+    spanV = utils.find_span(surface._mDegreeV, tuple(surface._mKnotVectorV), sizeV, v)
+    dersU = utils.basis_functions_ders(surface._mDegreeU, surface._mKnotVectorU, spanU, u, 1)
+    dersV = utils.basis_functions_ders(surface._mDegreeV, surface._mKnotVectorV, spanV, v, 1)
+    skl = [[[0.0]*4 for l in range(2)] for k in range(2)]
+    for k in range(2):
+        for l in range(2):
+            for s in range(surface._mDegreeV + 1):
+                for r in range(surface._mDegreeU + 1):
+                    cu = spanU - surface._mDegreeU + r
+                    cv = spanV - surface._mDegreeV + s
+                    weight = surface._mWeights[cu + cv*sizeU]
+                    point = surface._mCtrlPts2D[cu][cv]
+                    for c in range(3):
+                        skl[k][l][c] += dersU[k][r]*dersV[l][s]*point[c]*weight
+                    skl[k][l][3] += dersU[k][r]*dersV[l][s]*weight
+    point = numpy.array(skl[0][0][0:3])/skl[0][0][3]
+    derU = (numpy.array(skl[1][0][0:3]) - skl[1][0][3]*point)/skl[0][0][3]
+    derV = (numpy.array(skl[0][1][0:3]) - skl[0][1][3]*point)/skl[0][0][3]
+    return point, numpy.cross(derU, derV), derU, derV
+
+@pytest.mark.parametrize('name, sequence', [('Cylinder.igs', 23), ('Cone.igs', 21)])
+def test_grid_matches_scalar_evaluation(name, sequence):
+    surface = rationalSurface(name, sequence)
+    # The parameters include the knots (0.25, 0.5, 0.75) and the end points, where the last span is used:
+    paramsU = numpy.array([0.0, 0.1, 0.5, 0.9, 1.0])
+    paramsV = numpy.array([0.0, 0.25, 0.3, 0.5, 0.75, 0.99, 1.0])
+    points, normals, degenerate = surface.evaluate_rational_grid(paramsU, paramsV, normals=True)
+    numpy.testing.assert_array_equal(points, surface.evaluate_rational_grid(paramsU, paramsV))
+    for j, v in enumerate(paramsV.tolist()):
+        for i, u in enumerate(paramsU.tolist()):
+            row = j*len(paramsU) + i
+            point, normal, derU, derV = scalarPoint(surface, u, v)
+            numpy.testing.assert_allclose(points[row], point, rtol=0, atol=1e-12)
+            # The normal is undefined where a tangent vanishes, e.g. at the apex of the cone:
+            if(min(numpy.linalg.norm(derU), numpy.linalg.norm(derV)) > 1e-9):
+                assert not degenerate[row]
+                numpy.testing.assert_allclose(normals[row], normal/numpy.linalg.norm(normal), rtol=0, atol=1e-12)
+
+def test_evaluate_rational_matches_grid():
+    surface = rationalSurface('Cylinder.igs', 23)
+    surface.delta_u = 1/8
+    surface.delta_v = 1/12
+    points = surface.evaluate_rational()
+    assert surface.grid_shape == (7, 11)
+    paramsU = utils.sample_params(1/8, endpoints=False)
+    paramsV = utils.sample_params(1/12, endpoints=False)
+    for j, v in enumerate(paramsV.tolist()):
+        for i, u in enumerate(paramsU.tolist()):
+            point, normal, derU, derV = scalarPoint(surface, u, v)
+            numpy.testing.assert_allclose(points[j*7 + i], point, rtol=0, atol=1e-12)
+            numpy.testing.assert_allclose(surface.normal_direct[j*7 + i], normal/numpy.linalg.norm(normal),
+                                          rtol=0, atol=1e-12)
@@ -0,0 +1,90 @@
+"""
+# Module: test_discretize_model.py
+# Description: Checks the DiscretizeModel module against the point counts of the original
+fixed step loop sampling and the geometry of the example models.
+"""
+
+import os
+import numpy
+import pytest
+
+from Import.IGESImport import loadEntityTable
+from Discretization.DiscretizeModel import pos, discretizeModel, discretizeLoop, facePlane, chainEdges
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'examples')
+
+# The number of points of each face with the fixed step sampling of the loops (precision 10):
+baselineCounts = {
+    ('cube_cylinder.igs', True, 10): [0, 0, 81, 77, 49, 81, 81, 81],
+    ('cube_cylinder.igs', False, 1): [2, 2, 24, 25, 24, 16, 16, 16],
+    ('Nivelador_aba_dobrada_parte_1-v2.igs', True, 10): [81, 57, 81, 81, 55, 81, 81, 57, 81, 81, 81, 81, 81, 81, 81,
+                                                         76, 58, 58, 81, 81, 76, 81, 53, 81, 53, 81, 81, 81, 81, 56,
+                                                         81, 81, 81, 81],
+    ('Nivelador_aba_dobrada_parte_1-v2.igs', False, 1): [9, 6833, 8, 0, 6828, 0, 0, 6834, 1, 0, 0, 0, 0, 84, 24, 1561,
+                                                         1, 1, 23, 70, 1559, 2, 2, 2, 2, 6860, 0, 74, 17, 6831, 6833,
+                                                         65, 22, 0],
+    ('Cylinder.igs', True, 10): [73, 73],
+    ('Cylinder.igs', False, 1): [71, 71],
+}
+
+@pytest.mark.parametrize('name, grid, density', sorted(baselineCounts))
+def test_default_point_counts_match_fixed_sampling(name, grid, density):
+    objectList = loadEntityTable(os.path.join(examples, name))
+    cloud = discretizeModel(objectList, density, 10, None, None, False, grid)
+    counts = [len(cloud.facePoints(i)) for i in range(len(cloud))]
+    assert counts == baselineCounts[(name, grid, density)]
+
+@pytest.mark.parametrize('name', ['cube_cylinder.igs', 'Nivelador_aba_dobrada_parte_1-v2.igs'])
+def test_face_plane_contains_the_boundary(name):
+    objectList = loadEntityTable(os.path.join(examples, name))
+    for face in objectList:
+        if(face is None or face.entityType != 510):
+            continue
+        surface = objectList[pos(face.SURF)]
+        if(not (surface.K1 == 1 and surface.K2 == 1 and surface.M1 == 1 and surface.M2 == 1)):
+            continue
+        A, B, C, D = facePlane(face, int(face.seqNumber), objectList)
+        vertices = numpy.array(discretizeLoop(objectList[pos(face.LOOPList[0])], objectList, 10))
+        assert abs(numpy.linalg.norm((A, B, C)) - 1) < 1e-12
+        numpy.testing.assert_allclose(numpy.dot(vertices, (A, B, C)), D, rtol=0, atol=1e-9)
+
+def linearChain(edges):
+    # The original chaining, comparing every remaining edge with the last vertex:
+    edges = [list(edge) for edge in edges]
+    vertices = list(edges[0])
+    edges = edges[1:]
+    for n in range(len(edges)):
+        for j in range(len(edges)):
+            if(edges[j][0] == vertices[-1]):
+                vertices += edges[j][1:]
+                del edges[j]
+                break
+            elif(edges[j][-1] == vertices[-1]):
+                vertices += list(reversed(edges[j][:-1]))
+                del edges[j]
+                break
+    return vertices
+
+def test_chain_edges_matches_linear_chaining():
+    square = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+    edges = [[square[0], (0.5, -0.1, 0.0), square[1]], [square[3], square[2]],
+             [square[3], (-0.1, 0.5, 0.0), square[0]], [square[2], (1.1, 0.5, 0.0), square[1]]]
+    for tolerance in (0, 1e-6):
+        assert chainEdges(edges, tolerance) == linearChain(edges)
+    assert chainEdges(edges)[-1] == square[0]
+
+def test_chain_edges_joins_end_points_across_hash_cells():
+    # The end points differ by less than the tolerance, but are rounded to neighbouring cells:
+    tolerance = 1e-6
+    a = (0.49999e-6, 1.0, 2.0)
+    b = (0.50001e-6, 1.0, 2.0)
+    c = (1.0, -0.50001e-6, 2.0)
+    d = (1.0, -0.49999e-6, 2.0)
+    assert round(a[0]/tolerance) != round(b[0]/tolerance)
+    assert round(c[1]/tolerance) != round(d[1]/tolerance)
+    edges = [[(0.0, 0.0, 0.0), a], [(2.0, 0.0, 2.0), c], [b, (0.5, 0.5, 2.0), d]]
+    vertices = chainEdges(edges, tolerance)
+    assert vertices == [(0.0, 0.0, 0.0), a, (0.5, 0.5, 2.0), d, (2.0, 0.0, 2.0)]
+    # Farther than the tolerance, the edges are not joined:
+    assert chainEdges([[(0.0, 0.0, 0.0), a], [(a[0] + 2e-6, 1.0, 2.0), (3.0, 3.0, 3.0)]], tolerance) == \
+           [(0.0, 0.0, 0.0), a]
@@ -0,0 +1,65 @@
+"""
+# Module: test_iges_import.py
+# Description: Checks the tokenization and conversion of IGES parameters of the IGESImport module.
+"""
+
+import pytest
+
+from Import.IGESImport import convertData, getDelimiters, tokenizeParameters, convertNumericData, parseParameters
+
+def globalSection(text):
+    # The Global Section lines of a header text, in columns 1-72:
+    lines = [text[i:i + 72] for i in range(0, len(text), 72)]
+    return [line.ljust(72) + 'G' + str(i + 1).rjust(7) + '\n' for i, line in enumerate(lines)]
+
+def test_hollerith_constants_keep_their_delimiters():
+    tokens, hollerithIndexes = tokenizeParameters('406,3H1,2,4HAB;C, 5 ;junk')
+    assert tokens == ['406', '1,2', 'AB;C', '5']
+    assert hollerithIndexes == [1, 2]
+    assert parseParameters('406,3H1,2,4HAB;C, 5 ;junk') == [406, '1,2', 'AB;C', 5]
+
+def test_hollerith_constants_keep_their_blanks():
+    tokens, hollerithIndexes = tokenizeParameters('406, 5H A B ,1;')
+    assert tokens == ['406', ' A B ', '1']
+    assert hollerithIndexes == [1]
+
+def test_d_exponents():
+    assert parseParameters('110,1.0D-3,-2.5D2,1.E1,3;') == [110, 0.001, -250.0, 10.0, 3]
+    assert convertNumericData('1.0E-3,2') == [0.001, 2]
+
+def test_integers_and_reals_keep_their_types():
+    parameters = parseParameters('126,1,1.0,2.,-3;')
+    assert parameters == [126, 1, 1.0, 2.0, -3]
+    assert [type(value) for value in parameters] == [int, int, float, float, int]
+
+def test_empty_parameters():
+    assert tokenizeParameters('126,,1,;')[0] == ['126', '', '1', '']
+    assert parseParameters('126,,1,;') == [126, '', 1, '']
+    assert parseParameters('126,,3HA,B,;') == [126, '', 'A,B', '']
+    assert convertNumericData('1,,2') is None
+    assert convertNumericData(',1') is None
+    assert convertNumericData('') is None
+
+def test_non_numeric_parameters_fall_back_to_convert_data():
+    assert convertNumericData('1,X') is None
+    assert parseParameters('126,X1,2;') == [126, 'X1', 2]
+
+@pytest.mark.parametrize('record', ['126,1,2,1,0,1,0,0.,0.,0.,1.,1.,1.,0.5,1.0,0.,0.,0.;',
+                                    '128, 1, 1, 1, 1, 0, 0, 1, 0, 0, -1.0D0, 1.0D0;',
+                                    '502,2,1.,2.,3.,4.,5.,6.;'])
+def test_numeric_records_match_convert_data(record):
+    tokens = record.split(';')[0].replace(' ', '').split(',')
+    assert parseParameters(record) == [convertData(token) for token in tokens]
+
+def test_custom_delimiters_of_the_global_section():
+    parameterDelimiter, recordDelimiter = getDelimiters(globalSection('1H//1H:/7Hexample/'))
+    assert (parameterDelimiter, recordDelimiter) == ('/', ':')
+    record = '126/1/1.0D-3//4Ha/b:/3:junk'
+    assert tokenizeParameters(record, parameterDelimiter, recordDelimiter) == (['126', '1', '1.0D-3', '', 'a/b:', '3'], [4])
+    assert parseParameters(record, parameterDelimiter, recordDelimiter) == [126, 1, 0.001, '', 'a/b:', 3]
+    assert parseParameters('126/1,5/2:', parameterDelimiter, recordDelimiter) == [126, '1,5', 2]
+
+def test_default_delimiters_of_the_global_section():
+    assert getDelimiters(globalSection(',,7Hexample,')) == (',', ';')
+    assert getDelimiters(globalSection('1H///7Hexample/')) == ('/', ';')
+    assert getDelimiters(globalSection('  1H,,  1H;,7Hexample,')) == (',', ';')
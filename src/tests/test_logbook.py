@@ -0,0 +1,122 @@
+"""
+# Module: test_logbook.py
+# Description: Checks that the Logbook module reads the entries written by the menus, with the
+exact logText formats of each menu, and replays them as the operations they describe.
+"""
+
+import os
+import numpy
+import pytest
+
+from Import.IGESImport import loadEntityTable
+from Discretization.Logbook import splitLog, parseLog, replayLog
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'examples')
+
+# The logText of each menu, as built by the menus for the given values:
+def automaticEntry(discrMode, density, precision, Uparam, Vparam):
+    return '> [Discretization] Automatic:\n\tMode: '+discrMode+'\n\tN Value: '+str(density)+'\n\tPrecision: '+str(precision)+'\n\tU Value: '+str(Uparam)+'\n\tV Value: '+str(Vparam)+'\n\n'
+
+def flatEntry(selectedEntityList, discrMode, density, precision):
+    return '> [Discretization] Flat:\n\tEntity list: '+str(selectedEntityList)+'\n\tMode: '+discrMode+'\n\tN Value: '+str(density)+'\n\tPrecision: '+str(precision)+'\n\n'
+
+def parametricEntry(selectedEntityList, Uparam, Vparam):
+    return '> [Discretization] Parametric:\n\tEntity list: '+str(selectedEntityList)+'\n\tU Value: '+str(Uparam)+'\n\tV Value: '+str(Vparam)+'\n\n'
+
+def translationEntry(selectedEntityList, xDirection, yDirection, zDirection, offset):
+    return '> [Deviation] Translational:\n\tEntity list: '+str(selectedEntityList)+'\n\tX Value: '+xDirection+'\n\tY Value: '+yDirection+'\n\tZ Value: '+zDirection+'\n\tOffset: '+str(offset)+' mm\n\n'
+
+def rotationEntry(selectedEntityList, xAngle, yAngle, zAngle):
+    return '> [Deviation] Rotation:\n\tEntity list: '+str(selectedEntityList)+'\n\tX Value: '+str(xAngle)+'°\n\tY Value: '+str(yAngle)+'°\n\tZ Value: '+str(zAngle)+'°\n\n'
+
+def randomEntry(selectedEntityList, minOffset, maxOffset):
+    return '> [Deviation] Random:\n\tEntity list: '+str(selectedEntityList)+'\n\tMin. Offset: '+str(minOffset)+' mm\n\tMax. Offset: '+str(maxOffset)+' mm\n\n'
+
+def flexionEntry(selectedEntityList, long_axis, perp_axis, max_def):
+    return '> [Deviation] Flexion:\n\tEntity List: '+str(selectedEntityList)+'\n\tLong. axis: '+long_axis+'\n\tNorm. axis: '+perp_axis+'\n\tMax. deflection: '+str(max_def)+' mm\n\n'
+
+def torsionEntry(selectedEntityList, long_axis, perp_axis, max_def):
+    return '> [Deviation] Torsion:\n\tEntity list: '+str(selectedEntityList)+'\n\tLong. axis: '+long_axis+'\n\tPerp. axis: '+perp_axis+'\n\tMax. deflection: '+str(max_def)+' mm\n\n'
+
+def periodicEntry(selectedEntityList, drillAxis, amp, freq):
+    return '> [Deviation] Periodic Pattern:\n\tEntity list: '+str(selectedEntityList)+'\n\tAlong drill axis: '+str(drillAxis)+'\n\tAmplitude: '+str(amp)+' mm\n\tFrequency: '+str(freq)+'\n\n'
+
+def ovalEntry(selectedEntityList, maxDev):
+    return '> [Deviation] Ovalization:\n\tEntity list: '+str(selectedEntityList)+'\n\tMax. Offset: '+str(maxDev)+' mm\n\n'
+
+def spindleEntry(selectedEntityList, tool, depth, feed, spindle, seqFixNumber):
+    return '> [Deviation] Spindle:\n\tEntity List: '+str(selectedEntityList)+'\n\tTool condition: '+tool+'\n\tDepth of cut: '+str(depth)+'\n\tFeed rate: '+str(feed)+'\n\tSpindle speed: '+str(spindle)+'\n\tFixture entity: '+str(seqFixNumber)+'\n\n'
+
+# The logbook of a session on the cube_cylinder example (entities 3 and 5 are the cylinder):
+menuLog = [
+    (parametricEntry([3, 5], 20, 16),
+     {'type': 'parametric', 'entities': [3, 5], 'uParameter': 20, 'vParameter': 16}),
+    (flatEntry([4, 6, 7], 'N x N', 10.0, 10.0),
+     {'type': 'flat', 'entities': [4, 6, 7], 'grid': True, 'density': 10.0, 'precision': 10.0}),
+    (flatEntry([8], 'N points/mm', 0.5, 20.0),
+     {'type': 'flat', 'entities': [8], 'grid': False, 'density': 0.5, 'precision': 20.0}),
+    (translationEntry([4], '0.0', '0.0', '1.0', 0.25),
+     {'type': 'translation', 'entities': [4], 'direction': [0.0, 0.0, 1.0], 'offset': 0.25}),
+    (translationEntry([6, 7], 'Multiple Values', 'Multiple Values', 'Multiple Values', -0.1),
+     {'type': 'translation', 'entities': [6, 7], 'direction': 'normal', 'offset': -0.1}),
+    (rotationEntry([4, 6], 1.5, -2.0, 30.0),
+     {'type': 'rotation', 'entities': [4, 6], 'angles': [1.5, -2.0, 30.0]}),
+    (randomEntry([7], 0.01, 0.02),
+     {'type': 'random', 'entities': [7], 'minOffset': 0.01, 'maxOffset': 0.02}),
+    (flexionEntry([4, 6], 'x', 'z', 0.2),
+     {'type': 'flexion', 'entities': [4, 6], 'longAxis': 'x', 'perpAxis': 'z', 'maxDeflection': 0.2}),
+    (torsionEntry([3, 5], 'z', 'x', 0.1),
+     {'type': 'torsion', 'entities': [3, 5], 'longAxis': 'z', 'perpAxis': 'x', 'maxDeflection': 0.1}),
+    (periodicEntry([3], True, 0.05, 4.0),
+     {'type': 'periodic', 'entities': [3], 'drillAxis': True, 'amplitude': 0.05, 'frequency': 4.0}),
+    (periodicEntry([5], False, 0.05, 2.5),
+     {'type': 'periodic', 'entities': [5], 'drillAxis': False, 'amplitude': 0.05, 'frequency': 2.5}),
+    (ovalEntry([3, 5], 0.1),
+     {'type': 'oval', 'entities': [3, 5], 'maxDeviation': 0.1}),
+]
+
+spindleLog = (spindleEntry([3, 5], 'Worn', 1.0, 0.15, 1000, 4.0),
+              {'type': 'spindle', 'entities': [3, 5], 'toolCondition': 'Worn', 'depth': 1.0, 'feed': 0.15,
+               'spindle': 1000.0, 'fixture': 4})
+
+def test_menu_entries_are_parsed():
+    text = ''.join(entry for entry, operation in menuLog + [spindleLog])
+    assert splitLog(text) == [entry for entry, operation in menuLog + [spindleLog]]
+    assert parseLog(text) == [operation for entry, operation in menuLog + [spindleLog]]
+
+def test_automatic_entries_are_parsed():
+    assert parseLog(automaticEntry('N x N', 10.0, 10.0, None, None)) == \
+           [{'type': 'automatic', 'grid': True, 'density': 10.0, 'precision': 10.0, 'uParameter': None,
+             'vParameter': None}]
+    assert parseLog(automaticEntry('N points/mm', 1.0, 10.0, 20, 30)) == \
+           [{'type': 'automatic', 'grid': False, 'density': 1.0, 'precision': 10.0, 'uParameter': 20,
+             'vParameter': 30}]
+
+def replayedPoints(operations):
+    objectList = loadEntityTable(os.path.join(examples, 'cube_cylinder.igs'))
+    cloud = replayLog(operations, objectList, generator=numpy.random.default_rng(0))
+    return cloud.sequenceNumbers, cloud.gridShapes, cloud.points
+
+@pytest.mark.parametrize('withSpindle', [False, True])
+def test_menu_log_replays_as_its_operations(withSpindle):
+    entries = menuLog + [spindleLog] if withSpindle else menuLog
+    if(withSpindle):
+        pytest.importorskip('neurolab')
+    sequenceNumbers, gridShapes, points = replayedPoints(parseLog(''.join(entry for entry, operation in entries)))
+    expectedSequences, expectedShapes, expectedPoints = replayedPoints([operation for entry, operation in entries])
+    assert sequenceNumbers == expectedSequences == [5, 9, 7, 11, 13, 15]
+    assert gridShapes == expectedShapes
+    numpy.testing.assert_array_equal(points, expectedPoints)
+
+def test_invalid_entries():
+    with pytest.raises(ValueError):
+        parseLog('\tEntity list: [3]\n' + ovalEntry([3], 0.1))
+    with pytest.raises(ValueError):
+        parseLog('> [Deviation] Unknown:\n\tEntity list: [3]\n\n')
+    with pytest.raises(ValueError):
+        parseLog(ovalEntry([3], 0.1).replace('Max. Offset', 'Offset'))
+    with pytest.raises(ValueError):
+        parseLog(translationEntry([4], '0.0', 'y', '1.0', 0.25))
+    objectList = loadEntityTable(os.path.join(examples, 'cube_cylinder.igs'))
+    with pytest.raises(ValueError):
+        replayLog(parseLog(ovalEntry([3], 0.1)), objectList)
@@ -0,0 +1,81 @@
+"""
+# Module: test_network_registry.py
+# Description: Checks the networks of the NetworkRegistry module against neurolab.
+"""
+
+import os
+import sys
+import shutil
+import numpy
+import pytest
+
+neurolab = pytest.importorskip('neurolab')
+
+import Resources.NetworkRegistry as registry
+from Resources.NetworkRegistry import networkPath, extractNetwork, readNetwork
+
+netFile = networkPath('trainedANN_SpindleDefects_v0.net')
+npzFile = networkPath('trainedANN_SpindleDefects_v0.npz')
+
+def randomInputs(rows=500, seed=0):
+    return numpy.random.default_rng(seed).random((rows, 6))
+
+def test_extracted_network_matches_neurolab():
+    inputs = randomInputs()
+    expected = neurolab.load(netFile).sim(inputs)
+    result = extractNetwork(neurolab.load(netFile)).sim(inputs)
+    numpy.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+def test_compiled_network_matches_neurolab():
+    inputs = randomInputs(seed=1)
+    expected = neurolab.load(netFile).sim(inputs)
+    network = readNetwork(npzFile)
+    numpy.testing.assert_allclose(network.predict(inputs), expected, rtol=0, atol=1e-12)
+
+    # predict starts from the saved outputs every time, unlike sim:
+    numpy.testing.assert_allclose(network.predict(inputs), expected, rtol=0, atol=1e-12)
+
+def test_compiled_network_matches_fresh_extraction():
+    compiled = readNetwork(npzFile)
+    extracted = extractNetwork(neurolab.load(netFile))
+    assert compiled.transfers == extracted.transfers
+    assert compiled.connect == extracted.connect
+    for name in ('weights', 'biases', 'initialOutputs'):
+        assert len(getattr(compiled, name)) == len(getattr(extracted, name))
+        for compiledArray, extractedArray in zip(getattr(compiled, name), getattr(extracted, name)):
+            numpy.testing.assert_array_equal(compiledArray, extractedArray)
+
+def compiledCopy(tmp_path, sourceHash):
+    # A neurolab file and a compiled file with other weights, stored with the given hash:
+    shutil.copy(netFile, str(tmp_path / 'network.net'))
+    compiled = readNetwork(npzFile)
+    compiled.weights[0] = compiled.weights[0] + 1
+    registry.saveNetwork(compiled, str(tmp_path / 'network.npz'), sourceHash)
+    return compiled
+
+def loadCopy(tmp_path, monkeypatch):
+    monkeypatch.setattr(registry, 'networksFolder', str(tmp_path))
+    monkeypatch.setattr(registry, 'loadedNetworks', {})
+    return registry.loadNetwork('network.net')
+
+def test_committed_compiled_network_matches_its_source():
+    assert registry.compiledHash(npzFile) == registry.fileHash(netFile)
+
+def test_stale_compiled_network_is_not_loaded(tmp_path, monkeypatch):
+    compiledCopy(tmp_path, 'another hash')
+    network = loadCopy(tmp_path, monkeypatch)
+    numpy.testing.assert_array_equal(network.weights[0], extractNetwork(neurolab.load(netFile)).weights[0])
+
+def test_matching_compiled_network_is_loaded_whatever_its_time(tmp_path, monkeypatch):
+    compiled = compiledCopy(tmp_path, registry.fileHash(netFile))
+    modified = os.path.getmtime(str(tmp_path / 'network.net'))
+    os.utime(str(tmp_path / 'network.npz'), (modified - 10, modified - 10))
+    network = loadCopy(tmp_path, monkeypatch)
+    numpy.testing.assert_array_equal(network.weights[0], compiled.weights[0])
+
+def test_stale_compiled_network_is_loaded_with_a_warning_without_neurolab(tmp_path, monkeypatch):
+    compiled = compiledCopy(tmp_path, 'another hash')
+    monkeypatch.setitem(sys.modules, 'neurolab', None)
+    with pytest.warns(UserWarning):
+        network = loadCopy(tmp_path, monkeypatch)
+    numpy.testing.assert_array_equal(network.weights[0], compiled.weights[0])
@@ -0,0 +1,87 @@
+"""
+# Module: test_pipeline.py
+# Description: Checks the operations of the Pipeline module against the menus.
+"""
+
+import os
+import numpy
+import pytest
+
+from Import.IGESImport import loadEntityTable
+from Discretization.DiscretizeModel import pos, discretizeModel, faceBoundingBox
+from Discretization.Deviations import translatePoints, flexionPoints
+from Discretization.Pipeline import applyDeviation, geometryBoundingBox
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'examples')
+
+def cylinderCloud():
+    objectList = loadEntityTable(os.path.join(examples, 'Cylinder.igs'))
+    return objectList, discretizeModel(objectList, 10, 10, 20, 20, True, True)
+
+def test_translation_is_not_normalized():
+    objectList, cloud = cylinderCloud()
+    expected = [translatePoints(cloud.facePoints(i), [0, 0, 2], 0.5) for i in range(len(cloud))]
+    applyDeviation(cloud, objectList, {'type': 'translation', 'direction': [0, 0, 2], 'offset': 0.5})
+    for i in range(len(cloud)):
+        numpy.testing.assert_array_equal(cloud.facePoints(i), expected[i])
+
+def test_translation_normalize_option():
+    objectList, cloud = cylinderCloud()
+    expected = [translatePoints(cloud.facePoints(i), [0, 0, 1], 0.5) for i in range(len(cloud))]
+    applyDeviation(cloud, objectList, {'type': 'translation', 'direction': [0, 0, 2], 'offset': 0.5,
+                                       'normalize': True})
+    for i in range(len(cloud)):
+        numpy.testing.assert_allclose(cloud.facePoints(i), expected[i], rtol=0, atol=1e-12)
+    with pytest.raises(ValueError):
+        applyDeviation(cloud, objectList, {'type': 'translation', 'direction': [0, 0, 0], 'offset': 0.5,
+                                           'normalize': True})
+
+def loopVertices(objectList, face):
+    # The start and end vertices of the edges of the outer loop of a face, read from the IGES entities:
+    loop = objectList[pos(face.LOOPList[0])]
+    vertices = []
+    for i in range(int(loop.N)):
+        edges = objectList[pos(int(loop.EDGEList[i]))]
+        index = int(loop.NDXList[i]) - 1
+        for vertexList, vertexIndex in ((edges.SVPList[index], edges.SVList[index]),
+                                        (edges.TVPList[index], edges.TVList[index])):
+            vertex = objectList[pos(int(vertexList))]
+            n = int(vertexIndex) - 1
+            vertices.append((vertex.XList[n], vertex.YList[n], vertex.ZList[n]))
+    return numpy.array(vertices)
+
+def test_default_box_of_straight_planar_faces_is_the_box_of_their_vertices():
+    # The OpenCASCADE box used by the menus is the box of the vertices of these faces:
+    objectList = loadEntityTable(os.path.join(examples, 'cube_cylinder.igs'))
+    cloud = discretizeModel(objectList, 10, 10, None, None, False, True)
+    entities = [9, 10, 11, 12]
+    vertices = numpy.concatenate([loopVertices(objectList, objectList[entity - 1]) for entity in entities])
+    start = vertices.min(axis=0)[0]
+    length = vertices.max(axis=0)[0] - start
+    indexes = [cloud.faceIndex(2*entity - 1) for entity in entities]
+    expected = [flexionPoints(cloud.facePoints(i), 'x', 'z', start, length, 0.2) for i in indexes]
+    for entity in entities:
+        sequence = 2*entity - 1
+        minimum, maximum = faceBoundingBox(objectList[pos(sequence)], sequence, objectList)
+        faceVertices = loopVertices(objectList, objectList[pos(sequence)])
+        numpy.testing.assert_array_equal(minimum, faceVertices.min(axis=0))
+        numpy.testing.assert_array_equal(maximum, faceVertices.max(axis=0))
+    applyDeviation(cloud, objectList, {'type': 'flexion', 'entities': entities, 'longAxis': 'x', 'perpAxis': 'z',
+                                       'maxDeflection': 0.2})
+    for i, points in zip(indexes, expected):
+        numpy.testing.assert_array_equal(cloud.facePoints(i), points)
+
+def test_default_box_of_curved_faces_covers_the_surface():
+    objectList, cloud = cylinderCloud()
+    minimum, maximum = geometryBoundingBox(objectList)(cloud, list(range(len(cloud))))
+    numpy.testing.assert_allclose(minimum, [-5, -5, 0], rtol=0, atol=1e-9)
+    numpy.testing.assert_allclose(maximum, [5, 5, 10], rtol=0, atol=1e-9)
+
+def test_rounded_deviations_default_to_the_parametric_faces():
+    objectList = loadEntityTable(os.path.join(examples, 'cube_cylinder.igs'))
+    cloud = discretizeModel(objectList, 10, 10, 20, 20, True, True)
+    before = cloud.copy()
+    applyDeviation(cloud, objectList, {'type': 'oval', 'maxDeviation': 0.1})
+    for i in range(len(cloud)):
+        changed = not numpy.array_equal(cloud.facePoints(i), before.facePoints(i))
+        assert changed == (cloud.gridShapes[i] is not None)
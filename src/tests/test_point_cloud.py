@@ -0,0 +1,96 @@
+"""
+# Module: test_point_cloud.py
+# Description: Checks the PointCloud class against a list of faces, through a random sequence
+of additions, removals, copies and extensions.
+"""
+
+import numpy
+import pytest
+
+from Discretization.PointCloud import PointCloud
+
+def randomFace(generator, sequenceNumber):
+    # A face of random size, sometimes with a grid shape, as a list [sequence, points, normals, grid, reversed]:
+    size = int(generator.choice([0, 1, 5, 40, 700]))
+    gridShape = (size, 1) if size and generator.random() < 0.5 else None
+    return [sequenceNumber, generator.random((size, 3)), generator.random((size, 3)), gridShape, bool(generator.random() < 0.3)]
+
+def checkCloud(cloud, faces):
+    assert len(cloud) == len(faces)
+    sizes = [len(face[1]) for face in faces]
+    assert cloud.offsets.tolist() == numpy.concatenate(([0], numpy.cumsum(sizes, dtype=int))).tolist()
+    assert cloud.numPoints == sum(sizes)
+    assert cloud.sequenceNumbers == [face[0] for face in faces]
+    assert cloud.gridShapes == [face[3] for face in faces]
+    assert cloud.reversedNormals == [face[4] for face in faces]
+    for i, face in enumerate(faces):
+        numpy.testing.assert_array_equal(cloud.facePoints(i), face[1].reshape(-1, 3))
+        numpy.testing.assert_array_equal(cloud.faceNormals(i), face[2].reshape(-1, 3))
+    if(faces):
+        numpy.testing.assert_array_equal(cloud.points, numpy.concatenate([face[1].reshape(-1, 3) for face in faces]))
+        numpy.testing.assert_array_equal(cloud.normals, numpy.concatenate([face[2].reshape(-1, 3) for face in faces]))
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_operations_match_a_list_of_faces(seed):
+    generator = numpy.random.default_rng(seed)
+    cloud = PointCloud()
+    faces = []
+    for step in range(120):
+        operation = generator.choice(['add', 'add', 'removeFace', 'removePoint', 'extend', 'copy', 'reverse'])
+        if(operation == 'add'):
+            face = randomFace(generator, 2*step + 1)
+            cloud.addFace(*face)
+            faces.append(face)
+        elif(operation == 'removeFace' and faces):
+            i = int(generator.integers(len(faces)))
+            cloud.removeFace(i)
+            del faces[i]
+        elif(operation == 'removePoint' and any(len(face[1]) for face in faces)):
+            i = int(generator.choice([i for i, face in enumerate(faces) if len(face[1])]))
+            j = int(generator.integers(len(faces[i][1])))
+            cloud.removePoint(i, j)
+            faces[i][1] = numpy.delete(faces[i][1], j, axis=0)
+            faces[i][2] = numpy.delete(faces[i][2], j, axis=0)
+            faces[i][3] = None
+        elif(operation == 'extend'):
+            other = PointCloud()
+            newFaces = [randomFace(generator, 2*step + 1) for n in range(int(generator.integers(3)))]
+            for face in newFaces:
+                other.addFace(*face)
+            cloud.extend(other)
+            faces += newFaces
+        elif(operation == 'copy'):
+            # The copy is independent of the original cloud, which is checked below:
+            copy = cloud.copy()
+            checkCloud(copy, faces)
+            copy.points[:] = -1.0
+            copy.addFace(0, [(0.0, 0.0, 0.0)], [(0.0, 0.0, 1.0)])
+            if(generator.random() < 0.5):
+                cloud = cloud.copy()
+        elif(operation == 'reverse' and faces):
+            i = int(generator.integers(len(faces)))
+            cloud.reverseNormals(i)
+            faces[i][2] = -faces[i][2]
+            faces[i][4] = not faces[i][4]
+        checkCloud(cloud, faces)
+
+def test_reserve_keeps_the_points_when_growing():
+    cloud = PointCloud()
+    points = numpy.arange(3*3000, dtype=float).reshape(-1, 3)
+    for n in range(3000):
+        cloud.addFace(2*n + 1, points[n:n + 1], -points[n:n + 1])
+    assert len(cloud._points) >= 3000 and len(cloud._offsets) >= 3001
+    numpy.testing.assert_array_equal(cloud.points, points)
+    numpy.testing.assert_array_equal(cloud.normals, -points)
+    assert cloud.offsets.tolist() == list(range(3001))
+    assert cloud.faceIndex(5999) == 2999 and cloud.faceIndex(2) == len(cloud)
+
+def test_invalid_indexes():
+    cloud = PointCloud()
+    cloud.addFace(1, [(0.0, 0.0, 0.0)], [(0.0, 0.0, 1.0)])
+    with pytest.raises(IndexError):
+        cloud.facePoints(1)
+    with pytest.raises(IndexError):
+        cloud.removePoint(0, 1)
+    with pytest.raises(ValueError):
+        cloud.addFace(3, [(0.0, 0.0, 0.0)], [])
@@ -0,0 +1,63 @@
+"""
+# Module: test_point_in_polygon.py
+# Description: Checks the scanline filling of the PointInPolygon module against pointInPolygon,
+evaluated for every grid point.
+"""
+
+import os
+import numpy
+import pytest
+
+from Import.IGESImport import loadEntityTable
+from Discretization.PointInPolygon import pointInPolygon, gridPointsInFace
+from Discretization.DiscretizeModel import pos, discretizeLoop, planeBasis, changeBasis
+
+examples = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'examples')
+
+def bruteForce(xValues, yValues, outerPoly, innerPolys):
+    # Every grid point tested against the outer boundary and each hole, ordered by column and row:
+    columns, rows = [], []
+    for column, x in enumerate(xValues.tolist()):
+        for row, y in enumerate(yValues.tolist()):
+            if(pointInPolygon(x, y, outerPoly) and not any(pointInPolygon(x, y, poly) for poly in innerPolys)):
+                columns.append(column)
+                rows.append(row)
+    return columns, rows
+
+def checkGrid(xValues, yValues, outerPoly, innerPolys):
+    columns, rows = gridPointsInFace(xValues, yValues, outerPoly, innerPolys)
+    expectedColumns, expectedRows = bruteForce(xValues, yValues, outerPoly, innerPolys)
+    assert columns.tolist() == expectedColumns
+    assert rows.tolist() == expectedRows
+    return len(columns)
+
+def test_square_with_a_hole_on_the_grid_lines():
+    # The vertices lie on grid rows and columns, where the edge rules of the crossings matter:
+    outerPoly = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+    innerPolys = [[(1.0, 1.0), (1.0, 3.0), (3.0, 3.0), (3.0, 1.0)]]
+    values = numpy.linspace(-0.5, 4.5, 21)
+    assert checkGrid(values, values, outerPoly, innerPolys) > 0
+
+def test_concave_face_with_two_holes():
+    outerPoly = [(0.0, 0.0), (6.0, 0.0), (6.0, 5.0), (3.0, 2.0), (0.0, 5.0)]
+    innerPolys = [[(0.5, 0.5), (2.0, 0.5), (1.0, 2.0)], [(4.0, 0.5), (5.5, 0.5), (5.5, 2.5), (4.5, 1.0)]]
+    xValues = numpy.linspace(-0.25, 6.25, 53)
+    yValues = numpy.linspace(-0.3, 5.3, 57)
+    assert checkGrid(xValues, yValues, outerPoly, innerPolys) > 0
+
+@pytest.mark.parametrize('name, sequence', [('BoredCube.igs', 21), ('BoredCube.igs', 23),
+                                            ('cube_cylinder.igs', 7), ('cube_cylinder.igs', 11)])
+def test_faces_with_holes(name, sequence):
+    objectList = loadEntityTable(os.path.join(examples, name))
+    face = objectList[pos(sequence)]
+    assert len(face.LOOPList) > 1
+    vertices = discretizeLoop(objectList[pos(face.LOOPList[0])], objectList, 20)
+    newBasisVector = planeBasis(vertices)
+    outerPoly = [tuple(vertex) for vertex in changeBasis(vertices, newBasisVector).tolist()]
+    innerPolys = [[tuple(vertex) for vertex in changeBasis(discretizeLoop(objectList[pos(loop)], objectList, 20),
+                                                           newBasisVector).tolist()] for loop in face.LOOPList[1:]]
+    minimum = numpy.min(outerPoly, axis=0)
+    maximum = numpy.max(outerPoly, axis=0)
+    xValues = numpy.linspace(minimum[0], maximum[0], 61)
+    yValues = numpy.linspace(minimum[1], maximum[1], 59)
+    assert checkGrid(xValues, yValues, outerPoly, innerPolys) > 0